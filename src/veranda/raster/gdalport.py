@@ -39,6 +39,30 @@ GDAL_RESAMPLE_TYPE = {"nearest": gdal.GRA_NearestNeighbour,
                       }
 
 
+def configure_gdal(cache_max=1 << 30, n_threads='ALL_CPUS', vsi_cache_size=256 << 20):
+    """
+    Sets performance-related GDAL configuration options once for the whole process, so that they do not need to be
+    passed to or resolved for each dataset. Note that these settings are global, i.e. they affect every other
+    library using GDAL in the same process. They are applied at import if the environment variable
+    "VERANDA_GDAL_AUTOCONFIG" is set to "1".
+
+    Parameters
+    ----------
+    cache_max : int, optional
+        Size of GDAL's raster block cache in bytes. Defaults to 1 GiB.
+    n_threads : int or str, optional
+        Number of threads GDAL may use for (de-)compression and warping. Defaults to 'ALL_CPUS'.
+    vsi_cache_size : int, optional
+        Size of the cache for GDAL's virtual file systems in bytes. Defaults to 256 MiB.
+
+    """
+    gdal.SetCacheMax(cache_max)
+    gdal.SetConfigOption('GDAL_NUM_THREADS', str(n_threads))
+    gdal.SetConfigOption('GDAL_DISABLE_READDIR_ON_OPEN', 'EMPTY_DIR')
+    gdal.SetConfigOption('VSI_CACHE', 'TRUE')
+    gdal.SetConfigOption('VSI_CACHE_SIZE', str(vsi_cache_size))
+
+
 def dtype_np2gdal(np_dtype) -> object:
     """
     Get GDAL data type from a NumPy-style data type.
@@ -114,27 +138,26 @@ def convert_gdal_options_to_command_list(options) -> list:
     Returns
     -------
     cmd_options : list of str
-        Command line options for a GDAL utility given as a list of strings.
+        Command line options for a GDAL utility given as a list of separate arguments, i.e. without any shell
+        quoting.
 
     """
-    # define specific options, which need to be quoted
-    _opt_2b_in_quote = ["-mo", "-co"]
-
     cmd_options = []
     for k, v in options.items():
+        cmd_options.append(k)
+        if v is None:  # flag without a value
+            continue
         is_iterable = isinstance(v, (tuple, list))
-        if k in _opt_2b_in_quote:
-            if (k == "-mo" or k == "-co") and is_iterable:
-                for i in range(len(v)):
-                    cmd_options.append(" ".join((k, string2cli_arg(v[i]))))
-            else:
-                cmd_options.append(" ".join((k, string2cli_arg(v))))
+        if k in ["-mo", "-co"] and is_iterable:
+            # each metadata/creation option needs its own switch
+            for i in range(len(v)):
+                if i > 0:
+                    cmd_options.append(k)
+                cmd_options.append(str(v[i]))
+        elif is_iterable:
+            cmd_options.extend(map(str, v))
         else:
-            cmd_options.append(k)
-            if is_iterable:
-                cmd_options.append(' '.join(map(str, v)))
-            else:
-                cmd_options.append(str(v))
+            cmd_options.append(str(v))
 
     return cmd_options
 
@@ -179,23 +202,22 @@ def call_gdal_util(util_name, src_files, dst_file=None, options=None, gdal_path=
 
     gdal_path = try_get_gdal_installation_path(gdal_path)
 
-    # prepare the command string
+    # prepare the argument list, which is passed to the utility directly without invoking a shell
     cmd = []
     gdal_cmd = os.path.join(gdal_path, util_name) if gdal_path else util_name
-    cmd.append(string2cli_arg(gdal_cmd))
+    cmd.append(gdal_cmd)
     cmd.extend(convert_gdal_options_to_command_list(options))
 
-    # add source files and destination file (in double quotation)
+    # add source files and destination file
     if isinstance(src_files, (tuple, list)):
-        src_files_str = " ".join(src_files)
+        cmd.extend(map(os.fspath, src_files))
     else:
-        src_files_str = string2cli_arg(src_files)
-    cmd.append(src_files_str)
+        cmd.append(os.fspath(src_files))
     if dst_file is not None:
-        cmd.append(string2cli_arg(dst_file))
+        cmd.append(os.fspath(dst_file))
 
-    output = subprocess.check_output(" ".join(cmd), shell=True, cwd=gdal_path)
-    successful = _analyse_gdal_output(str(output))
+    output = subprocess.check_output(cmd, cwd=gdal_path)
+    successful = _analyse_gdal_output(output)
 
     return successful, output
 
@@ -220,7 +242,7 @@ def _analyse_gdal_output(output) -> bool:
 
     Parameters
     ----------
-    output : str
+    output : bytes or str
         Console output.
 
     Returns
@@ -229,15 +251,9 @@ def _analyse_gdal_output(output) -> bool:
         True if the process completed success, else False.
 
     """
-    # return false if "Error" is found.
-    if 'error' in output.lower():
-        return False
-    # return true if "100%" is found.
-    elif '100 - done' in output.lower():
-        return True
-    # otherwise return false.
-    else:
-        return False
+    output = output.lower() if isinstance(output, bytes) else output.lower().encode()
+    # the process was successful if no "error" is reported and "100 - done" is found
+    return b'error' not in output and b'100 - done' in output
 
 
 def _add_scale_option(options, stretch=None, src_nodata=None) -> dict:
@@ -264,7 +280,7 @@ def _add_scale_option(options, stretch=None, src_nodata=None) -> dict:
     stretch = stretch or (None, None)
     min_stretch, max_stretch = stretch
 
-    options["-scale"] = ' '
+    options["-scale"] = None
     if (min_stretch is not None) and (max_stretch is not None):
         options['-scale'] = (min_stretch, max_stretch, 0, 255)
         # stretching should be done differently if nodata value exist.
@@ -309,24 +325,22 @@ def gen_qlook(src_file, dst_file=None, src_nodata=None, stretch=None, resize_fac
     output_format : str
         Output format of the quick-look. At the moment, 'GTiff' (default) and 'JPEG' are supported.
     gdal_path : str, optional
-        The path where your GDAL utilities are installed. By default, this function tries to look up this path in the
-        environment variable "GDAL_UTIL_HOME". If this variable is not set, then `gdal_path` must be provided as a
-        key-word argument.
+        The path where your GDAL utilities are installed. If it is given or set in the environment variable
+        "GDAL_UTIL_HOME", the "gdal_translate" command line utility of this installation is called in a subprocess.
+        Otherwise, the translation runs in-process via `gdal.Translate`.
 
     Returns
     -------
     successful : bool
         True if process was successful.
     output : str
-        Console output.
+        Console output (empty if the translation runs in-process).
 
     """
     output_format = output_format.lower()
     f_ext = {'gtiff': 'tif',
              'jpeg': 'jpeg'}
 
-    gdal_path = try_get_gdal_installation_path(gdal_path)
-
     # check if destination file name is given. if not use the source directory
     if dst_file is None:
         dst_file = os.path.join(os.path.dirname(src_file),
@@ -335,19 +349,30 @@ def gen_qlook(src_file, dst_file=None, src_nodata=None, stretch=None, resize_fac
 
     # prepare options for gdal_transalte
     options_dict = {'gtiff': {'-of': 'GTiff', '-co': 'COMPRESS=LZW',
-                              '-mo': ['parent_data_file="%s"' % os.path.basename(src_file)], '-outsize': resize_factor,
+                              '-mo': ['parent_data_file=%s' % os.path.basename(src_file)], '-outsize': resize_factor,
                               '-ot': 'Byte'},
                     'jpeg':  {'-of': 'jpeg', '-co': 'QUALITY=95',
-                              '-mo': ['parent_data_file="%s"' % os.path.basename(src_file)], '-outsize': resize_factor}}
+                              '-mo': ['parent_data_file=%s' % os.path.basename(src_file)], '-outsize': resize_factor}}
 
     options = options_dict[output_format]
     if scale:
         options = _add_scale_option(options, stretch=stretch, src_nodata=src_nodata)
 
+    try:
+        gdal_path = try_get_gdal_installation_path(gdal_path)
+    except OSError:  # no GDAL utilities are configured, so the in-process translation is used
+        gdal_path = None
+
     # call gdal_translate to resize input file
-    successful, output = call_gdal_util('gdal_translate', src_files=src_file,
-                                     dst_file=dst_file, gdal_path=gdal_path,
-                                     options=options)
+    if gdal_path is not None:
+        successful, output = call_gdal_util('gdal_translate', src_files=src_file,
+                                         dst_file=dst_file, gdal_path=gdal_path,
+                                         options=options)
+    else:
+        # the in-process translation avoids spawning a process and registering all GDAL drivers again
+        ds = gdal.Translate(dst_file, src_file, options=convert_gdal_options_to_command_list(options))
+        successful, output = ds is not None, ''
+        ds = None
 
     if (output_format == 'gtiff') and (ct is not None):
         # Update quick look image, attach color table this does not so easily
@@ -360,5 +385,9 @@ def gen_qlook(src_file, dst_file=None, src_nodata=None, stretch=None, resize_fac
     return successful, output
 
 
+if os.environ.get("VERANDA_GDAL_AUTOCONFIG") == "1":
+    configure_gdal()
+
+
 if __name__ == '__main__':
     pass
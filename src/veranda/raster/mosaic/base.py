@@ -10,15 +10,211 @@ import xarray as xr
 import pandas as pd
 import numpy as np
 from affine import Affine
-from typing import List, Tuple, Sequence
-
+from osgeo import ogr
+from osgeo import osr
+from functools import lru_cache
+from functools import partial
+from multiprocessing.pool import ThreadPool
+from typing import List, Tuple, Sequence, Iterator
+
+from geospade import DECIMALS
 from geospade.tools import any_geom2ogr_geom
 from geospade.tools import rel_extent
 from geospade.crs import SpatialRef
 from geospade.raster import RasterGeometry
 from geospade.raster import MosaicGeometry
 from geospade.raster import Tile
-from geospade.raster import find_congruent_tile_id_from_tiles
+
+
+@lru_cache(maxsize=32)
+def _get_transformer(src_sref_wkt, dst_sref_wkt) -> osr.CoordinateTransformation:
+    """
+    Creates a coordinate transformation between two CRSs. The transformation is cached, so that repeated coordinate
+    queries with the same CRS pair do not need to set up a new PROJ pipeline.
+
+    Parameters
+    ----------
+    src_sref_wkt : str
+        CRS of the source coordinates in WKT format.
+    dst_sref_wkt : str
+        CRS of the target coordinates in WKT format.
+
+    Returns
+    -------
+    osr.CoordinateTransformation :
+        Coordinate transformation from the source to the target CRS.
+
+    """
+    return osr.CoordinateTransformation(SpatialRef(src_sref_wkt).osr_sref, SpatialRef(dst_sref_wkt).osr_sref)
+
+
+@lru_cache(maxsize=256)
+def _cached_geom2ogr_geom(geom_key, sref_wkt=None) -> ogr.Geometry:
+    """
+    Creates an OGR geometry from a hashable geometry representation. The result is cached, so that geometries being
+    used repeatedly (e.g. the same area of interest for many reads) are only parsed once.
+
+    Parameters
+    ----------
+    geom_key : tuple or bytes
+        Geometry given as a (nested) tuple of coordinates or in WKB format.
+    sref_wkt : str, optional
+        CRS of the geometry in WKT format.
+
+    Returns
+    -------
+    ogr.Geometry :
+        Vector geometry as an OGR Geometry object including its spatial reference.
+
+    """
+    sref = SpatialRef(sref_wkt) if sref_wkt is not None else None
+    geom = ogr.CreateGeometryFromWkb(geom_key) if isinstance(geom_key, bytes) else geom_key
+    return any_geom2ogr_geom(geom, sref=sref)
+
+
+def _geom2ogr_geom(geom, sref=None) -> ogr.Geometry:
+    """
+    Converts any geometry representation supported by `geospade.tools.any_geom2ogr_geom` into an OGR geometry, while
+    reusing already parsed geometries.
+
+    Parameters
+    ----------
+    geom : ogr.Geometry or shapely.geometry or list or tuple
+        A vector geometry.
+    sref : geospade.crs.SpatialRef, optional
+        Spatial reference system applied to the given geometry if it has none.
+
+    Returns
+    -------
+    ogr.Geometry :
+        Vector geometry as an OGR Geometry object including its spatial reference.
+
+    """
+    if isinstance(geom, (list, tuple)):
+        geom_key = tuple(tuple(elem) if isinstance(elem, (list, tuple)) else elem for elem in geom)
+    elif hasattr(geom, 'wkb'):  # shapely geometry
+        geom_key = geom.wkb
+    else:
+        return any_geom2ogr_geom(geom, sref=sref)
+
+    sref_wkt = sref.wkt if sref is not None else None
+    # cached geometries are cloned, since OGR geometries are mutable
+    return _cached_geom2ogr_geom(geom_key, sref_wkt).Clone()
+
+
+def _clip_px_window(row, col, height, width, n_rows, n_cols) -> Tuple[int, int, int, int]:
+    """
+    Clips a pixel window to the extent of a raster with the given shape.
+
+    Parameters
+    ----------
+    row : int
+        Top-left row number of the pixel window anchor.
+    col : int
+        Top-left column number of the pixel window anchor.
+    height : int
+        Number of rows/height of the pixel window.
+    width : int
+        Number of columns/width of the pixel window.
+    n_rows : int
+        Number of rows of the raster.
+    n_cols : int
+        Number of columns of the raster.
+
+    Returns
+    -------
+    row, col, height, width : int
+        Pixel window within the raster. Height and width are 0 if the window does not intersect with the raster.
+
+    """
+    min_row, min_col = max(row, 0), max(col, 0)
+    max_row, max_col = min(row + height, n_rows), min(col + width, n_cols)
+    return min_row, min_col, max(max_row - min_row, 0), max(max_col - min_col, 0)
+
+
+def _generate_px_windows(n_rows, n_cols, window_size, overlap=0) -> Iterator[Tuple[int, int, int, int]]:
+    """
+    Generates a regular grid of (overlapping) pixel windows covering a raster with the given shape.
+
+    Parameters
+    ----------
+    n_rows : int
+        Number of rows of the raster.
+    n_cols : int
+        Number of columns of the raster.
+    window_size : 2-tuple of int
+        Number of rows and columns of one pixel window.
+    overlap : int, optional
+        Number of pixels each window is extended by at all sides. Defaults to 0.
+
+    Returns
+    -------
+    row, col, height, width : int
+        Pixel window clipped to the extent of the raster.
+
+    """
+    win_rows, win_cols = window_size
+    if win_rows <= 0 or win_cols <= 0:
+        err_msg = f"Window size must be positive, but is {window_size}."
+        raise ValueError(err_msg)
+    for row in range(0, n_rows, win_rows):
+        for col in range(0, n_cols, win_cols):
+            yield _clip_px_window(row - overlap, col - overlap, win_rows + 2 * overlap, win_cols + 2 * overlap,
+                                  n_rows, n_cols)
+
+
+def _xy_within_tiles(x, y, tiles) -> bool:
+    """
+    Checks with a simple bounding box test if the given coordinates lie within the outer extent of at least one tile.
+
+    Parameters
+    ----------
+    x : number
+        Coordinate in X direction.
+    y : number
+        Coordinate in Y direction.
+    tiles : list of geospade.raster.Tile
+        Tiles to test the coordinates against (need to share the CRS of the coordinates).
+
+    Returns
+    -------
+    bool :
+        True if the coordinates lie within the extent of one of the tiles, false if not.
+
+    """
+    for tile in tiles:
+        min_x, min_y, max_x, max_y = tile.outer_boundary_extent
+        if (min_x <= x <= max_x) and (min_y <= y <= max_y):
+            return True
+    return False
+
+
+def _read_file_header(filepath, file_class, file_class_kwargs) -> Tuple[str, tuple, int, int]:
+    """
+    Reads the spatial header information of a file.
+
+    Parameters
+    ----------
+    filepath : str
+        Full system path to the file.
+    file_class : class
+        Class constructor for a file class.
+    file_class_kwargs : dict
+        Keyword arguments for calling `file_class`.
+
+    Returns
+    -------
+    sref_wkt : str
+        Spatial reference of the file as a WKT string.
+    geotrans : tuple
+        Geotransformation parameters of the file.
+    n_rows, n_cols : int
+        Number of rows and columns of the file.
+
+    """
+    with file_class(filepath, 'r', **file_class_kwargs) as f:
+        n_rows, n_cols = f.raster_shape
+        return f.sref_wkt, tuple(f.geotrans), n_rows, n_cols
 
 
 class RasterAccess:
@@ -52,25 +248,30 @@ class RasterAccess:
                                                         src_raster_geom.y_pixel_size)
         self.dst_window = (min_row, min_col, max_row, max_col)
 
+        self._src_row_slice = slice(self.src_window[0], self.src_window[2] + 1)
+        self._src_col_slice = slice(self.src_window[1], self.src_window[3] + 1)
+        self._dst_row_slice = slice(self.dst_window[0], self.dst_window[2] + 1)
+        self._dst_col_slice = slice(self.dst_window[1], self.dst_window[3] + 1)
+
     @property
     def src_row_slice(self) -> slice:
         """ Indices for the rows of the data to access. """
-        return slice(self.src_window[0], self.src_window[2] + 1)
+        return self._src_row_slice
 
     @property
     def src_col_slice(self) -> slice:
         """ Indices for the columns of the data to access. """
-        return slice(self.src_window[1], self.src_window[3] + 1)
+        return self._src_col_slice
 
     @property
     def dst_row_slice(self) -> slice:
         """ Indices for the rows of the data to assign. """
-        return slice(self.dst_window[0], self.dst_window[2] + 1)
+        return self._dst_row_slice
 
     @property
     def dst_col_slice(self) -> slice:
         """ Indices for the cols of the data to assign. """
-        return slice(self.dst_window[1], self.dst_window[3] + 1)
+        return self._dst_col_slice
 
 
 class RasterData(metaclass=abc.ABCMeta):
@@ -122,9 +323,11 @@ class RasterData(metaclass=abc.ABCMeta):
         self._file_dim = stack_dimension
         self._tile_dim = tile_dimension
         self._file_coords = [self._file_dim] if stack_coords is None else stack_coords
+        self._layer_ids_cache = None
+        self._data_view_cache = None
 
         if 'file_id' not in self._file_register.columns:
-            self._file_register['file_id'] = [None] * len(self._file_register)
+            self._file_register['file_id'] = None  # broadcast a scalar instead of building a list per entry
 
     @property
     def mosaic(self) -> MosaicGeometry:
@@ -139,7 +342,10 @@ class RasterData(metaclass=abc.ABCMeta):
     @property
     def layer_ids(self) -> list:
         """ List : Sorted layers. """
-        return list(sorted(self._file_register[self._file_dim].unique()))
+        # the layers only change if a new file register is assigned, so they are cached along with the file register
+        if self._layer_ids_cache is None or self._layer_ids_cache[0] is not self._file_register:
+            self._layer_ids_cache = (self._file_register, list(sorted(self._file_register[self._file_dim].unique())))
+        return self._layer_ids_cache[1]
 
     @property
     def n_layers(self) -> int:
@@ -165,7 +371,18 @@ class RasterData(metaclass=abc.ABCMeta):
     @property
     def data_view(self) -> xr.Dataset:
         """ View on internal raster data. """
-        return self._view_data()
+        # the view only changes if the data, its geometry/extent or the file register change, so it is cached along
+        # with them to avoid repeated subsetting when accessing the property several times
+        data_extent = None if self._data_geom is None else self._data_geom.coord_extent
+        view_key = (self._data, self._data_geom, self._file_register)
+        if self._data_view_cache is not None:
+            cached_view_key, cached_data_extent, data_view = self._data_view_cache
+            if all(obj is cached_obj for obj, cached_obj in zip(view_key, cached_view_key)) and \
+                    data_extent == cached_data_extent:
+                return data_view
+        data_view = self._view_data()
+        self._data_view_cache = (view_key, data_extent, data_view)
+        return data_view
 
     @abc.abstractmethod
     def load(self, *args, **kwargs):
@@ -207,8 +424,10 @@ class RasterData(metaclass=abc.ABCMeta):
 
         """
         sdims = RasterData._sdims_from_data(data)
-        y_pixel_size = data[sdims[0]].data[0] - data[sdims[0]].data[1]
-        x_pixel_size = data[sdims[1]].data[1] - data[sdims[1]].data[0]
+        # access the coordinate variables directly, which avoids constructing a data array per access
+        y_coords, x_coords = data.variables[sdims[0]].values, data.variables[sdims[1]].values
+        y_pixel_size = y_coords[0] - y_coords[1]
+        x_pixel_size = x_coords[1] - x_coords[0]
 
         return x_pixel_size, y_pixel_size
 
@@ -230,9 +449,9 @@ class RasterData(metaclass=abc.ABCMeta):
         """
         sdims = RasterData._sdims_from_data(data)
         x_pixel_size, y_pixel_size = RasterData._pixel_sizes_from_data(data)
+        y_coords, x_coords = data.variables[sdims[0]].values, data.variables[sdims[1]].values
 
-        return data[sdims[1]].data[0], data[sdims[0]].data[-1] - y_pixel_size, \
-               data[sdims[1]].data[-1] + x_pixel_size, data[sdims[0]].data[0]
+        return x_coords[0], y_coords[-1] - y_pixel_size, x_coords[-1] + x_pixel_size, y_coords[0]
 
     @staticmethod
     def raster_geom_from_data(data, sref=None, **kwargs) -> RasterGeometry:
@@ -254,18 +473,17 @@ class RasterData(metaclass=abc.ABCMeta):
             Raster geometry representing the spatial extent of the xarray dataset.
 
         """
-        coord_names = list(data.coords.keys())
-        sref_coord = None
-        for coord_name in coord_names:
-            if data[coord_name].attrs.get('spatial_ref'):
-                sref_coord = data[coord_name]
+        sref_wkt = None
+        for coord_name in data.coords:
+            sref_wkt = data.variables[coord_name].attrs.get('spatial_ref')
+            if sref_wkt:
                 break
 
-        if sref_coord is None and sref is None:
+        if not sref_wkt and sref is None:
             err_msg = "Neither the data contains CRS information nor the keyword."
             raise ValueError(err_msg)
-        if sref_coord is not None:
-            sref = SpatialRef(sref_coord.attrs.get('spatial_ref'))
+        if sref_wkt:
+            sref = SpatialRef(sref_wkt)
 
         x_pixel_size, y_pixel_size = RasterData._pixel_sizes_from_data(data)
         extent = RasterData._extent_from_data(data)
@@ -293,6 +511,7 @@ class RasterData(metaclass=abc.ABCMeta):
                 dar = self._data[dvar]
                 nodataval = dar.attrs.get('_FillValue', nodatavals.get(dvar, 0))
                 self._data[dvar] = dar.where(dar != nodataval)
+            self._data_view_cache = None  # the data has been modified in place
 
     def select(self, cmds, inplace=False) -> "RasterData":
         """
@@ -302,7 +521,7 @@ class RasterData(metaclass=abc.ABCMeta):
         ----------
         cmds : list of 3-tuple
             List of tuples containing the select operator to execute, its positional arguments, and its key-word
-            arguments.
+            arguments. The key-word arguments are taken by value, i.e. they are not modified.
         inplace : bool, optional
             If True, the current raster data object is modified.
             If False, a new raster data instance will be returned (default).
@@ -314,13 +533,13 @@ class RasterData(metaclass=abc.ABCMeta):
 
         """
         if not inplace:
-            new_raster_data = copy.deepcopy(self)
+            new_raster_data = self._copy_for_selection()
             return new_raster_data.select(cmds, inplace=True)
 
         for cmd in cmds:
             fun_name = cmd[0]
             args = cmd[1]
-            kwargs = cmd[2]
+            kwargs = dict(cmd[2])  # copy to not alter the commands of the caller
 
             sref = kwargs.get('sref')
             if sref is not None:
@@ -350,7 +569,7 @@ class RasterData(metaclass=abc.ABCMeta):
 
         """
         if not inplace:
-            new_raster_data = copy.deepcopy(self)
+            new_raster_data = self._copy_for_selection()
             return new_raster_data.select_tiles(tile_names, inplace=True)
 
         self._file_register = self._file_register.loc[self._file_register[self._tile_dim].isin(tile_names)]
@@ -377,12 +596,15 @@ class RasterData(metaclass=abc.ABCMeta):
 
         """
         if not inplace:
-            new_raster_data = copy.deepcopy(self)
+            new_raster_data = self._copy_for_selection()
             return new_raster_data.select_layers(layer_ids, inplace=True)
 
-        layer_ids_close = set(self._file_register[self._file_dim]) - set(layer_ids)
-        self.close(layer_ids=layer_ids_close)
-        self._file_register = self._file_register[self._file_register[self._file_dim].isin(layer_ids)]
+        # evaluate the membership of all entries at once and reuse it for closing and selecting files
+        is_selected = self._file_register[self._file_dim].isin(layer_ids).to_numpy()
+        layer_ids_close = self._file_register.loc[~is_selected, self._file_dim].unique()
+        if len(layer_ids_close) > 0:
+            self.close(layer_ids=layer_ids_close)
+        self._file_register = self._file_register[is_selected]
 
         return self
 
@@ -417,23 +639,71 @@ class RasterData(metaclass=abc.ABCMeta):
 
         """
         if not inplace:
-            new_raster_data = copy.deepcopy(self)
+            new_raster_data = self._copy_for_selection()
             return new_raster_data.select_px_window(row, col, height=height, width=width, inplace=True)
 
         if self._data_geom is not None:
-            self._data_geom.slice_by_rc(row, col, height=height, width=width, inplace=True, name='0')
-            if self._data_geom is None:
+            n_rows, n_cols = self._data_geom.n_rows, self._data_geom.n_cols
+            px_window = _clip_px_window(row, col, height, width, n_rows, n_cols)
+            if px_window[2] == 0 or px_window[3] == 0:
+                self._data_geom = None
                 wrn_msg = "Pixels are outside the extent of the raster mosaic."
                 warnings.warn(wrn_msg)
+            elif px_window != (0, 0, n_rows, n_cols):  # a window covering the full extent does not change the data
+                self._data_geom.slice_by_rc(*px_window, inplace=True, name='0')
 
         if len(self._mosaic.tiles) == 1:
             tile_oi = self._mosaic.tiles[0]
-            tile_oi.slice_by_rc(row, col, height=height, width=width, inplace=True, name='0')
+            px_window = _clip_px_window(row, col, height, width, tile_oi.n_rows, tile_oi.n_cols)
+            if px_window[2] == 0 or px_window[3] == 0:
+                wrn_msg = "Pixels are outside the extent of the raster mosaic files."
+                warnings.warn(wrn_msg)
+                return self
+            if px_window != (0, 0, tile_oi.n_rows, tile_oi.n_cols):
+                tile_oi.slice_by_rc(*px_window, inplace=True, name='0')
             tile_oi.active = True
             self._mosaic = self._mosaic.from_tile_list([tile_oi])
 
         return self
 
+    def iter_px_windows(self, window_size, overlap=0) -> Iterator[Tuple[Tuple[int, int, int, int], "RasterData"]]:
+        """
+        Iterates over the raster data in (overlapping) pixel windows, e.g. to process large rasters piece by piece
+        without loading them at once.
+
+        Parameters
+        ----------
+        window_size : int or 2-tuple of int
+            Number of rows and columns of one pixel window. It is recommended to choose a multiple of the block size
+            of the files to avoid reading the same blocks multiple times.
+        overlap : int, optional
+            Number of pixels each window is extended by at all sides. Defaults to 0.
+
+        Returns
+        -------
+        px_window : 4-tuple of int
+            Pixel window (row, col, height, width) relative to the current data or tile.
+        raster_data : RasterData
+            New raster data object only representing the pixel window. Data will only be read from disk when
+            loading/reading the returned object.
+
+        Notes
+        -----
+        As for `select_px_window`, the iteration requires either loaded data or a mosaic consisting of one tile.
+
+        """
+        if self._data_geom is not None:
+            ref_geom = self._data_geom
+        elif len(self._mosaic.tiles) == 1:
+            ref_geom = self._mosaic.tiles[0]
+        else:
+            err_msg = "Pixel windows are ambiguous for a mosaic with multiple tiles and no loaded data."
+            raise ValueError(err_msg)
+
+        window_size = (window_size, window_size) if isinstance(window_size, int) else tuple(window_size)
+        for px_window in _generate_px_windows(ref_geom.n_rows, ref_geom.n_cols, window_size, overlap=overlap):
+            yield px_window, self.select_px_window(*px_window, inplace=False)
+
     def select_xy(self, x, y, sref=None, inplace=False) -> "RasterData":
         """
         Selects a pixel according to the given coordinate tuple.
@@ -458,19 +728,21 @@ class RasterData(metaclass=abc.ABCMeta):
 
         """
         if not inplace:
-            new_raster_data = copy.deepcopy(self)
+            new_raster_data = self._copy_for_selection()
             return new_raster_data.select_xy(x, y, sref=sref, inplace=True)
 
+        x, y = self._transform_xy(x, y, sref=sref)
         if self._data_geom is not None:
-            row, col = self._data_geom.xy2rc(x, y, sref=sref)
+            row, col = self._data_geom.xy2rc(x, y)
             self._data_geom.slice_by_rc(row, col, inplace=True, name='0')
             if self._data_geom is None:
                 wrn_msg = "Coordinates are outside the spatial extent of the raster mosaic."
                 warnings.warn(wrn_msg)
 
-        tile_oi = self._mosaic.xy2tile(x, y, sref=sref)
+        # reject coordinates outside the mosaic with a plain bounding box test before creating OGR geometries
+        tile_oi = self._mosaic.xy2tile(x, y) if _xy_within_tiles(x, y, self._mosaic.all_tiles) else None
         if tile_oi is not None:
-            row, col = tile_oi.xy2rc(x, y, sref=sref)
+            row, col = tile_oi.xy2rc(x, y)
             tile_oi.slice_by_rc(row, col, inplace=True, name='0')
             tile_oi.active = True
             self._mosaic = self._mosaic.from_tile_list([tile_oi])
@@ -503,7 +775,7 @@ class RasterData(metaclass=abc.ABCMeta):
 
         """
         if not inplace:
-            new_raster_data = copy.deepcopy(self)
+            new_raster_data = self._copy_for_selection()
             return new_raster_data.select_bbox(bbox, sref=sref, inplace=True)
         return self.select_polygon(bbox, apply_mask=False, inplace=inplace)
 
@@ -531,11 +803,11 @@ class RasterData(metaclass=abc.ABCMeta):
 
         """
         if not inplace:
-            new_raster_data = copy.deepcopy(self)
+            new_raster_data = self._copy_for_selection()
             return new_raster_data.select_polygon(polygon, sref=sref, apply_mask=apply_mask, inplace=True)
 
         sref = sref or self.mosaic.sref
-        polygon = any_geom2ogr_geom(polygon, sref=sref)
+        polygon = _geom2ogr_geom(polygon, sref=sref)
 
         if self._data_geom is not None:
             self._data_geom.slice_by_geom(polygon, inplace=True, name='0')
@@ -556,22 +828,86 @@ class RasterData(metaclass=abc.ABCMeta):
 
         return self
 
+    def xy2rc(self, x, y, sref=None) -> Tuple[int or np.ndarray, int or np.ndarray]:
+        """
+        Converts world system coordinates to pixel indices of the loaded data. Arrays of coordinates are converted in
+        one go, i.e. with a single CRS transformation and vectorised pixel arithmetic.
+
+        Parameters
+        ----------
+        x : number or np.ndarray
+            Coordinate(s) in X direction.
+        y : number or np.ndarray
+            Coordinate(s) in Y direction.
+        sref : geospade.crs.SpatialRef, optional
+            CRS of the given coordinates. Defaults to the CRS of the mosaic.
+
+        Returns
+        -------
+        row, col : int or np.ndarray
+            Pixel row and column number(s) with respect to the loaded data.
+
+        """
+        if self._data_geom is None:
+            err_msg = "No data has been loaded yet."
+            raise ValueError(err_msg)
+
+        x, y = self._transform_xy(x, y, sref=sref)
+        return self._data_geom.xy2rc(x, y)
+
+    def _transform_xy(self, x, y, sref=None) -> Tuple[float or np.ndarray, float or np.ndarray]:
+        """
+        Transforms world system coordinates to the CRS of the mosaic.
+
+        Parameters
+        ----------
+        x : number or np.ndarray
+            Coordinate(s) in X direction.
+        y : number or np.ndarray
+            Coordinate(s) in Y direction.
+        sref : geospade.crs.SpatialRef, optional
+            CRS of the given coordinates. Defaults to None, i.e. the coordinates are already given in the CRS of the
+            mosaic.
+
+        Returns
+        -------
+        x, y : number or np.ndarray
+            Coordinate(s) in X and Y direction given in the CRS of the mosaic.
+
+        """
+        if sref is None:
+            return x, y
+
+        ct = _get_transformer(sref.wkt, self._mosaic.sref.wkt)
+        if np.ndim(x) == 0:
+            x, y, _ = ct.TransformPoint(x, y)
+        else:
+            points = np.array(ct.TransformPoints(list(zip(np.ravel(x), np.ravel(y)))))
+            x, y = points[:, 0].reshape(np.shape(x)), points[:, 1].reshape(np.shape(y))
+
+        return x, y
+
     def _view_data(self) -> xr.Dataset:
         """ Returns a subset of the data according to the intersected mosaic and current layer ID's. """
         data = self._data
         if data is not None:
-            origin = (self._data_geom.parent_root.ul_x, self._data_geom.parent_root.ul_y)
-            min_col, min_row, max_col, max_row = rel_extent(origin, self._data_geom.coord_extent,
-                                                            x_pixel_size=self._data_geom.x_pixel_size,
-                                                            y_pixel_size=self._data_geom.y_pixel_size)
-
-            xrars = dict()
-            for dvar in data.data_vars:
-                xrars[dvar] = data[dvar][..., min_row: max_row + 1, min_col:max_col + 1]
-            data = xr.Dataset(xrars)
+            # the data geometry only has a parent if a spatial selection was applied after the data has been loaded
+            if self._data_geom.parent is not None:
+                parent_root = self._data_geom.parent_root
+                origin = (parent_root.ul_x, parent_root.ul_y)
+                min_col, min_row, max_col, max_row = rel_extent(origin, self._data_geom.coord_extent,
+                                                                x_pixel_size=self._data_geom.x_pixel_size,
+                                                                y_pixel_size=self._data_geom.y_pixel_size)
+
+                # select the spatial subset of all data variables at once instead of rebuilding the dataset per variable
+                ref_dvar = next(iter(data.data_vars))
+                y_dim, x_dim = data[ref_dvar].dims[-2:]
+                data = data.isel({y_dim: slice(min_row, max_row + 1), x_dim: slice(min_col, max_col + 1)})
 
             if self._file_dim in data.coords:
-                data = data.sel({self._file_dim: list(np.unique(self._file_register[self._file_dim]))})
+                layer_ids = self.layer_ids
+                if not np.array_equal(layer_ids, data[self._file_dim].values):
+                    data = data.sel({self._file_dim: layer_ids})
 
         return data
 
@@ -596,7 +932,7 @@ class RasterData(metaclass=abc.ABCMeta):
             bool_idxs = self._file_register[self._file_dim].isin(layer_ids)
             file_ids = set(self._file_register.loc[bool_idxs, 'file_id'])
             self._file_register.loc[bool_idxs, 'file_id'] = None
-            file_ids = list(set(self._files.keys()) - file_ids)
+            file_ids = list(set(self._files.keys()) & file_ids)
         else:
             self._file_register['file_id'] = None
             file_ids = list(self._files.keys())
@@ -648,12 +984,30 @@ class RasterData(metaclass=abc.ABCMeta):
         for k, v in self.__dict__.items():
             if k == '_files':  # skip existing file pointers, can't be copied
                 setattr(result, k, dict())
+            elif k == '_data_view_cache':  # the view refers to the original dataset, so it is recreated on demand
+                setattr(result, k, None)
             else:
                 setattr(result, k, copy.deepcopy(v, memo))
 
         result._file_register['file_id'] = None  # remove existing file IDs
         return result
 
+    def _copy_for_selection(self) -> "RasterData":
+        """
+        Copies the raster data object like `copy.deepcopy`, but shares the arrays of the internal xarray dataset with
+        the copy. The selection methods only replace or view these arrays, so they do not need to be duplicated for
+        every selection. Use `copy.deepcopy` on the selection to obtain independent arrays.
+
+        Returns
+        -------
+        RasterData
+            Copy of raster data sharing the arrays of its internal dataset.
+
+        """
+        # the deepcopy of the dataset is replaced by a new dataset object backed by the same arrays
+        memo = dict() if self._data is None else {id(self._data): self._data.copy(deep=False)}
+        return copy.deepcopy(self, memo)
+
     def _repr_html_(self) -> str:
         """ HTML table representation of the file register of a raster data instance.  """
         return self.file_register.style.set_properties(subset=['filepath'], **{'text-align': 'right'})._repr_html_()
@@ -740,6 +1094,7 @@ class RasterDataReader(RasterData):
 
         """
         if self._data is not None and self._data_geom is not None:
+            # data is already in memory, so only the selected window is taken from it without touching the files
             self._data = self.data_view
             self._data_geom.parent = None
         else:
@@ -747,7 +1102,7 @@ class RasterDataReader(RasterData):
 
     @staticmethod
     def _create_tile_and_layer_info_from_files(filepaths, tile_class, file_class,
-                                               file_class_kwargs) -> Tuple[List[Tile], list, list]:
+                                               file_class_kwargs=None, n_threads=1) -> Tuple[List[Tile], list, list]:
         """
         Loops over a given list of files to assign a tile and layer to each file and creates the corresponding indexes.
 
@@ -759,8 +1114,11 @@ class RasterDataReader(RasterData):
             Class constructor for a tile class.
         file_class : class
             Class constructor for a file class.
-        file_class_kwargs : dict
+        file_class_kwargs : dict, optional
             Keyword arguments for calling `file_class`.
+        n_threads : int, optional
+            Number of threads used to read the file headers concurrently (defaults to 1). Only use more than one
+            thread if the file class allows to open files from different threads, e.g. for GDAL-based classes.
 
         Returns
         -------
@@ -777,22 +1135,41 @@ class RasterDataReader(RasterData):
         layer_ids = []
         tiles = []
         tile_idx = 0
-        for filepath in filepaths:
-            with file_class(filepath, 'r', **file_class_kwargs) as f:
-                sref_wkt = f.sref_wkt
-                geotrans = f.geotrans
-                n_rows, n_cols = f.raster_shape
-            curr_tile = tile_class(n_rows, n_cols, sref=SpatialRef(sref_wkt), geotrans=geotrans, name=str(tile_idx))
-            curr_tile_id = find_congruent_tile_id_from_tiles(curr_tile, tiles)
+        # files sharing the same header information belong to the same tile, so tiles only need to be created and
+        # compared to the existing ones for unseen headers
+        header_tile_ids = dict()
+        # maps the rounded corner coordinates and shapes of all tiles to their name, allowing to check the congruency
+        # of a new tile with all existing tiles with a single hash lookup
+        tile_keys = dict()
+        n_layers_per_tile = dict()
+        read_header = partial(_read_file_header, file_class=file_class, file_class_kwargs=file_class_kwargs)
+        if n_threads > 1:
+            # opening a file is mostly I/O bound, so the headers of many (remote) files are fetched concurrently
+            with ThreadPool(n_threads) as p:
+                headers = p.map(read_header, filepaths)
+        else:
+            headers = map(read_header, filepaths)
+
+        for header in headers:
+            sref_wkt, geotrans, n_rows, n_cols = header
+            curr_tile_id = header_tile_ids.get(header)
             if curr_tile_id is None:
-                tiles.append(curr_tile)
-                curr_tile_id = str(tile_idx)
-                tile_idx += 1
+                curr_tile = tile_class(n_rows, n_cols, sref=SpatialRef(sref_wkt), geotrans=geotrans,
+                                       name=str(tile_idx))
+                curr_tile_key = tuple(np.around(np.ravel(curr_tile.outer_boundary_corners), decimals=DECIMALS)) + \
+                    (n_rows, n_cols)
+                curr_tile_id = tile_keys.get(curr_tile_key)
+                if curr_tile_id is None:
+                    tiles.append(curr_tile)
+                    tile_keys[curr_tile_key] = curr_tile.name
+                    curr_tile_id = str(tile_idx)
+                    tile_idx += 1
+                header_tile_ids[header] = curr_tile_id
 
             tile_ids.append(curr_tile_id)
             # define the layer ID as the next index of all filepaths, which have already been assigned to one tile
-            layer_id = sum(np.array(tile_ids) == curr_tile_id) + 1
-            layer_ids.append(layer_id)
+            n_layers_per_tile[curr_tile_id] = n_layers_per_tile.get(curr_tile_id, 0) + 1
+            layer_ids.append(n_layers_per_tile[curr_tile_id])
 
         return tiles, tile_ids, layer_ids
 
@@ -864,6 +1241,37 @@ class RasterDataWriter(RasterData):
 
         super().__init__(file_register, mosaic, data=data, stack_dimension=stack_dimension, stack_coords=stack_coords,
                          tile_dimension=tile_dimension)
+        self._data_geom_cache = None
+        self._next_file_id = 1  # file IDs are never reused, even if files have been closed in between
+
+    def _get_data_geom(self, data) -> RasterGeometry:
+        """
+        Creates a raster geometry from an xarray dataset in the CRS of the mosaic. Repeated writes or exports often
+        pass data with the same coordinates, so the geometry is cached along with the coordinate variables it has
+        been created from.
+
+        Parameters
+        ----------
+        data : xr.Dataset
+            Raster data.
+
+        Returns
+        -------
+        geospade.raster.RasterGeometry :
+            Raster geometry representing the spatial extent of the xarray dataset. It must not be modified in place.
+
+        """
+        coord_vars = tuple(data.coords.variables.values())
+        sref = self.mosaic.sref
+        if self._data_geom_cache is not None:
+            cached_coord_vars, cached_sref, data_geom = self._data_geom_cache
+            if cached_sref is sref and len(cached_coord_vars) == len(coord_vars) and \
+                    all(coord_var is cached_coord_var for coord_var, cached_coord_var in zip(coord_vars,
+                                                                                             cached_coord_vars)):
+                return data_geom
+        data_geom = self.raster_geom_from_data(data, sref=sref)
+        self._data_geom_cache = (coord_vars, sref, data_geom)
+        return data_geom
 
     @abc.abstractmethod
     def write(self, data, encoder=None, encoder_kwargs=None, overwrite=False, **kwargs):
@@ -1015,12 +1423,33 @@ class RasterDataWriter(RasterData):
         n_entries = len(file_register)
         tile_names = mosaic.all_tile_names
         n_tiles = len(tile_names)
-        file_register = pd.DataFrame(np.repeat(file_register.values, n_tiles, axis=0),
-                                     columns=file_register.columns)
-        file_register[tile_dimension] = np.repeat([tile_names], n_entries, axis=0).flatten()
+        file_register = RasterDataWriter._repeat_file_register_entries(file_register, n_tiles)
+        file_register[tile_dimension] = np.tile(tile_names, n_entries)
 
         return file_register
 
+    @staticmethod
+    def _repeat_file_register_entries(file_register, n_repeats) -> pd.DataFrame:
+        """
+        Repeats each entry of a file register `n_repeats` times. The repetition is done column-wise, which preserves
+        the data type of each column and avoids converting the whole file register to an array of Python objects.
+
+        Parameters
+        ----------
+        file_register : pd.Dataframe
+            File register to repeat.
+        n_repeats : int
+            Number of repetitions of each entry.
+
+        Returns
+        -------
+        pd.DataFrame :
+            File register with `n_repeats` consecutive copies of each entry.
+
+        """
+        return pd.DataFrame({col: np.repeat(file_register[col].to_numpy(), n_repeats)
+                             for col in file_register.columns})
+
     @staticmethod
     def _add_stack_dims_to_file_register(file_register, stack_dimension, data=None):
         """
@@ -1046,11 +1475,10 @@ class RasterDataWriter(RasterData):
         if data is not None:
             layers = data[stack_dimension]
             n_layers = len(layers)
-            file_register = pd.DataFrame(np.repeat(file_register.values, n_layers, axis=0),
-                                         columns=file_register.columns)
-            file_register[stack_dimension] = np.repeat([layers], n_entries, axis=0).flatten()
+            file_register = RasterDataWriter._repeat_file_register_entries(file_register, n_layers)
+            file_register[stack_dimension] = np.tile(layers.data, n_entries)
         else:
-            layers = list(range(1, n_entries + 1))
+            layers = np.arange(1, n_entries + 1)
             file_register[stack_dimension] = layers
 
         return file_register
@@ -1085,15 +1513,14 @@ class RasterDataWriter(RasterData):
         """
         dirpath = dirpath or os.getcwd()
         fn_formatter = fn_formatter or dict()
+        # apply the formatters column-wise and iterate over plain dictionaries instead of creating a series per row
+        fn_columns = {k: file_register[k].map(fn_formatter[k]) if k in fn_formatter else file_register[k]
+                      for k in file_register.columns}
+        # zip the plain column values instead of constructing a new data frame only for iterating over its rows
+        fn_keys = list(fn_columns.keys())
         filepaths = []
-        for _, row in file_register.iterrows():
-            fn_entries = dict()
-            for k, v in row.items():
-                if k in fn_formatter.keys():
-                    v = fn_formatter[k](v)
-                if isinstance(v, str):
-                    fn_entries[k] = v
-
+        for fn_values in zip(*[fn_columns[k].tolist() for k in fn_keys]):
+            fn_entries = {k: v for k, v in zip(fn_keys, fn_values) if isinstance(v, str)}
             filename = fn_pattern.format(**fn_entries)
             filepaths.append(os.path.join(dirpath, filename))
         file_register['filepath'] = filepaths
@@ -1,40 +1,82 @@
 """ Raster data class managing I/O for multiple GeoTIFF files. """
 
-import os
 import uuid
-import tempfile
+from functools import partial
+import dask
+import dask.array as da
 import xarray as xr
 import numpy as np
 import pandas as pd
 from osgeo import gdal
-from datetime import datetime
 from typing import Tuple, List
 from multiprocessing import Pool, RawArray
+from multiprocessing.pool import ThreadPool
 
 from geospade.crs import SpatialRef
 from geospade.raster import Tile
 from geospade.raster import MosaicGeometry
 
 from veranda.utils import to_list
+from veranda.utils import accepts_out_arg
 from veranda.raster.native.geotiff import GeoTiffFile
 from veranda.raster.native.geotiff import create_vrt_file
+from veranda.raster.native.geotiff import decode_band_data
 from veranda.raster.gdalport import GDAL_TO_NUMPY_DTYPE
 from veranda.raster.mosaic.base import RasterDataReader, RasterDataWriter, RasterAccess
 
 PROC_OBJS = {}
 
 
-def read_init(fr, am, sm, sd, td, si, ad, dc, dk):
+def read_init(fr, am, sm, sd, td, si, ad, dc, dk, fpt=None):
     """ Helper method for setting the entries of global variable `PROC_OBJS` to be available during multiprocessing. """
-    PROC_OBJS['global_file_register'] = fr
-    PROC_OBJS['access_map'] = am
-    PROC_OBJS['shm_map'] = sm
-    PROC_OBJS['stack_dimension'] = sd
-    PROC_OBJS['tile_dimension'] = td
-    PROC_OBJS['stack_ids'] = si
-    PROC_OBJS['auto_decode'] = ad
-    PROC_OBJS['decoder'] = dc
-    PROC_OBJS['decoder_kwargs'] = dk
+    PROC_OBJS.update(_create_proc_objs(fr, am, sm, sd, td, si, ad, dc, dk, fpt))
+
+
+def _create_proc_objs(fr, am, sm, sd, td, si, ad, dc, dk, fpt=None) -> dict:
+    """ Helper method for collecting the objects needed by the read functions of a single read call. """
+    proc_objs = dict()
+    proc_objs['global_file_register'] = fr
+    proc_objs['access_map'] = am
+    proc_objs['shm_map'] = sm
+    # the NumPy views on the shared memory arrays are created once per worker instead of once per tile or file
+    proc_objs['shm_data'] = {band: np.frombuffer(shm_rar, dtype=np_dtype).reshape(shm_ar_shape)
+                             for band, (shm_rar, shm_ar_shape, np_dtype) in sm.items()}
+    proc_objs['stack_dimension'] = sd
+    proc_objs['tile_dimension'] = td
+    proc_objs['stack_idxs'] = si
+    proc_objs['auto_decode'] = ad
+    proc_objs['decoder'] = dc
+    proc_objs['decoder_kwargs'] = dk
+    proc_objs['files_per_tile'] = fpt
+    return proc_objs
+
+
+def _map_read_func(read_func, items, read_args, n_cores=1, use_threads=False):
+    """
+    Applies a read function to all items in parallel, either with a pool of processes or threads.
+
+    Parameters
+    ----------
+    read_func : callable
+        Read function accepting an item and, optionally, the objects needed for reading (`proc_objs`).
+    items : iterable
+        Items to map the read function to, e.g. tile IDs.
+    read_args : tuple
+        Arguments for collecting the objects needed for reading (see `read_init`).
+    n_cores : int, optional
+        Number of processes or threads (defaults to 1).
+    use_threads : bool, optional
+        True if threads instead of processes should be used (defaults to False).
+
+    """
+    if use_threads:
+        # threads share the module, so the objects are passed to each call instead of being set globally, which
+        # would interfere with concurrent reads and keep the data alive after reading
+        with ThreadPool(n_cores) as p:
+            p.map(partial(read_func, proc_objs=_create_proc_objs(*read_args)), items)
+    else:
+        with Pool(n_cores, initializer=read_init, initargs=read_args) as p:
+            p.map(read_func, items)
 
 
 class GeoTiffAccess(RasterAccess):
@@ -59,22 +101,26 @@ class GeoTiffAccess(RasterAccess):
 
         """
         super().__init__(src_raster_geom, dst_raster_geom, src_root_raster_geom=src_root_raster_geom)
-        self.src_wkt = src_raster_geom.parent_root.sref.wkt
-        self.src_geotrans = src_raster_geom.parent_root.geotrans
-        self.src_shape = src_raster_geom.parent_root.shape
+        src_parent_root = src_raster_geom.parent_root
+        self.src_wkt = src_parent_root.sref.wkt
+        self.src_geotrans = src_parent_root.geotrans
+        self.src_shape = src_parent_root.shape
 
-    @property
-    def gdal_args(self) -> Tuple[int, int, int, int]:
-        """ Prepares the needed positional arguments for GDAL's `ReadAsArray()` function. """
+        # the access arguments are requested for every file/tile read, so they are prepared once here
         min_row, min_col, max_row, max_col = self.src_window
         n_cols, n_rows = max_col - min_col + 1, max_row - min_row + 1
-        return min_col, min_row, n_cols, n_rows
+        self._gdal_args = (min_col, min_row, n_cols, n_rows)
+        self._read_args = (min_row, min_col, n_rows, n_cols)
+
+    @property
+    def gdal_args(self) -> Tuple[int, int, int, int]:
+        """ Positional arguments for GDAL's `ReadAsArray()` function. """
+        return self._gdal_args
 
     @property
     def read_args(self) -> Tuple[int, int, int, int]:
-        """ Prepares the needed positional arguments for the `read()` function of the internal GeoTIFF native. """
-        min_col, min_row, n_cols, n_rows = self.gdal_args
-        return min_row, min_col, n_rows, n_cols
+        """ Positional arguments for the `read()` function of the internal GeoTIFF native. """
+        return self._read_args
 
 
 class GeoTiffReader(RasterDataReader):
@@ -118,14 +164,41 @@ class GeoTiffReader(RasterDataReader):
         super().__init__(file_register, mosaic, stack_dimension=stack_dimension, stack_coords=stack_coords,
                          tile_dimension=tile_dimension)
 
-        file_class_kwargs = file_class_kwargs or dict()
-        ref_filepath = self._file_register['filepath'].iloc[0]
-        with file_class(ref_filepath, 'r', **file_class_kwargs) as gt_file:
-            self._ref_dtypes = gt_file.dtypes
-            self._ref_nodatavals = gt_file.nodatavals
+        self._file_class = file_class
+        self._file_class_kwargs = file_class_kwargs or dict()
+        self._ref_file_info = None  # coding information of a reference file, only read from disk when needed
 
         self._ref_space_dims = space_dims or ['y', 'x']
 
+    @property
+    def _ref_dtypes(self) -> list:
+        """ Data types of the bands of the reference file. """
+        return self.__get_ref_file_info()[0]
+
+    @property
+    def _ref_nodatavals(self) -> list:
+        """ No data values of the bands of the reference file. """
+        return self.__get_ref_file_info()[1]
+
+    def __get_ref_file_info(self) -> Tuple[list, list]:
+        """
+        Opens the first file of the file register on first access to retrieve the data types and no data values of
+        all bands, which are then kept for further usage.
+
+        Returns
+        -------
+        dtypes : list
+            Data types of the bands of the reference file.
+        nodatavals : list
+            No data values of the bands of the reference file.
+
+        """
+        if self._ref_file_info is None:
+            ref_filepath = self._file_register['filepath'].iloc[0]
+            with self._file_class(ref_filepath, 'r', **self._file_class_kwargs) as gt_file:
+                self._ref_file_info = (gt_file.dtypes, gt_file.nodatavals)
+        return self._ref_file_info
+
     @classmethod
     def from_filepaths(cls, filepaths, mosaic_class=MosaicGeometry, mosaic_kwargs=None, tile_kwargs=None,
                        stack_dimension='layer_id', tile_dimension='tile_id', **kwargs) -> "GeoTiffReader":
@@ -163,8 +236,8 @@ class GeoTiffReader(RasterDataReader):
         n_filepaths = len(filepaths)
         file_register_dict = dict()
         file_register_dict['filepath'] = filepaths
-        file_register_dict[tile_dimension] = ['0'] * n_filepaths
-        file_register_dict[stack_dimension] = list(range(1, n_filepaths + 1))
+        file_register_dict[tile_dimension] = '0'  # scalars are broadcasted by pandas
+        file_register_dict[stack_dimension] = np.arange(1, n_filepaths + 1)
         file_register = pd.DataFrame(file_register_dict)
 
         ref_filepath = filepaths[0]
@@ -182,7 +255,8 @@ class GeoTiffReader(RasterDataReader):
 
     @classmethod
     def from_mosaic_filepaths(cls, filepaths, mosaic_class=MosaicGeometry, mosaic_kwargs=None,
-                              stack_dimension='layer_id', tile_dimension='tile_id', **kwargs) -> "GeoTiffReader":
+                              stack_dimension='layer_id', tile_dimension='tile_id', n_threads=1,
+                              **kwargs) -> "GeoTiffReader":
         """
         Creates a `GeoTiffDataReader` instance as multiple stacks of GeoTIFF files.
 
@@ -201,6 +275,8 @@ class GeoTiffReader(RasterDataReader):
         tile_dimension : str, optional
             Dimension/column name of the dimension containing tile ID's in correspondence with the tiles in `mosaic`.
             Defaults to 'tile_id'.
+        n_threads : int, optional
+            Number of threads used to read the GeoTIFF file headers concurrently (defaults to 1).
         kwargs : dict, optional
             Key-word arguments for the `GeoTiffReader` constructor.
 
@@ -214,7 +290,8 @@ class GeoTiffReader(RasterDataReader):
         file_register_dict['filepath'] = filepaths
         tile_class = mosaic_class.get_tile_class()
         tiles, tile_ids, layer_ids = RasterDataReader._create_tile_and_layer_info_from_files(filepaths, tile_class,
-                                                                                             GeoTiffFile)
+                                                                                             GeoTiffFile,
+                                                                                             n_threads=n_threads)
 
         file_register_dict[tile_dimension] = tile_ids
         file_register_dict[stack_dimension] = layer_ids
@@ -230,8 +307,8 @@ class GeoTiffReader(RasterDataReader):
         nodatavals = {dvar: self._ref_nodatavals[i] for i, dvar in enumerate(self.data_view.data_vars)}
         super().apply_nan(nodatavals=nodatavals)
 
-    def read(self, bands=1, band_names=None, engine='vrt', n_cores=1,
-             auto_decode=False, decoder=None, decoder_kwargs=None) -> "GeoTiffReader":
+    def read(self, bands=1, band_names=None, engine='vrt', n_cores=1, use_threads=False, compute=True,
+             dtype=None, auto_decode=False, decoder=None, decoder_kwargs=None) -> "GeoTiffReader":
         """
         Reads data from disk.
 
@@ -251,6 +328,18 @@ class GeoTiffReader(RasterDataReader):
                                the mosaic is stored on a distributed file system.
         n_cores : int, optional
             Number of cores used to read data in a parallelised manner (defaults to 1).
+        use_threads : bool, optional
+            If True, the tiles/files are read concurrently by `n_cores` threads instead of processes. Since GDAL
+            releases the GIL while reading, this avoids the overhead of spawning processes and transferring the file
+            register, which pays off for many small reads. Defaults to False.
+        compute : bool, optional
+            True if values should be loaded into RAM (default). If False, the data is represented by dask arrays, which
+            are chunked per layer and only read from disk when they are computed. `engine`, `n_cores` and
+            `use_threads` are ignored in this case, since dask takes care of scheduling the reads.
+        dtype : str or np.dtype, optional
+            Data type of the output arrays, e.g. 'float32' to halve the memory footprint of float64 data. The data is
+            directly read (and decoded) into arrays of this type, so no intermediate array with the data type of the
+            files is allocated. Defaults to None, i.e. the data type of each band is kept.
         auto_decode : bool, optional
             True if data should be decoded according to the information available in its metadata. Defaults to False.
         decoder : callable, optional
@@ -261,21 +350,32 @@ class GeoTiffReader(RasterDataReader):
         """
         bands = to_list(bands)
         band_names = to_list(band_names)
+        dtypes = {band: np.dtype(dtype or self._ref_dtypes[band - 1]) for band in bands}
+        for band in bands:
+            self._ref_nodatavals[band - 1] = np.array((self._ref_nodatavals[band - 1])).astype(dtypes[band])
         dst_tile = Tile.from_extent(self._mosaic.outer_extent, sref=self._mosaic.sref,
                                     x_pixel_size=self._mosaic.x_pixel_size,
                                     y_pixel_size=self._mosaic.y_pixel_size,
                                     name='0')
 
-        shm_map = {band: self.__init_band_data(band, dst_tile) for band in bands}
         access_map = {src_tile.parent_root.name: GeoTiffAccess(src_tile, dst_tile) for src_tile in self._mosaic.tiles}
         data_mask = self.__create_data_mask_from(access_map, dst_tile.shape)
 
+        if not compute:
+            data = self.__read_lazily(dtypes, access_map, dst_tile.shape, data_mask, auto_decode=auto_decode,
+                                      decoder=decoder, decoder_kwargs=decoder_kwargs)
+            self._data_geom = dst_tile
+            self._data = self._to_xarray(data, band_names)
+            self._add_grid_mapping()
+            return self
+
+        shm_map = {band: self.__init_band_data(band, dst_tile, dtypes[band]) for band in bands}
         if engine == 'vrt':
-            self.__read_vrt_stack(access_map, shm_map, n_cores=n_cores, auto_decode=auto_decode, decoder=decoder,
-                                  decoder_kwargs=decoder_kwargs)
+            self.__read_vrt_stack(access_map, shm_map, n_cores=n_cores, use_threads=use_threads,
+                                  auto_decode=auto_decode, decoder=decoder, decoder_kwargs=decoder_kwargs)
         elif engine == 'parallel':
-            self.__read_parallel(access_map, shm_map, n_cores=n_cores, auto_decode=auto_decode, decoder=decoder,
-                                 decoder_kwargs=decoder_kwargs)
+            self.__read_parallel(access_map, shm_map, n_cores=n_cores, use_threads=use_threads,
+                                 auto_decode=auto_decode, decoder=decoder, decoder_kwargs=decoder_kwargs)
         else:
             err_msg = f"Engine '{engine}' is not supported!"
             raise ValueError(err_msg)
@@ -287,7 +387,55 @@ class GeoTiffReader(RasterDataReader):
         self._add_grid_mapping()
         return self
 
-    def __init_band_data(self, band, tile) -> Tuple[RawArray, tuple]:
+    def __read_lazily(self, dtypes, access_map, shape, data_mask, auto_decode=False, decoder=None,
+                      decoder_kwargs=None) -> dict:
+        """
+        Creates dask arrays for the given bands, which defer reading the GeoTIFF files until the data is computed.
+        Each layer forms one chunk, so that only the files of the layers being selected have to be read.
+
+        Parameters
+        ----------
+        dtypes : dict
+            Dictionary mapping band numbers to the data type of the output arrays.
+        access_map : dict
+            Dictionary mapping tile/geometry ID's with `GeoTiffAccess` instances to define the access patterns between
+            the data to load and to assign.
+        shape : tuple
+            Spatial shape (rows, columns) of the data.
+        data_mask : np.ndarray or None
+            Data mask. If it is None, all pixels are treated as valid.
+        auto_decode : bool, optional
+            True if data should be decoded according to the information available in its metadata. Defaults to False.
+        decoder : callable, optional
+            Function allowing to decode data read from disk.
+        decoder_kwargs : dict, optional
+            Keyword arguments for the decoder.
+
+        Returns
+        -------
+        data : dict
+            Dictionary mapping band numbers to 3D dask arrays.
+
+        """
+        bands = list(dtypes.keys())
+        nodatavals = {band: self._ref_nodatavals[band - 1] for band in bands}
+
+        file_entries = self._file_register.groupby(self._file_dim, sort=False)[[self._tile_dim, 'filepath']]
+        layer_data = dict()
+        for layer_id, layer_entries in file_entries:
+            layer_data[layer_id] = dask.delayed(read_layer)(list(layer_entries.itertuples(index=False, name=None)),
+                                                            access_map, shape, dtypes, nodatavals, data_mask,
+                                                            auto_decode, decoder, decoder_kwargs)
+
+        data = dict()
+        for band in bands:
+            band_layers = [da.from_delayed(layer_data[layer_id][band], shape=shape, dtype=dtypes[band])
+                           for layer_id in self.layer_ids]
+            data[band] = da.stack(band_layers)
+
+        return data
+
+    def __init_band_data(self, band, tile, np_dtype) -> Tuple[RawArray, tuple, np.dtype]:
         """
         Initialises shared memory array for a specific band.
 
@@ -297,6 +445,8 @@ class GeoTiffReader(RasterDataReader):
             Band number.
         tile : Tile
             Tile containing information about the raster shape of the band data.
+        np_dtype : np.dtype
+            Data type of the array.
 
         Returns
         -------
@@ -304,19 +454,18 @@ class GeoTiffReader(RasterDataReader):
             Shared memory array.
         shm_ar_shape : tuple
             Shape of the array.
+        np_dtype : np.dtype
+            Data type of the array.
 
         """
-        np_dtype = np.dtype(self._ref_dtypes[band - 1])
-        self._ref_nodatavals[band - 1] = np.array((self._ref_nodatavals[band - 1])).astype(np_dtype)
-        data_nshm = np.ones((self.n_layers, tile.n_rows, tile.n_cols), dtype=np_dtype) * \
-                    self._ref_nodatavals[band - 1]
-        shm_ar_shape = data_nshm.shape
-        c_dtype = np.ctypeslib.as_ctypes_type(data_nshm.dtype)
-        shm_rar = RawArray(c_dtype, data_nshm.size)
+        shm_ar_shape = (self.n_layers, tile.n_rows, tile.n_cols)
+        c_dtype = np.ctypeslib.as_ctypes_type(np_dtype)
+        shm_rar = RawArray(c_dtype, int(np.prod(shm_ar_shape)))
+        # fill the shared memory directly to avoid allocating and copying an intermediate array
         shm_data = np.frombuffer(shm_rar, dtype=np_dtype).reshape(shm_ar_shape)
-        shm_data[:] = data_nshm[:]
+        shm_data.fill(self._ref_nodatavals[band - 1])
 
-        return shm_rar, shm_ar_shape
+        return shm_rar, shm_ar_shape, np_dtype
 
     def __load_band_data(self, band, shm_map, mask) -> np.ndarray:
         """
@@ -327,9 +476,9 @@ class GeoTiffReader(RasterDataReader):
         band : int
             Band number.
         shm_map : dict
-            Dictionary mapping the band number with a tuple containing a shared memory array and its shape.
-        mask : np.array
-            Data mask.
+            Dictionary mapping the band number with a tuple containing a shared memory array, its shape and data type.
+        mask : np.array or None
+            Data mask. If it is None, all pixels are treated as valid.
 
         Returns
         -------
@@ -337,9 +486,11 @@ class GeoTiffReader(RasterDataReader):
             Shared memory array.
 
         """
-        shm_rar, shm_ar_shape = shm_map[band]
-        shm_data = np.frombuffer(shm_rar, dtype=self._ref_dtypes[band - 1]).reshape(shm_ar_shape)
-        shm_data[:, ~mask.astype(bool)] = self._ref_nodatavals[band - 1]
+        shm_rar, shm_ar_shape, np_dtype = shm_map[band]
+        shm_data = np.frombuffer(shm_rar, dtype=np_dtype).reshape(shm_ar_shape)
+        if mask is not None:
+            # the 2D mask is broadcasted along the stack dimension without replicating it
+            np.copyto(shm_data, self._ref_nodatavals[band - 1], where=~mask.astype(bool, copy=False))
 
         return shm_data
 
@@ -357,17 +508,22 @@ class GeoTiffReader(RasterDataReader):
 
         Returns
         -------
-        data_mask : np.ndarray
-            Data mask (1 valid data, 0 no data).
+        data_mask : np.ndarray or None
+            Boolean data mask (True valid data, False no data). None is returned if none of the tiles masks out any
+            pixels, so that no mask needs to be applied.
 
         """
-        data_mask = np.ones(shape)
-        for tile in self._mosaic.tiles:
+        masked_tiles = [tile for tile in self._mosaic.tiles if tile.mask is not None and not np.all(tile.mask)]
+        if not masked_tiles:
+            return None
+
+        data_mask = np.ones(shape, dtype=bool)
+        for tile in masked_tiles:
             gt_access = access_map[tile.parent_root.name]
             data_mask[gt_access.dst_row_slice, gt_access.dst_col_slice] = tile.mask
         return data_mask
 
-    def __read_vrt_stack(self, access_map, shm_map, n_cores=1,
+    def __read_vrt_stack(self, access_map, shm_map, n_cores=1, use_threads=False,
                          auto_decode=False, decoder=None, decoder_kwargs=None):
         """
         Reads GeoTIFF data from a stack of GeoTIFF files by using GDAL's VRT format.
@@ -381,6 +537,8 @@ class GeoTiffReader(RasterDataReader):
             Dictionary mapping band numbers with the respective name of the memory buffer of the shared numpy raw array.
         n_cores : int, optional
             Number of cores used to read data in a parallelised manner (defaults to 1).
+        use_threads : bool, optional
+            True if threads instead of processes should be used for reading in parallel (defaults to False).
         auto_decode : bool, optional
             True if data should be decoded according to the information available in its metadata. Defaults to False.
         decoder : callable, optional
@@ -391,13 +549,28 @@ class GeoTiffReader(RasterDataReader):
         """
         decoder_kwargs = decoder_kwargs or dict()
         global_file_register = self._file_register
+        # the file register is grouped by tile once, so that the workers only need to look up their files
+        files_per_tile = {tile_id: (file_group['filepath'].tolist(), file_group[self._file_dim].tolist())
+                          for tile_id, file_group in global_file_register.groupby(self._tile_dim, sort=False)}
+
+        read_args = (global_file_register, access_map, shm_map, self._file_dim, self._tile_dim,
+                     self.__get_layer_idxs(), auto_decode, decoder, decoder_kwargs, files_per_tile)
+        _map_read_func(read_vrt_stack, access_map.keys(), read_args, n_cores=n_cores, use_threads=use_threads)
 
-        with Pool(n_cores, initializer=read_init, initargs=(global_file_register, access_map, shm_map,
-                                                            self._file_dim, self._tile_dim, self.layer_ids,
-                                                            auto_decode, decoder, decoder_kwargs)) as p:
-            p.map(read_vrt_stack, access_map.keys())
+    def __get_layer_idxs(self) -> dict:
+        """
+        Maps each layer ID to its index along the stack dimension of the output array, which allows constant-time
+        lookups when assigning file data.
+
+        Returns
+        -------
+        dict :
+            Layer ID to layer index map.
+
+        """
+        return {layer_id: i for i, layer_id in enumerate(self.layer_ids)}
 
-    def __read_parallel(self, access_map, shm_map, n_cores=1,
+    def __read_parallel(self, access_map, shm_map, n_cores=1, use_threads=False,
                         auto_decode=False, decoder=None, decoder_kwargs=None):
         """
         Reads GeoTIFF mosaic on a file-by-file basis, in a parallel manner.
@@ -411,6 +584,8 @@ class GeoTiffReader(RasterDataReader):
             Dictionary mapping band numbers with the respective name of the memory buffer of the shared numpy raw array.
         n_cores : int, optional
             Number of cores used to read data in a parallelised manner (defaults to 1).
+        use_threads : bool, optional
+            True if threads instead of processes should be used for reading in parallel (defaults to False).
         auto_decode : bool, optional
             True if data should be decoded according to the information available in its metadata. Defaults to False.
         decoder : callable, optional
@@ -422,10 +597,10 @@ class GeoTiffReader(RasterDataReader):
         decoder_kwargs = decoder_kwargs or None
         global_file_register = self._file_register
 
-        with Pool(n_cores, initializer=read_init, initargs=(global_file_register, access_map, shm_map,
-                                                            self._file_dim, self._tile_dim,
-                                                            auto_decode, decoder, decoder_kwargs)) as p:
-            p.map(read_single_files, global_file_register.index)
+        read_args = (global_file_register, access_map, shm_map, self._file_dim, self._tile_dim,
+                     self.__get_layer_idxs(), auto_decode, decoder, decoder_kwargs)
+        _map_read_func(read_single_files, global_file_register.index, read_args, n_cores=n_cores,
+                       use_threads=use_threads)
 
     def _to_xarray(self, data, band_names=None) -> xr.Dataset:
         """
@@ -446,24 +621,21 @@ class GeoTiffReader(RasterDataReader):
         dims = [self._file_dim] + self._ref_space_dims
 
         # retrieve file register with unique stack dimension
-        ref_tile_id = list(self.file_register[self._tile_dim])[0]
-        file_register_uni = self._file_register.loc[self._file_register[self._tile_dim] == ref_tile_id]
-
-        coord_dict = dict()
-        for coord in self._file_coords:
-            coord_dict[coord] = file_register_uni[coord]
+        ref_tile_id = self._file_register[self._tile_dim].iat[0]
+        # select the rows and the coordinate columns with one indexing operation instead of chaining them
+        file_register_uni = self._file_register.loc[self._file_register[self._tile_dim].to_numpy() == ref_tile_id,
+                                                    self._file_coords]
 
+        coord_dict = {coord: (self._file_dim, file_register_uni[coord].to_numpy()) for coord in self._file_coords}
         coord_dict[self._ref_space_dims[0]] = self._data_geom.y_coords
         coord_dict[self._ref_space_dims[1]] = self._data_geom.x_coords
 
-        xar_dict = dict()
         bands = list(data.keys())
         band_names = band_names or bands
-        for i, band in enumerate(bands):
-            xar_dict[band_names[i]] = xr.DataArray(data[band], coords=coord_dict, dims=dims,
-                                                   attrs={'_FillValue': self._ref_nodatavals[band - 1]})
-
-        xrds = xr.Dataset(data_vars=xar_dict)
+        # build the dataset in one go to avoid validating the coordinates for each band separately
+        data_vars = {band_names[i]: (dims, data[band], {'_FillValue': self._ref_nodatavals[band - 1]})
+                     for i, band in enumerate(bands)}
+        xrds = xr.Dataset(data_vars=data_vars, coords=coord_dict)
 
         return xrds
 
@@ -556,7 +728,7 @@ class GeoTiffWriter(RasterDataWriter):
         return nodatavals, scale_factors, offsets, dtypes
 
     def write(self, data, use_mosaic=False, data_variables=None, encoder=None, encoder_kwargs=None, overwrite=False,
-              **kwargs):
+              n_threads=1, **kwargs):
         """
         Writes a certain chunk of data to disk.
 
@@ -575,47 +747,112 @@ class GeoTiffWriter(RasterDataWriter):
             Keyword arguments for the encoder.
         overwrite : bool, optional
             True if data should be overwritten, False if not (default).
+        n_threads : int, optional
+            Number of threads used to encode and write the files concurrently (defaults to 1). Since GDAL releases
+            the GIL, this speeds up writing many (compressed) files.
 
         """
-        data_geom = self.raster_geom_from_data(data, sref=self.mosaic.sref)
+        data_geom = self._get_data_geom(data)
         data_filt = data if data_variables is None else data[data_variables]
         band_names = list(data_filt.data_vars)
         n_bands = len(band_names)
         nodatavals, scale_factors, offsets, dtypes = self.__get_encoding_info_from_data(data_filt, band_names)
+        # stack all bands once into one contiguous (band, layer, row, col) array, which is then only indexed per file
+        if n_bands == 1:
+            data_cube = data_filt[band_names[0]].data[np.newaxis, ...]  # a view suffices, no need to copy the data
+        else:
+            data_cube = data_filt[band_names].to_array().data
+        file_dim_index = data_filt.indexes[self._file_dim]
 
+        def write_file(gt_file, data_write, row, col):
+            gt_file.write(data_write, row=row, col=col, encoder=encoder, encoder_kwargs=encoder_kwargs)
+
+        write_jobs = []  # only used for concurrent writing
+        tile_accesses = dict()  # several files can belong to the same tile, so intersections are computed only once
+        new_file_ids = dict()  # file IDs of new files are assigned to the file register at once after the loop
+        has_tile_dim = self._tile_dim in self._file_register.columns
+        has_file_ids = 'file_id' in self._file_register.columns
         for filepath, file_group in self._file_register.groupby('filepath'):
-            tile_id = file_group.iloc[0].get(self._tile_dim, '0')
+            tile_id = file_group[self._tile_dim].iat[0] if has_tile_dim else '0'
 
             file_coords = list(file_group[self._file_dim])
-            xrds = data_filt.sel(**{self._file_dim: file_coords})
-            data_write = xrds[band_names].to_array().data
+            layer_idxs = file_dim_index.get_indexer(file_coords)
+            if np.any(layer_idxs < 0):
+                err_msg = f"Not all coordinates of file '{filepath}' are available along dimension '{self._file_dim}'."
+                raise KeyError(err_msg)
+            if np.all(np.diff(layer_idxs) == 1):  # consecutive layers can be accessed with a view instead of a copy
+                data_write = data_cube[:, layer_idxs[0]:layer_idxs[-1] + 1, ...]
+            else:
+                data_write = data_cube[:, layer_idxs, ...]
 
             if use_mosaic:
                 src_tile = self._mosaic[tile_id]
-                if not src_tile.intersects(data_geom):
+                if tile_id not in tile_accesses:
+                    tile_accesses[tile_id] = self.__get_tile_access(src_tile, data_geom)
+                if tile_accesses[tile_id] is None:
                     continue
-                dst_tile = data_geom.slice_by_geom(src_tile, inplace=False, name='0')
-                gt_access = GeoTiffAccess(dst_tile, src_tile, src_root_raster_geom=data_geom)
-                data_write = data_write[..., gt_access.src_row_slice, gt_access.src_col_slice]
+                dst_tile, gt_access = tile_accesses[tile_id]
             else:
                 src_tile = data_geom
                 dst_tile = data_geom
                 gt_access = GeoTiffAccess(dst_tile, src_tile, src_root_raster_geom=data_geom)
 
-            file_id = file_group.iloc[0].get('file_id', None)
+            file_id = file_group['file_id'].iat[0] if has_file_ids else None
             if file_id is None:
                 gt_file = GeoTiffFile(filepath, mode='w', geotrans=src_tile.geotrans, sref_wkt=src_tile.sref.wkt,
                                       raster_shape=src_tile.shape, n_bands=n_bands, dtypes=dtypes,
                                       scale_factors=scale_factors, offsets=offsets, nodatavals=nodatavals)
-                file_id = len(list(self._files.keys())) + 1
+                file_id = self._next_file_id
+                self._next_file_id += 1
                 self._files[file_id] = gt_file
-                self._file_register.loc[file_group.index, 'file_id'] = file_id
+                new_file_ids.update(dict.fromkeys(file_group.index, file_id))
 
-            gt_file = self._files[file_id]
-            gt_file.write(data_write[..., gt_access.src_row_slice,
+            write_args = (self._files[file_id],
+                          data_write[..., gt_access.src_row_slice,
                                      gt_access.src_col_slice].reshape((-1, dst_tile.n_rows, dst_tile.n_cols)),
-                          row=gt_access.dst_window[0], col=gt_access.dst_window[1],
-                          encoder=encoder, encoder_kwargs=encoder_kwargs)
+                          gt_access.dst_window[0], gt_access.dst_window[1])
+            if n_threads > 1:
+                write_jobs.append(write_args)
+            else:
+                write_file(*write_args)
+
+        if new_file_ids:
+            self._file_register.loc[list(new_file_ids.keys()), 'file_id'] = list(new_file_ids.values())
+
+        if write_jobs:
+            # each job writes to a different file, so they can be safely executed in parallel
+            with ThreadPool(n_threads) as p:
+                p.starmap(write_file, write_jobs)
+
+    @staticmethod
+    def __get_tile_access(src_tile, data_geom) -> Tuple[Tile, GeoTiffAccess] or None:
+        """
+        Computes the intersection between a tile and the extent of the data and the corresponding access pattern.
+
+        Parameters
+        ----------
+        src_tile : geospade.raster.Tile
+            Tile of the mosaic.
+        data_geom : geospade.raster.RasterGeometry
+            Raster geometry representing the extent of the data.
+
+        Returns
+        -------
+        dst_tile : geospade.raster.Tile
+            Part of the data extent intersecting with the tile.
+        gt_access : GeoTiffAccess
+            Access pattern between the tile and the data extent.
+
+        Notes
+        -----
+        None is returned if the tile does not intersect with the data extent.
+
+        """
+        if not src_tile.intersects(data_geom):
+            return None
+        dst_tile = data_geom.slice_by_geom(src_tile, inplace=False, name='0')
+        gt_access = GeoTiffAccess(dst_tile, src_tile, src_root_raster_geom=data_geom)
+        return dst_tile, gt_access
 
     def export(self, use_mosaic=False, data_variables=None, encoder=None, encoder_kwargs=None, overwrite=False,
                **kwargs):
@@ -641,7 +878,7 @@ class GeoTiffWriter(RasterDataWriter):
         self.write(self.data_view, use_mosaic, data_variables, encoder, encoder_kwargs, overwrite, **kwargs)
 
 
-def read_vrt_stack(tile_id):
+def read_vrt_stack(tile_id, proc_objs=None):
     """
     Function being responsible to create a new VRT file from a stack of GeoTIFF files, read data from this files, and
     assign it to a shared memory array. This function is meant to be executed in parallel on different cores.
@@ -650,38 +887,48 @@ def read_vrt_stack(tile_id):
     ----------
     tile_id : str
         Tile/geometry ID coming from the Pool's mapping function.
+    proc_objs : dict, optional
+        Objects needed for reading (see `read_init`). Defaults to the global variable `PROC_OBJS`.
 
     """
-    global_file_register = PROC_OBJS['global_file_register']
-    access_map = PROC_OBJS['access_map']
-    shm_map = PROC_OBJS['shm_map']
-    tile_dimension = PROC_OBJS['tile_dimension']
-    stack_dimension = PROC_OBJS['stack_dimension']
-    stack_ids = PROC_OBJS['stack_ids']
+    proc_objs = PROC_OBJS if proc_objs is None else proc_objs
+    access_map = proc_objs['access_map']
+    shm_map = proc_objs['shm_map']
+    stack_idxs = proc_objs['stack_idxs']
 
     gt_access = access_map[tile_id]
     bands = list(shm_map.keys())
-    file_register = global_file_register.loc[global_file_register[tile_dimension] == tile_id]
+    filepaths, stack_ids = proc_objs['files_per_tile'].get(tile_id, ([], []))
 
-    if len(file_register) > 0:
-        path = tempfile.gettempdir()
-        vrt_filepath = os.path.join(path, f"{datetime.utcnow().strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex}.vrt")
-        while os.path.exists(vrt_filepath):
-            vrt_filepath = os.path.join(path, f"{datetime.utcnow().strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex}.vrt")
+    if len(filepaths) > 0:
+        # the VRT file is only used within this function, so it is kept in GDAL's in-memory file system
+        vrt_filepath = f"/vsimem/{uuid.uuid4().hex}.vrt"
 
-        filepaths = list(file_register['filepath'])
         create_vrt_file(filepaths, vrt_filepath, gt_access.src_shape, gt_access.src_wkt, gt_access.src_geotrans,
                         bands=bands)
 
-        layer_ids = [stack_ids.index(stack_id) for stack_id in file_register[stack_dimension]]
+        layer_ids = [stack_idxs[stack_id] for stack_id in stack_ids]
+        is_contiguous = np.all(np.diff(layer_ids) == 1)
+        if is_contiguous:
+            # a contiguous block of layers is addressed with a slice, which yields a view instead of a fancy index
+            layer_ids = slice(layer_ids[0], layer_ids[-1] + 1)
 
         src = gdal.Open(vrt_filepath, gdal.GA_ReadOnly)
-        vrt_data = src.ReadAsArray(*gt_access.gdal_args)
-        for band in bands:
-            _assign_vrt_stack_per_band(tile_id, layer_ids, band, src, vrt_data)
+        no_decoding = not proc_objs['auto_decode'] and proc_objs['decoder'] is None
+        if len(bands) == 1 and no_decoding and is_contiguous:
+            # read the stack directly into the shared memory array to avoid an intermediate copy of the data
+            shm_data = proc_objs['shm_data'][bands[0]]
+            buf_obj = shm_data[layer_ids, gt_access.dst_row_slice, gt_access.dst_col_slice]
+            src.ReadAsArray(*gt_access.gdal_args, buf_obj=buf_obj[0] if src.RasterCount == 1 else buf_obj)
+        else:
+            vrt_data = src.ReadAsArray(*gt_access.gdal_args)
+            for b_idx, band in enumerate(bands):
+                _assign_vrt_stack_per_band(tile_id, layer_ids, b_idx, band, src, vrt_data, proc_objs)
+        src = None
+        gdal.Unlink(vrt_filepath)
 
 
-def _assign_vrt_stack_per_band(tile_id, layer_ids, band, src, vrt_data):
+def _assign_vrt_stack_per_band(tile_id, layer_ids, b_idx, band, src, vrt_data, proc_objs=None):
     """
     Assigns loaded raster data to shared memory array for a specific band.
 
@@ -689,46 +936,101 @@ def _assign_vrt_stack_per_band(tile_id, layer_ids, band, src, vrt_data):
     ----------
     tile_id : str
         Tile/geometry ID coming from the Pool's mapping function.
+    layer_ids : list of int or slice
+        Indices of the layers along the stack dimension of the shared memory array.
+    b_idx : int
+        Position of the band within the bands being read, which is passed by the caller to avoid a linear search.
     band : int
         Band number.
     src : gdal.Dataset
         GDAL dataset handle.
     vrt_data : np.ndarray
         In-memory data read from disk.
+    proc_objs : dict, optional
+        Objects needed for reading (see `read_init`). Defaults to the global variable `PROC_OBJS`.
 
     """
-    auto_decode = PROC_OBJS['auto_decode']
-    decoder = PROC_OBJS['decoder']
-    decoder_kwargs = PROC_OBJS['decoder_kwargs']
-    access_map = PROC_OBJS['access_map']
-    shm_map = PROC_OBJS['shm_map']
+    proc_objs = PROC_OBJS if proc_objs is None else proc_objs
+    auto_decode = proc_objs['auto_decode']
+    decoder = proc_objs['decoder']
+    decoder_kwargs = proc_objs['decoder_kwargs']
+    access_map = proc_objs['access_map']
+    shm_map = proc_objs['shm_map']
 
     gt_access = access_map[tile_id]
-    bands = list(shm_map.keys())
-    n_bands = len(bands)
-    b_idx = bands.index(band)
+    n_bands = len(shm_map)
 
     band_data = vrt_data[b_idx::n_bands, ...]
     scale_factor = src.GetRasterBand(b_idx + 1).GetScale()
     nodataval = src.GetRasterBand(b_idx + 1).GetNoDataValue()
     offset = src.GetRasterBand(b_idx + 1).GetOffset()
     dtype = GDAL_TO_NUMPY_DTYPE[src.GetRasterBand(b_idx + 1).DataType]
+    shm_data = proc_objs['shm_data'][band]
     if auto_decode:
-        band_data = band_data.astype(float)
-        band_data[band_data == nodataval] = np.nan
-        band_data = band_data * scale_factor + offset
+        band_data = decode_band_data(band_data, nodataval=nodataval, scale_factor=scale_factor, offset=offset)
     else:
         if decoder is not None:
+            # the decoder may only write into the raw data if the shared memory array has the same data type, since
+            # decoded values, e.g. scaled ones, would be truncated otherwise
+            if shm_data.dtype == band_data.dtype and accepts_out_arg(decoder):
+                decoder_kwargs = dict(decoder_kwargs, out=band_data)
             band_data = decoder(band_data, nodataval=nodataval, band=band, scale_factor=scale_factor,
                                 offset=offset,
                                 dtype=dtype, **decoder_kwargs)
 
-    shm_rar, shm_ar_shape = shm_map[band]
-    shm_data = np.frombuffer(shm_rar, dtype=dtype).reshape(shm_ar_shape)
     shm_data[layer_ids, gt_access.dst_row_slice, gt_access.dst_col_slice] = band_data
 
 
-def read_single_files(file_idx):
+def read_layer(file_entries, access_map, shape, dtypes, nodatavals, data_mask=None, auto_decode=False, decoder=None,
+               decoder_kwargs=None) -> dict:
+    """
+    Reads the data of all GeoTIFF files belonging to one layer and assigns it to the respective windows of new arrays.
+    This function is meant to be executed lazily by dask.
+
+    Parameters
+    ----------
+    file_entries : list of tuple
+        Tile ID and file path of each file of the layer.
+    access_map : dict
+        Dictionary mapping tile/geometry ID's with `GeoTiffAccess` instances to define the access patterns between
+        the data to load and to assign.
+    shape : tuple
+        Spatial shape (rows, columns) of the output arrays.
+    dtypes : dict
+        Dictionary mapping band numbers to the data type of the output arrays.
+    nodatavals : dict
+        Dictionary mapping band numbers to the no data value used to fill the output arrays.
+    data_mask : np.ndarray, optional
+        Data mask. If it is None (default), all pixels are treated as valid.
+    auto_decode : bool, optional
+        True if data should be decoded according to the information available in its metadata. Defaults to False.
+    decoder : callable, optional
+        Function allowing to decode data read from disk.
+    decoder_kwargs : dict, optional
+        Keyword arguments for the decoder.
+
+    Returns
+    -------
+    data : dict
+        Dictionary mapping band numbers to 2D NumPy arrays.
+
+    """
+    bands = list(dtypes.keys())
+    data = {band: np.full(shape, nodatavals[band], dtype=dtypes[band]) for band in bands}
+    for tile_id, filepath in file_entries:
+        gt_access = access_map[tile_id]
+        out = {band: data[band][gt_access.dst_row_slice, gt_access.dst_col_slice] for band in bands}
+        with GeoTiffFile(filepath, mode='r', auto_decode=auto_decode) as gt_file:
+            gt_file.read(*gt_access.read_args, bands=bands, decoder=decoder, decoder_kwargs=decoder_kwargs, out=out)
+
+    if data_mask is not None:
+        for band in bands:
+            np.copyto(data[band], nodatavals[band], where=~data_mask.astype(bool, copy=False))
+
+    return data
+
+
+def read_single_files(file_idx, proc_objs=None):
     """
     Function being responsible to read data from a single GeoTIFF file and assign it to a shared memory array.
     This function is meant to be executed in parallel on different cores.
@@ -738,31 +1040,32 @@ def read_single_files(file_idx):
     file_idx : any
         Index value to access a specific row of the file register. The actual value should come from the Pool's
         mapping function.
+    proc_objs : dict, optional
+        Objects needed for reading (see `read_init`). Defaults to the global variable `PROC_OBJS`.
 
     """
-    global_file_register = PROC_OBJS['global_file_register']
-    access_map = PROC_OBJS['access_map']
-    shm_map = PROC_OBJS['shm_map']
-    auto_decode = PROC_OBJS['auto_decode']
-    decoder = PROC_OBJS['decoder']
-    decoder_kwargs = PROC_OBJS['decoder_kwargs']
-    stack_dimension = PROC_OBJS['stack_dimension']
-    tile_dimension = PROC_OBJS['tile_dimension']
+    proc_objs = PROC_OBJS if proc_objs is None else proc_objs
+    global_file_register = proc_objs['global_file_register']
+    access_map = proc_objs['access_map']
+    shm_data = proc_objs['shm_data']
+    auto_decode = proc_objs['auto_decode']
+    decoder = proc_objs['decoder']
+    decoder_kwargs = proc_objs['decoder_kwargs']
+    stack_dimension = proc_objs['stack_dimension']
+    tile_dimension = proc_objs['tile_dimension']
+    stack_idxs = proc_objs['stack_idxs']
 
     file_entry = global_file_register.loc[file_idx]
-    layer_id = file_entry[stack_dimension]
+    layer_idx = stack_idxs[file_entry[stack_dimension]]
     tile_id = file_entry[tile_dimension]
     filepath = file_entry['filepath']
     gt_access = access_map[tile_id]
-    bands = list(shm_map.keys())
+    bands = list(shm_data.keys())
 
     with GeoTiffFile(filepath, mode='r', auto_decode=auto_decode) as gt_file:
-        gt_data = gt_file.read(*gt_access.read_args, bands=bands, decoder=decoder, decoder_kwargs=decoder_kwargs)
-        for band in bands:
-            dtype = gt_file.dtypes[band]
-            shm_rar, shm_ar_shape = shm_map[band]
-            shm_data = np.frombuffer(shm_rar, dtype=dtype).reshape(shm_ar_shape)
-            shm_data[layer_id, gt_access.dst_row_slice, gt_access.dst_col_slice] = gt_data[(band - 1), ...]
+        # read the data directly into the respective window of the shared memory arrays
+        out = {band: shm_data[band][layer_idx, gt_access.dst_row_slice, gt_access.dst_col_slice] for band in bands}
+        gt_file.read(*gt_access.read_args, bands=bands, decoder=decoder, decoder_kwargs=decoder_kwargs, out=out)
 
 
 if __name__ == '__main__':
@@ -1,11 +1,17 @@
 """ Raster data class managing I/O for multiple NetCDF files. """
 
+import dask
+import dask.array as da
+import warnings
+import threading
 import xarray as xr
 import numpy as np
 import pandas as pd
 import netCDF4
 from netCDF4 import MFDataset
-from typing import Tuple
+from typing import Tuple, List
+from contextlib import ExitStack
+from multiprocessing.pool import ThreadPool
 
 from geospade.crs import SpatialRef
 from geospade.raster import Tile
@@ -13,9 +19,15 @@ from geospade.raster import MosaicGeometry
 from geospade import DECIMALS
 
 from veranda.utils import to_list
+from veranda.utils import accepts_arg
+from veranda.utils import attrs_equal
 from veranda.raster.native.netcdf import NetCdf4File
 from veranda.raster.mosaic.base import RasterDataReader, RasterDataWriter, RasterAccess
 
+# the netCDF-C library is not thread-safe, so all calls to the netCDF4 library within this module, which may happen
+# in several threads, are serialised with this lock
+_NETCDF_LOCK = threading.Lock()
+
 
 class NetCdfReader(RasterDataReader):
     """ Allows to read and manage a stack of NetCDF files. """
@@ -55,6 +67,10 @@ class NetCdfReader(RasterDataReader):
         """
         super().__init__(file_register, mosaic, stack_dimension=stack_dimension, stack_coords=stack_coords,
                          tile_dimension=tile_dimension)
+        self._filepaths_per_tile_cache = None
+        self._data_window_cache = dict()
+        self._times_cache = dict()
+        self._var_metadata_cache = dict()
 
         file_class_kwargs = file_class_kwargs or dict()
         ref_filepath = self._file_register['filepath'].iloc[0]
@@ -69,6 +85,15 @@ class NetCdfReader(RasterDataReader):
             stack_dims = nc_file.stack_dims
             self._ref_space_dims = list(space_dims.keys()) if isinstance(space_dims, dict) else space_dims
             self._ref_stack_dims = list(stack_dims.keys()) if isinstance(stack_dims, dict) else stack_dims
+        # the dimension names of the data variables are the same for all tiles and reads
+        self._ref_all_dims = tuple(self._ref_stack_dims + self._ref_space_dims)
+        # the coding information is collected once per data variable to pass it to a decoder in one go
+        self._ref_coding_info = {data_variable: {'nodataval': self._ref_nodatavals[data_variable],
+                                                 'data_variable': data_variable,
+                                                 'scale_factor': self._ref_scale_factors[data_variable],
+                                                 'offset': self._ref_offsets[data_variable],
+                                                 'dtype': self._ref_dtypes[data_variable]}
+                                 for data_variable in self._ref_data_variables}
 
     @classmethod
     def from_filepaths(cls, filepaths, mosaic_class=MosaicGeometry, mosaic_kwargs=None, tile_kwargs=None,
@@ -114,8 +139,8 @@ class NetCdfReader(RasterDataReader):
         n_filepaths = len(filepaths)
         file_register_dict = dict()
         file_register_dict['filepath'] = filepaths
-        file_register_dict[tile_dimension] = ['0'] * n_filepaths
-        file_register_dict[stack_dimension] = list(range(n_filepaths))
+        file_register_dict[tile_dimension] = '0'  # scalars are broadcasted by pandas
+        file_register_dict[stack_dimension] = np.arange(n_filepaths)
         file_register = pd.DataFrame(file_register_dict)
 
         ref_filepath = filepaths[0]
@@ -187,8 +212,93 @@ class NetCdfReader(RasterDataReader):
         """ Converts no data values given as an attribute '_FillValue' or keyword `nodatavals` to np.nan. """
         super().apply_nan(nodatavals=self._ref_nodatavals)
 
-    def read(self, data_variables=None, engine='netcdf4', agg_dim='time', parallel=True, compute=True, auto_decode=False,
-             decoder=None, decoder_kwargs=None, **kwargs) -> "NetCdfReader":
+    def __get_filepaths_per_tile(self, tile_id) -> List[str]:
+        """
+        Retrieves the file paths belonging to a specific tile. The file register is grouped by tile only once and
+        regrouped if the file register has been replaced, e.g. by a selection.
+
+        Parameters
+        ----------
+        tile_id : str
+            Tile ID.
+
+        Returns
+        -------
+        list of str :
+            File paths of the given tile.
+
+        """
+        if self._filepaths_per_tile_cache is None or self._filepaths_per_tile_cache[0] is not self._file_register:
+            filepaths_per_tile = {tid: file_group['filepath'].tolist()
+                                  for tid, file_group in self._file_register.groupby(self._tile_dim, sort=False)}
+            self._filepaths_per_tile_cache = (self._file_register, filepaths_per_tile)
+        return self._filepaths_per_tile_cache[1].get(tile_id, [])
+
+    def __num2date(self, time_var) -> np.ndarray:
+        """
+        Converts the numeric values of a temporal netCDF4 variable to datetime instances. Tiles of a mosaic usually
+        share the same time stamps, so the conversion is cached per unique set of values, units, and calendar.
+
+        Parameters
+        ----------
+        time_var : netCDF4.Variable
+            Temporal netCDF4 variable.
+
+        Returns
+        -------
+        np.ndarray :
+            Datetime instances.
+
+        """
+        time_values = np.asarray(time_var[:])
+        units = getattr(time_var, 'units', None)
+        calendar = getattr(time_var, 'calendar', 'standard')
+        times_key = (units, calendar, time_values.dtype.str, time_values.tobytes())
+        times = self._times_cache.get(times_key)
+        if times is None:
+            if len(self._times_cache) >= 256:
+                self._times_cache.clear()
+            times = netCDF4.num2date(time_values, units=units, calendar=calendar,
+                                     only_use_cftime_datetimes=False,
+                                     only_use_python_datetimes=True)
+            self._times_cache[times_key] = times
+        return times
+
+    def __get_data_window(self, src_tile, dst_tile) -> Tuple[Tile, RasterAccess]:
+        """
+        Creates a tile representing the part of a source tile to actually read and the corresponding raster access
+        helper. Both only depend on the geometries, so they are cached and reused by subsequent reads of the same
+        window.
+
+        Parameters
+        ----------
+        src_tile : Tile
+            Source tile representing the spatial extent of the data window to read from.
+        dst_tile : Tile
+            Target tile representing the spatial extent of the data window to write to.
+
+        Returns
+        -------
+        dw_tile : Tile
+            Tile representing the data window to read from.
+        raster_access : RasterAccess
+            Helper instance to slice the data arrays.
+
+        """
+        src_parent_root = src_tile.parent_root
+        window_key = (src_parent_root.name, dst_tile.coord_extent, dst_tile.shape)
+        cached_window = self._data_window_cache.get(window_key)
+        if cached_window is None or cached_window[0] is not src_parent_root:
+            if len(self._data_window_cache) >= 256:
+                self._data_window_cache.clear()
+            dw_tile = src_parent_root.slice_by_geom(dst_tile)
+            cached_window = (src_parent_root, dw_tile, RasterAccess(dw_tile, dst_tile))
+            self._data_window_cache[window_key] = cached_window
+        return cached_window[1], cached_window[2]
+
+    def read(self, data_variables=None, engine='netcdf4', agg_dim='time', parallel=False, compute=True, auto_decode=False,
+             decoder=None, decoder_kwargs=None, n_threads=1, var_chunk_caches=None, chunk_cache=None,
+             validate_metadata=False, nc3_share=False, return_as='dataset', **kwargs) -> "NetCdfReader":
         """
         Reads NetCdf data from disk and assigns it to the class.
 
@@ -203,7 +313,8 @@ class NetCdfReader(RasterDataReader):
         agg_dim : str, optional
             Dimension to aggregate on (defaults to 'layer_id').
         parallel : bool, optional
-            Flag to activate parallelisation or not when using 'xarray' as an engine. Defaults to True.
+            Flag to open the files in parallel with dask when using 'xarray' as an engine. Defaults to False, since
+            the data of all tiles is already loaded within one dask computation.
         compute : bool, optional
             True if values from a dask array should be loaded into RAM (default).
         auto_decode : bool, optional
@@ -213,8 +324,51 @@ class NetCdfReader(RasterDataReader):
             Function allowing to decode NetCDF data read from disk.
         decoder_kwargs : dict, optional
             Keyword arguments for the decoder.
+        n_threads : int, optional
+            Number of threads used to process the tiles concurrently when using 'netcdf4' as an engine. Defaults to 1,
+            i.e. the tiles are processed one after another. Since the netCDF-C library is not thread-safe, the files
+            are still read one at a time, but the data of one tile is decoded and masked while the files of other
+            tiles are being read. The 'xarray' engine reads all tiles within one dask computation anyway.
+        var_chunk_caches : dict or tuple, optional
+            Chunk cache settings given as a 3-tuple (size, nelems, preemption) applied to the data variables of tiles
+            consisting of a single file when using 'netcdf4' as an engine. It can either be one 3-tuple (will be used
+            for all data variables), or a dictionary mapping the data variable with the respective chunk cache
+            settings. Defaults to None, i.e. the default NetCDF4 settings are used.
+        chunk_cache : tuple, optional
+            Default chunk cache settings given as a 3-tuple (size, nelems, preemption) used for all variables of the
+            files opened when using 'netcdf4' as an engine, e.g. (64 * 1024**2, 4133, 0.75) when reading many
+            consecutive layers. In contrast to `var_chunk_caches`, it also applies to tiles consisting of multiple
+            files. Defaults to None, i.e. the default NetCDF4 settings are used.
+        validate_metadata : bool, optional
+            If true and 'netcdf4' is used as an engine, the metadata attributes of the data variables are collected
+            from each tile and a warning is raised if they differ from the ones cached before. Defaults to false, i.e.
+            the metadata attributes of the first tile being read are reused for all tiles.
+        nc3_share : bool, optional
+            If true and 'netcdf4' is used as an engine, NetCDF-3 files of single-file tiles are opened for unbuffered,
+            shared access (NC_SHARE), i.e. the file content is only cached by the OS and not a second time by the
+            NetCDF library. This can speed up reading all records of a few variables. Defaults to false.
+        return_as : str, optional
+            Defines how the data is returned:
+                - 'dataset' : The data is assigned to the class as an xarray dataset and the class is returned
+                  (default).
+                - 'ndarray' : The data is neither converted to an xarray dataset nor assigned to the class, but
+                  returned as a dictionary mapping the data variables with NumPy arrays spanning the whole mosaic,
+                  together with a dictionary storing the coordinates of each dimension. Only available when using
+                  'netcdf4' as an engine.
+
+        Returns
+        -------
+        NetCdfReader or tuple :
+            The class itself, or the data and the coordinates if `return_as` is 'ndarray'.
 
         """
+        if return_as not in ['dataset', 'ndarray']:
+            err_msg = f"Return type '{return_as}' is not supported!"
+            raise ValueError(err_msg)
+        if return_as == 'ndarray' and engine != 'netcdf4':
+            err_msg = "Returning NumPy arrays is only supported by the 'netcdf4' engine."
+            raise ValueError(err_msg)
+
         data_variables = to_list(data_variables)
         dst_tile = Tile.from_extent(self._mosaic.outer_extent, sref=self._mosaic.sref,
                                     x_pixel_size=self._mosaic.x_pixel_size,
@@ -223,7 +377,11 @@ class NetCdfReader(RasterDataReader):
         if engine == 'netcdf4':
             data = self.__read_netcdf4(dst_tile, data_variables=data_variables, agg_dim=agg_dim,
                                        auto_decode=auto_decode, decoder=decoder, decoder_kwargs=decoder_kwargs,
-                                       **kwargs)
+                                       n_threads=n_threads, var_chunk_caches=var_chunk_caches,
+                                       chunk_cache=chunk_cache, validate_metadata=validate_metadata,
+                                       nc3_share=nc3_share, as_xarray=return_as == 'dataset')
+            if return_as == 'ndarray':
+                return data
         elif engine == 'xarray':
             data = self.__read_xarray(dst_tile, data_variables=data_variables, parallel=parallel,
                                       agg_dim=agg_dim, compute=compute, auto_decode=auto_decode, decoder=decoder,
@@ -263,16 +421,145 @@ class NetCdfReader(RasterDataReader):
         """
         dar = ds[data_variable][..., raster_access.src_row_slice, raster_access.src_col_slice]
         if decoder:
-            dar = decoder(dar, nodataval=self._ref_nodatavals[data_variable],
-                          data_variable=data_variable,
-                          scale_factor=self._ref_scale_factors[data_variable],
-                          offset=self._ref_offsets[data_variable],
-                          dtype=self._ref_dtypes[data_variable],
-                          **decoder_kwargs)
+            dar = decoder(dar, **self._ref_coding_info[data_variable], **decoder_kwargs)
         return dar
 
+    def __combine_tile_data(self, data) -> xr.Dataset:
+        """
+        Combines the datasets of all tiles into one dataset.
+
+        Parameters
+        ----------
+        data : list of xr.Dataset
+            Datasets of the individual tiles, which are aligned to the same pixel grid.
+
+        Returns
+        -------
+        xr.Dataset :
+            Combined dataset.
+
+        Notes
+        -----
+        The tiles share one pixel grid, so they are concatenated by their coordinates, which is exact and does not
+        require any resampling as done by mosaicking tools like `rioxarray.merge`. A single tile is returned as is.
+        Loaded tiles seamlessly covering the pixel grid are copied into one pre-allocated array per data variable,
+        all other cases are combined with `xr.combine_by_coords`.
+
+        """
+        if len(data) == 1:
+            return data[0]
+        combined_data = self.__assemble_tile_data(data)
+        return xr.combine_by_coords(data) if combined_data is None else combined_data
+
+    def __assemble_tile_data(self, data) -> xr.Dataset or None:
+        """
+        Assembles loaded tile datasets by copying them into pre-allocated arrays spanning all tiles, which avoids
+        the coordinate inference of `xr.combine_by_coords`.
+
+        Parameters
+        ----------
+        data : list of xr.Dataset
+            Datasets of the individual tiles, which are aligned to the same pixel grid.
+
+        Returns
+        -------
+        xr.Dataset or None :
+            Combined dataset. None if the tiles do not share the same data variables and stack coordinates, are not
+            loaded into memory, or do not exactly cover their common pixel grid.
+
+        """
+        y_dim, x_dim = self._ref_space_dims
+        ref_ds = data[0]
+        stack_dims = [dim for dim in ref_ds.dims if dim not in [y_dim, x_dim]]
+        for ds in data:
+            if set(ds.data_vars) != set(ref_ds.data_vars) or \
+                    any(not ds.indexes[dim].equals(ref_ds.indexes[dim]) for dim in stack_dims):
+                return None
+            if any(dar.dims[-2:] != (y_dim, x_dim) or not isinstance(dar.data, np.ndarray)
+                   for dar in ds.data_vars.values()):
+                return None
+
+        y_coords = np.unique(np.concatenate([ds[y_dim].values for ds in data]))
+        x_coords = np.unique(np.concatenate([ds[x_dim].values for ds in data]))
+        # keep the coordinate order of the tiles, e.g. decreasing y coordinates for north-up images
+        y_coords = y_coords[::-1] if ref_ds.indexes[y_dim].is_monotonic_decreasing else y_coords
+        x_coords = x_coords[::-1] if ref_ds.indexes[x_dim].is_monotonic_decreasing else x_coords
+        y_idxs = {coord: idx for idx, coord in enumerate(y_coords.tolist())}
+        x_idxs = {coord: idx for idx, coord in enumerate(x_coords.tolist())}
+
+        tile_slices = []
+        is_covered = np.zeros((len(y_coords), len(x_coords)), dtype=bool)
+        for ds in data:
+            row_start, col_start = y_idxs[ds[y_dim].values[0].item()], x_idxs[ds[x_dim].values[0].item()]
+            tile_slice = (slice(row_start, row_start + ds.sizes[y_dim]), slice(col_start, col_start + ds.sizes[x_dim]))
+            if not np.array_equal(y_coords[tile_slice[0]], ds[y_dim].values) or \
+                    not np.array_equal(x_coords[tile_slice[1]], ds[x_dim].values) or is_covered[tile_slice].any():
+                return None
+            is_covered[tile_slice] = True
+            tile_slices.append(tile_slice)
+        if not is_covered.all():
+            return None
+
+        data_vars = dict()
+        for data_variable, ref_dar in ref_ds.data_vars.items():
+            dtype = np.result_type(*[ds[data_variable].dtype for ds in data])
+            ar = np.empty(ref_dar.shape[:-2] + (len(y_coords), len(x_coords)), dtype=dtype)
+            for ds, (row_slice, col_slice) in zip(data, tile_slices):
+                ar[..., row_slice, col_slice] = ds[data_variable].data
+            data_vars[data_variable] = (ref_dar.dims, ar, ref_dar.attrs)
+        coords = {name: coord for name, coord in ref_ds.coords.items()
+                  if y_dim not in coord.dims and x_dim not in coord.dims}
+        coords[y_dim] = y_coords
+        coords[x_dim] = x_coords
+
+        return xr.Dataset(data_vars=data_vars, coords=coords, attrs=ref_ds.attrs)
+
+    @staticmethod
+    def __open_netcdf4(filepaths, agg_dim='layer_id', chunk_cache=None, nc3_share=False) -> netCDF4.Dataset:
+        """
+        Opens one or multiple NetCDF files with the netCDF4 library.
+
+        Parameters
+        ----------
+        filepaths : list of str
+            Full system paths to the NetCDF files.
+        agg_dim : str, optional
+            Dimension to aggregate on (defaults to 'layer_id').
+        chunk_cache : tuple, optional
+            Default chunk cache settings given as a 3-tuple (size, nelems, preemption), which are used for all
+            variables of the files. Defaults to None, i.e. the default NetCDF4 settings are used.
+        nc3_share : bool, optional
+            True if a single NetCDF-3 file should be reopened for unbuffered, shared access. Defaults to false.
+
+        Returns
+        -------
+        netCDF4.Dataset or netCDF4.MFDataset :
+            Opened dataset.
+
+        """
+        # the caller holds `_NETCDF_LOCK`, which also prevents other threads from picking up the process-global chunk
+        # cache temporarily set here
+        if chunk_cache is not None:
+            # the library default is only used while opening the files, since it is copied to each variable then
+            default_chunk_cache = netCDF4.get_chunk_cache()
+            netCDF4.set_chunk_cache(*chunk_cache[:3])
+        try:
+            if len(filepaths) > 1:
+                return MFDataset(filepaths, aggdim=agg_dim)
+            # a single file does not need to be aggregated, so the scan of all files done by MFDataset is skipped
+            nc_ds = netCDF4.Dataset(filepaths[0])
+            if nc3_share and nc_ds.file_format.startswith('NETCDF3'):
+                nc_ds.close()
+                nc_ds = netCDF4.Dataset(filepaths[0], mode='rs')
+            return nc_ds
+        finally:
+            if chunk_cache is not None:
+                netCDF4.set_chunk_cache(*default_chunk_cache)
+
     def __read_netcdf4(self, dst_tile, data_variables=None, agg_dim='layer_id', auto_decode=False,
-                       decoder=None, decoder_kwargs=None, **kwargs) -> xr.Dataset:
+                       decoder=None, decoder_kwargs=None, n_threads=1, var_chunk_caches=None,
+                       chunk_cache=None, validate_metadata=False, nc3_share=False,
+                       as_xarray=True) -> xr.Dataset or Tuple[dict, dict]:
         """
         Reads NetCDF data using the `MFDataset` class of the netCDF4 library.
 
@@ -291,33 +578,123 @@ class NetCdfReader(RasterDataReader):
             Function allowing to decode NetCDF data read from disk.
         decoder_kwargs : dict, optional
             Keyword arguments for the decoder.
+        n_threads : int, optional
+            Number of threads used to process the tiles concurrently, while the files are read one at a time.
+            Defaults to 1.
+        var_chunk_caches : dict or tuple, optional
+            Chunk cache settings applied to the data variables of single-file tiles. Defaults to None.
+        chunk_cache : tuple, optional
+            Default chunk cache settings used for all files being opened. Defaults to None.
+        validate_metadata : bool, optional
+            True if the metadata attributes should be collected and compared for each tile. Defaults to false.
+        nc3_share : bool, optional
+            True if NetCDF-3 files of single-file tiles should be opened for unbuffered access. Defaults to false.
+        as_xarray : bool, optional
+            True if the data should be returned as an xarray dataset (default). Otherwise, the data is returned as
+            NumPy arrays together with its coordinates.
 
         Returns
         -------
-        xr.Dataset :
-            Read NetCDF variables represented as an xarray.Dataset instance.
+        xr.Dataset or tuple :
+            Read NetCDF variables represented as an xarray.Dataset instance, or a dictionary mapping the data
+            variables with NumPy arrays and a dictionary mapping the dimension names with coordinates.
 
         """
         data_variables = data_variables or self._ref_data_variables
         decoder_kwargs = decoder_kwargs or dict()
-        data = [self.__load_data_per_tile_netcdf4(src_tile, dst_tile, data_variables, agg_dim, auto_decode, decoder,
-                                                  decoder_kwargs)
-                for src_tile in self._mosaic.tiles]
+        tiles = self._mosaic.tiles
+        n_threads = min(n_threads, len(tiles))
+        if n_threads > 1:
+            # the files are accessed one after another, but the decoding and masking of the data of one tile overlaps
+            # with reading the files of the other tiles
+            with ThreadPool(n_threads) as pool:
+                data = pool.map(lambda src_tile: self.__load_data_per_tile_netcdf4(
+                    src_tile, dst_tile, data_variables, agg_dim, auto_decode, decoder, decoder_kwargs,
+                    var_chunk_caches, chunk_cache, validate_metadata, nc3_share, as_xarray), tiles)
+        else:
+            data = [self.__load_data_per_tile_netcdf4(src_tile, dst_tile, data_variables, agg_dim, auto_decode, decoder,
+                                                      decoder_kwargs, var_chunk_caches, chunk_cache,
+                                                      validate_metadata, nc3_share, as_xarray)
+                    for src_tile in tiles]
 
-        return xr.combine_by_coords(data)
+        return self.__combine_tile_data(data) if as_xarray else self.__assemble_tile_arrays(data, dst_tile)
 
-    def __post_proc_data_netcdf4(self, ar, dw_tile, dm_tile, nodataval=0) -> xr.DataArray:
+    def __assemble_tile_arrays(self, data, dst_tile) -> Tuple[dict, dict]:
         """
-        Masks the given array.
+        Copies the NumPy arrays of all tiles into one pre-allocated array per data variable spanning the target tile.
+
+        Parameters
+        ----------
+        data : list of tuple
+            Data of the individual tiles, each given as a tuple containing a dictionary mapping the data variables
+            with NumPy arrays, the raster access of the tile and its temporal coordinates.
+        dst_tile : geospade.raster.Tile
+            Target tile representing the spatial extent of the data window to write to.
+
+        Returns
+        -------
+        data_vars : dict
+            Data variables mapped to NumPy arrays spanning the target tile. Pixels not covered by any tile are set to
+            the respective no data value.
+        coords : dict
+            Dimension names mapped to the coordinates of the arrays.
+
+        """
+        ref_tile_data, _, times = data[0]
+        if any(len(tile_times) != len(times) or np.any(tile_times != times) for _, _, tile_times in data[1:]):
+            err_msg = "The temporal coordinates differ between tiles, so they can not be assembled into one array."
+            raise ValueError(err_msg)
+
+        data_vars = dict()
+        for data_variable, ref_ar in ref_tile_data.items():
+            dtype = np.result_type(*[tile_data[data_variable].dtype for tile_data, _, _ in data])
+            ar = np.full(ref_ar.shape[:-2] + (dst_tile.n_rows, dst_tile.n_cols), self._ref_nodatavals[data_variable],
+                         dtype=dtype)
+            for tile_data, raster_access, _ in data:
+                ar[..., raster_access.dst_row_slice, raster_access.dst_col_slice] = tile_data[data_variable]
+            data_vars[data_variable] = ar
+        y_dim, x_dim = self._ref_space_dims
+        coords = {self._ref_stack_dims[0]: times, y_dim: dst_tile.y_coords, x_dim: dst_tile.x_coords}
+
+        return data_vars, coords
+
+    @staticmethod
+    def __create_tile_mask(dw_tile, dm_tile) -> np.ndarray or None:
+        """
+        Creates a mask for the data window of a tile.
 
         Parameters
         ----------
-        ar : np.ndarray or xr.DataArray
-            Array to mask.
         dw_tile : Tile
             Tile representing the data window to read from.
         dm_tile : Tile
             Tile to extract a data mask from.
+
+        Returns
+        -------
+        tile_mask : np.ndarray or None
+            Boolean mask with the shape of the data window being true for valid pixels. None if `dm_tile` has no
+            mask.
+
+        """
+        if dm_tile.mask is None:
+            return None
+        raster_access = RasterAccess(dm_tile, dw_tile, src_root_raster_geom=dw_tile)
+        tile_mask = np.zeros(dw_tile.shape, dtype=bool)
+        tile_mask[raster_access.src_row_slice, raster_access.src_col_slice] = dm_tile.mask
+        return tile_mask
+
+    def __post_proc_data_netcdf4(self, ar, nodata_mask=None, nodataval=0) -> xr.DataArray:
+        """
+        Masks the given array.
+
+        Parameters
+        ----------
+        ar : np.ndarray or xr.DataArray
+            Array to mask.
+        nodata_mask : np.ndarray, optional
+            Boolean mask of the data window being true for pixels outside the tile's mask. Defaults to None, i.e. no
+            masking is applied.
         nodataval : float, optional
             No data value being assigned where the mask values evaluate to false (defaults to 0).
 
@@ -327,31 +704,31 @@ class NetCdfReader(RasterDataReader):
             Masked array.
 
         """
-        if dm_tile.mask is not None:
-            raster_access = RasterAccess(dm_tile, dw_tile, src_root_raster_geom=dw_tile)
-            tile_mask = np.zeros(dw_tile.shape)
-            tile_mask[raster_access.src_row_slice, raster_access.src_col_slice] = dm_tile.mask
-            ar[:, ~tile_mask.astype(bool)] = nodataval
+        if np.ma.isMaskedArray(ar):  # keep plain arrays, masked values are represented by NaN or the no data value
+            ar = ar.filled(np.nan) if np.issubdtype(ar.dtype, np.floating) else ar.filled(nodataval)
+        if nodata_mask is not None:
+            if isinstance(ar, np.ndarray):
+                # fill in place by broadcasting the 2D mask along the stack dimension instead of gathering indexes
+                np.copyto(ar, nodataval, where=nodata_mask, casting='unsafe')
+            else:
+                ar[:, nodata_mask] = nodataval
 
         return ar
 
-    def __load_data_per_data_variable_netcdf4(self, ds, data_variable, dw_tile, dm_tile, raster_access,
-                                              decoder=None, decoder_kwargs=None) -> xr.DataArray:
+    def __decode_data_per_data_variable_netcdf4(self, ar, data_variable, nodata_mask=None, decoder=None,
+                                                decoder_kwargs=None) -> np.ndarray:
         """
-        Selects, mask and slices a netCDF4 data variable.
+        Decodes and masks the data of a netCDF4 data variable read from disk.
 
         Parameters
         ----------
-        ds : xr.Dataset
-            Dataset to subset.
+        ar : np.ndarray
+            Data subset read from disk.
         data_variable : str
-            Data variable to select.
-        dw_tile : Tile
-            Tile representing the data window to read from.
-        dm_tile : Tile
-            Tile to extract a data mask from.
-        raster_access : RasterAccess
-            Helper instance to slice the data array.
+            Name of the data variable.
+        nodata_mask : np.ndarray, optional
+            Boolean mask of the data window being true for pixels outside the tile's mask. Defaults to None, i.e. no
+            masking is applied.
         decoder : callable, optional
             Function allowing to decode NetCDF data read from disk.
         decoder_kwargs : dict, optional
@@ -359,18 +736,60 @@ class NetCdfReader(RasterDataReader):
 
         Returns
         -------
-        dar : xr.DataArray
+        ar : np.ndarray
             Decoded data subset.
 
         """
-        dar = self.__load_data_per_data_variable(ds, data_variable, raster_access,
-                                                 decoder, decoder_kwargs)
-        dar = self.__post_proc_data_netcdf4(dar, dw_tile, dm_tile, self._ref_nodatavals[data_variable])
+        if decoder:
+            if nodata_mask is not None and accepts_arg(decoder, 'mask'):
+                # the decoder applies the tile mask in the same pass as the decoding
+                decoder_kwargs = dict(decoder_kwargs, mask=nodata_mask)
+                nodata_mask = None
+            ar = decoder(ar, **self._ref_coding_info[data_variable], **decoder_kwargs)
+        ar = self.__post_proc_data_netcdf4(ar, nodata_mask, self._ref_nodatavals[data_variable])
 
-        return dar
+        return ar
+
+    def __get_var_metadata(self, nc_ds, data_variables, validate=False) -> dict:
+        """
+        Retrieves the metadata attributes of the given data variables. The attributes are only collected from the
+        netCDF4 dataset if they have not been cached yet, since they are expected to be the same for all tiles.
+
+        Parameters
+        ----------
+        nc_ds : netCDF4.Dataset or netCDF4.MFDataset
+            Opened dataset of a tile.
+        data_variables : list
+            Data variables to retrieve the metadata attributes for.
+        validate : bool, optional
+            True if the attributes should be collected from the dataset in any case and a warning should be raised if
+            they differ from the cached ones. Defaults to false.
+
+        Returns
+        -------
+        metadata : dict
+            Metadata attributes for each data variable.
+
+        """
+        metadata = dict()
+        for data_variable in data_variables:
+            var_metadata = self._var_metadata_cache.get(data_variable)
+            if var_metadata is None or validate:
+                tile_var_metadata = NetCdf4File.get_metadata(nc_ds[data_variable])
+                if var_metadata is None:
+                    self._var_metadata_cache[data_variable] = tile_var_metadata
+                elif not attrs_equal(var_metadata, tile_var_metadata):
+                    wrn_msg = f"Metadata attributes of data variable '{data_variable}' differ between tiles."
+                    warnings.warn(wrn_msg)
+                var_metadata = tile_var_metadata
+            metadata[data_variable] = var_metadata
+
+        return metadata
 
     def __load_data_per_tile_netcdf4(self, src_tile, dst_tile, data_variables, agg_dim='layer_id', auto_decode=False,
-                                     decoder=None, decoder_kwargs=None) -> xr.Dataset:
+                                     decoder=None, decoder_kwargs=None, var_chunk_caches=None,
+                                     chunk_cache=None, validate_metadata=False, nc3_share=False,
+                                     as_xarray=True) -> xr.Dataset or tuple:
         """
         Creates an xarray dataset per tile for a given set of data variables from a multi-file netCDF4 dataset.
 
@@ -391,37 +810,66 @@ class NetCdfReader(RasterDataReader):
             Function allowing to decode NetCDF data read from disk.
         decoder_kwargs : dict, optional
             Keyword arguments for the decoder.
+        var_chunk_caches : dict or tuple, optional
+            Chunk cache settings applied to the data variables if the tile consists of a single file. Defaults to
+            None.
+        chunk_cache : tuple, optional
+            Default chunk cache settings used for all files of the tile. Defaults to None.
+        validate_metadata : bool, optional
+            True if the metadata attributes should be collected from the tile and compared with the cached ones.
+            Defaults to false.
+        nc3_share : bool, optional
+            True if a NetCDF-3 file should be opened for unbuffered access if the tile consists of a single file.
+            Defaults to false.
+        as_xarray : bool, optional
+            True if the data should be returned as an xarray dataset (default). Otherwise, the NumPy arrays are
+            returned together with the raster access of the tile and the temporal coordinates.
 
         Returns
         -------
-        xr.Dataset:
-            Dataset corresponding to the spatial and variable selection.
+        xr.Dataset or tuple:
+            Dataset corresponding to the spatial and variable selection, or a tuple containing a dictionary mapping
+            the data variables with NumPy arrays, the raster access of the tile and its temporal coordinates.
 
         """
         tile_id = src_tile.parent_root.name
-        # create new tile representing the part to actually read
-        dw_tile = src_tile.parent_root.slice_by_geom(dst_tile)
-        raster_access = RasterAccess(dw_tile, dst_tile)
-        file_register = self.file_register.loc[self.file_register[self._tile_dim] == tile_id]
-        filepaths = list(file_register['filepath'])
-        nc_ds = MFDataset(filepaths, aggdim=agg_dim)
-        nc_ds.set_auto_maskandscale(auto_decode)
-        tile_data = {data_variable: self.__load_data_per_data_variable_netcdf4(nc_ds, data_variable, dw_tile, src_tile,
-                                                                               raster_access,
-                                                                               decoder, decoder_kwargs)
-                     for data_variable in data_variables}
-        metadata = {data_variable: NetCdf4File.get_metadata(nc_ds[data_variable])
-                    for data_variable in data_variables}
-
-        times = netCDF4.num2date(nc_ds['time'][:],  # TODO: generalise stack dimension
-                                 units=getattr(nc_ds['time'], 'units', None),
-                                 calendar=getattr(nc_ds['time'], 'calendar', 'standard'),
-                                 only_use_cftime_datetimes=False,
-                                 only_use_python_datetimes=True)
+        dw_tile, raster_access = self.__get_data_window(src_tile, dst_tile)
+        filepaths = self.__get_filepaths_per_tile(tile_id)
+        # the files are only accessed while holding the lock, whereas the data is decoded and masked afterwards
+        with _NETCDF_LOCK:
+            nc_ds = self.__open_netcdf4(filepaths, agg_dim, chunk_cache, nc3_share)
+            try:
+                nc_ds.set_auto_maskandscale(auto_decode)
+                nc_ds.set_always_mask(False)  # only return masked arrays if there are masked values
+                if var_chunk_caches is not None and len(filepaths) == 1:
+                    # a larger HDF5 chunk cache avoids decompressing chunks repeatedly (MFDataset does not expose it)
+                    for data_variable in data_variables:
+                        var_chunk_cache = var_chunk_caches.get(data_variable) if isinstance(var_chunk_caches, dict) \
+                            else var_chunk_caches
+                        if var_chunk_cache is not None:
+                            nc_ds.variables[data_variable].set_var_chunk_cache(*var_chunk_cache[:3])
+                # the variables are sliced directly, which maps to a single hyperslab read in the netCDF4/HDF5 library
+                tile_data = {data_variable: nc_ds.variables[data_variable][..., raster_access.src_row_slice,
+                                                                           raster_access.src_col_slice]
+                             for data_variable in data_variables}
+                times = self.__num2date(nc_ds['time'])  # TODO: generalise stack dimension
+                metadata = self.__get_var_metadata(nc_ds, data_variables, validate=validate_metadata) \
+                    if as_xarray else None
+            finally:
+                nc_ds.close()
+
+        tile_mask = self.__create_tile_mask(dw_tile, src_tile)
+        # the mask is inverted only once, since it is shared by all data variables
+        nodata_mask = None if tile_mask is None else ~tile_mask
+        tile_data = {data_variable: self.__decode_data_per_data_variable_netcdf4(ar, data_variable, nodata_mask,
+                                                                                 decoder, decoder_kwargs)
+                     for data_variable, ar in tile_data.items()}
+        if not as_xarray:
+            return tile_data, raster_access, times
 
         return self._to_xarray(tile_data, dw_tile, times, metadata)
 
-    def __read_xarray(self, dst_tile, data_variables=None, parallel=True, agg_dim='layer_id', compute=True,
+    def __read_xarray(self, dst_tile, data_variables=None, parallel=False, agg_dim='layer_id', compute=True,
                       auto_decode=False, decoder=None, decoder_kwargs=None, **kwargs) -> xr.Dataset:
         """
         Reads NetCDF data using the `open_mfdataset` function of the xarray library.
@@ -433,7 +881,8 @@ class NetCdfReader(RasterDataReader):
         data_variables : list, optional
             Data variables to read. Default is to read all available data variables.
         parallel : bool, optional
-            Flag to activate parallelisation or not when using 'xarray' as an engine. Defaults to True.
+            Flag to open the files in parallel with dask when using 'xarray' as an engine. Defaults to False, since
+            the data of all tiles is already loaded within one dask computation.
         agg_dim : str, optional
             Dimension to aggregate on (defaults to 'layer_id').
         compute : bool, optional
@@ -454,13 +903,17 @@ class NetCdfReader(RasterDataReader):
         """
         data_variables = data_variables or self._ref_data_variables
         decoder_kwargs = decoder_kwargs or dict()
-        data = [self.__load_data_per_tile_xarray(src_tile, dst_tile, data_variables, parallel, agg_dim, compute,
+        data = [self.__load_data_per_tile_xarray(src_tile, dst_tile, data_variables, parallel, agg_dim,
                                                  auto_decode, decoder, decoder_kwargs, **kwargs)
                 for src_tile in self._mosaic.tiles]
+        if compute:
+            # load all tiles within one dask computation, so that the files of different tiles are read concurrently
+            # by dask's scheduler instead of one tile after another
+            data = list(dask.compute(*data))
 
-        return xr.combine_by_coords(data)
+        return self.__combine_tile_data(data)
 
-    def __post_proc_data_xarray(self, dar, dw_tile, dm_tile, nodataval=0, compute=True) -> xr.DataArray:
+    def __post_proc_data_xarray(self, dar, tile_mask=None, nodataval=0) -> xr.DataArray:
         """
         Masks the given array.
 
@@ -468,14 +921,10 @@ class NetCdfReader(RasterDataReader):
         ----------
         dar : xr.DataArray
             Array to mask.
-        dw_tile : Tile
-            Tile representing the data window to read from.
-        dm_tile : Tile
-            Tile to extract a data mask from.
+        tile_mask : np.ndarray, optional
+            Boolean mask of the data window being true for valid pixels. Defaults to None, i.e. no masking is applied.
         nodataval : float, optional
             No data value being assigned where the mask values evaluate to false (defaults to 0).
-        compute : bool, optional
-            True if values from a dask array should be loaded into RAM (default).
 
         Returns
         -------
@@ -483,56 +932,17 @@ class NetCdfReader(RasterDataReader):
             Masked array.
 
         """
-        if compute:
-            dar = dar.compute()
-        if dm_tile.mask is not None:
-            raster_access = RasterAccess(dm_tile, dw_tile, src_root_raster_geom=dw_tile)
-            tile_mask = np.zeros(dw_tile.shape)
-            tile_mask[raster_access.src_row_slice, raster_access.src_col_slice] = dm_tile.mask
-            dar = dar.where(tile_mask.astype(bool), nodataval)
+        if tile_mask is not None:
+            # the data is still lazy, so the masking becomes part of the single dask computation of all tiles
+            dar = dar.where(tile_mask, nodataval)
 
         return dar
 
-    def __load_data_per_data_variable_xarray(self, ds, data_variable, dw_tile, dm_tile, raster_access,
-                                      decoder=None, decoder_kwargs=None, compute=True) -> xr.DataArray:
-        """
-        Selects, mask and slices an xarray data array.
-
-        Parameters
-        ----------
-        ds : xr.Dataset
-            Dataset to subset.
-        data_variable : str
-            Data variable to select.
-        dw_tile : Tile
-            Tile representing the data window to read from.
-        dm_tile : Tile
-            Tile to extract a data mask from.
-        raster_access : RasterAccess
-            Helper instance to slice the data array.
-        decoder : callable, optional
-            Function allowing to decode NetCDF data read from disk.
-        decoder_kwargs : dict, optional
-            Keyword arguments for the decoder.
-        compute : bool, optional
-            True if values from a dask array should be loaded into RAM (default).
-
-        Returns
-        -------
-        dar : xr.DataArray
-            Decoded data subset.
-
-        """
-        dar = self.__load_data_per_data_variable(ds, data_variable, raster_access, decoder, decoder_kwargs)
-        dar = self.__post_proc_data_xarray(dar, dw_tile, dm_tile, self._ref_nodatavals[data_variable], compute)
-
-        return dar
-
-    def __load_data_per_tile_xarray(self, src_tile, dst_tile, data_variables, parallel=True,
-                                    agg_dim='layer_id', compute=True, auto_decode=False, decoder=None,
+    def __load_data_per_tile_xarray(self, src_tile, dst_tile, data_variables, parallel=False,
+                                    agg_dim='layer_id', auto_decode=False, decoder=None,
                                     decoder_kwargs=None, **kwargs) -> xr.Dataset:
         """
-        Creates an xarray dataset per tile for a given set of data variables.
+        Creates a lazy xarray dataset per tile for a given set of data variables.
 
         Parameters
         ----------
@@ -543,11 +953,10 @@ class NetCdfReader(RasterDataReader):
         data_variables : list
             Data variables to read.
         parallel : bool, optional
-            Flag to activate parallelisation or not when using 'xarray' as an engine. Defaults to True.
+            Flag to open the files in parallel with dask when using 'xarray' as an engine. Defaults to False, since
+            the data of all tiles is already loaded within one dask computation.
         agg_dim : str, optional
             Dimension to aggregate on (defaults to 'layer_id').
-        compute : bool, optional
-            True if values from a dask array should be loaded into RAM (default).
         auto_decode : bool, optional
             True if NetCDF data should be decoded according to the information available in its metadata. Defaults to
             False.
@@ -563,20 +972,22 @@ class NetCdfReader(RasterDataReader):
 
         """
         tile_id = src_tile.parent_root.name
-        # create new tile representing the part to actually read
-        dw_tile = src_tile.parent_root.slice_by_geom(dst_tile)
-        raster_access = RasterAccess(dw_tile, dst_tile)
-        file_register = self.file_register.loc[self.file_register[self._tile_dim] == tile_id]
-        filepaths = file_register['filepath']
+        dw_tile, raster_access = self.__get_data_window(src_tile, dst_tile)
+        filepaths = self.__get_filepaths_per_tile(tile_id)
         xr_ds = xr.open_mfdataset(filepaths, concat_dim=agg_dim, combine="nested", data_vars='minimal',
                                   coords='minimal', compat='override', parallel=parallel,
                                   mask_and_scale=auto_decode, **kwargs)
-        data_tile = {data_variable: self.__load_data_per_data_variable_xarray(xr_ds, data_variable, dw_tile, src_tile,
-                                                                              raster_access, decoder,
-                                                                              decoder_kwargs, compute)
+        data_tile = {data_variable: self.__load_data_per_data_variable(xr_ds, data_variable, raster_access, decoder,
+                                                                       decoder_kwargs)
                      for data_variable in data_variables}
-        ref_coords = data_tile[data_variables[0]].coords
-        return xr.Dataset(data_tile, coords=ref_coords, attrs=xr_ds.attrs)
+        tile_mask = self.__create_tile_mask(dw_tile, src_tile)  # shared by all data variables
+        data_tile = {data_variable: self.__post_proc_data_xarray(dar, tile_mask, self._ref_nodatavals[data_variable])
+                     for data_variable, dar in data_tile.items()}
+        # the data arrays share their coordinates, so the dataset is built from their plain variables and the
+        # coordinates of one of them, which avoids aligning the data arrays against each other
+        coords = next(iter(data_tile.values())).coords
+        return xr.Dataset({data_variable: dar.variable for data_variable, dar in data_tile.items()}, coords=coords,
+                          attrs=xr_ds.attrs)
 
     def _to_xarray(self, data, tile, times, metadata) -> xr.Dataset:
         """
@@ -598,19 +1009,13 @@ class NetCdfReader(RasterDataReader):
         xrds : xr.Dataset
 
         """
-        space_dim_names = self._ref_space_dims
-        stack_dim_names = self._ref_stack_dims
-        all_dim_names = stack_dim_names + space_dim_names
-        coord_dict = dict()
-        coord_dict[stack_dim_names[0]] = times
-        coord_dict[space_dim_names[0]] = tile.y_coords
-        coord_dict[space_dim_names[1]] = tile.x_coords
+        y_dim, x_dim = self._ref_space_dims
+        coord_dict = {self._ref_stack_dims[0]: times, y_dim: tile.y_coords, x_dim: tile.x_coords}
 
-        data_variables = list(data.keys())
-        xar_dict = {data_variable: xr.DataArray(data[data_variable], coords=coord_dict, dims=all_dim_names,
-                                                attrs=metadata[data_variable])
-                    for data_variable in data_variables}
-        xrds = xr.Dataset(data_vars=xar_dict)
+        # build the dataset in one go to avoid validating the coordinates for each data variable separately
+        data_vars = {data_variable: (self._ref_all_dims, data[data_variable], metadata[data_variable])
+                     for data_variable in data.keys()}
+        xrds = xr.Dataset(data_vars=data_vars, coords=coord_dict)
 
         return xrds
 
@@ -618,7 +1023,8 @@ class NetCdfReader(RasterDataReader):
 class NetCdfWriter(RasterDataWriter):
     """ Allows to write and manage a stack of NetCDF files. """
     def __init__(self, mosaic, file_register=None, data=None, stack_dimension='layer_id', stack_coords=None,
-                 tile_dimension='tile_id', dirpath=None, fn_pattern='{layer_id}.tif', fn_formatter=None):
+                 tile_dimension='tile_id', dirpath=None, fn_pattern='{layer_id}.tif', fn_formatter=None,
+                 max_open_files=None):
         """
         Constructor of `NetCdfWriter`.
 
@@ -660,12 +1066,21 @@ class NetCdfWriter(RasterDataWriter):
             brackets and add them to the pattern string as desired. Defaults to '{layer_id}.tif'.
         fn_formatter : dict, optional
             Dictionary mapping file register column names with functions allowing to encode their values as strings.
+        max_open_files : int, optional
+            Maximum number of NetCDF files being kept open. If more files are written, the least recently written
+            files are closed and reopened as soon as they are written again. The written data does not depend on this
+            setting, since a reopened file is written in the same way as a file which has been kept open. Defaults to
+            None, i.e. all files are kept open until the writer is closed.
 
         """
 
         super().__init__(mosaic, file_register=file_register, data=data, stack_dimension=stack_dimension,
                          stack_coords=stack_coords, tile_dimension=tile_dimension, dirpath=dirpath,
                          fn_pattern=fn_pattern, fn_formatter=fn_formatter)
+        self._filepath_groups_cache = None
+        self._tile_extents_cache = None
+        self._max_open_files = max_open_files
+        self._file_kwargs = dict()  # settings of the created files, which are needed to reopen them
 
     @classmethod
     def from_data(self, data, filepath, mosaic=None, tile_dimension='tile_id', **kwargs) -> "NetCdfWriter":
@@ -700,9 +1115,10 @@ class NetCdfWriter(RasterDataWriter):
         file_register = pd.DataFrame(file_register_dict)
         return super().from_xarray(data, file_register, mosaic=mosaic, tile_dimension=tile_dimension, **kwargs)
 
-    def __get_encoding_info_from_data(self, data, data_variables) -> Tuple[dict, dict, dict, dict]:
+    def __get_encoding_info_from_data(self, data, data_variables) -> dict:
         """
-        Extracts encoding information from an xarray dataset.
+        Extracts encoding information from an xarray dataset. The information is returned as keyword arguments for
+        creating a `NetCdf4File` instance, so that it can be passed on in one go.
 
         Parameters
         ----------
@@ -713,30 +1129,33 @@ class NetCdfWriter(RasterDataWriter):
 
         Returns
         -------
-        nodatavals : dict
-            Band number mapped to no data value (defaults to 0).
-        scale_factors : dict
-            Band number mapped to scale factor (defaults to 1).
-        offsets : dict
-            Band number mapped to offset (defaults to 0).
-        dtypes : dict
-            Band number mapped to data type.
+        dict :
+            Dictionary with the following entries:
+                - 'nodatavals' : Data variable mapped to no data value (defaults to 0).
+                - 'scale_factors' : Data variable mapped to scale factor (defaults to 1).
+                - 'offsets' : Data variable mapped to offset (defaults to 0).
+                - 'dtypes' : Data variable mapped to data type.
 
         """
         nodatavals = dict()
         scale_factors = dict()
         offsets = dict()
         dtypes = dict()
-        for data_variable in data_variables:
-            dtypes[data_variable] = data[data_variable].data.dtype.name
-            nodatavals[data_variable] = data[data_variable].attrs.get('_FillValue', 0)
-            scale_factors[data_variable] = data[data_variable].attrs.get('scale_factor', 1)
-            offsets[data_variable] = data[data_variable].attrs.get('add_offset', 0)
-
-        return nodatavals, scale_factors, offsets, dtypes
+        # the plain variables are accessed to avoid creating a data array with all its coordinates
+        variables = data.variables
+        for data_variable in dict.fromkeys(data_variables):
+            variable = variables[data_variable]
+            # data decoded by xarray stores the coding information in its encoding and not in its attributes
+            coding_info = {**variable.encoding, **variable.attrs}
+            dtypes[data_variable] = variable.dtype.name
+            nodatavals[data_variable] = coding_info.get('_FillValue', 0)
+            scale_factors[data_variable] = coding_info.get('scale_factor', 1)
+            offsets[data_variable] = coding_info.get('add_offset', 0)
+
+        return {'nodatavals': nodatavals, 'scale_factors': scale_factors, 'offsets': offsets, 'dtypes': dtypes}
 
     def write(self, data, use_mosaic=False, data_variables=None, encoder=None, encoder_kwargs=None, overwrite=False,
-              unlimited_dims=None, **kwargs):
+              unlimited_dims=None, n_threads=1, bit_round=None, fixed_stack_lengths=None, **kwargs):
         """
         Writes a certain chunk of NetCDF data to disk.
 
@@ -757,57 +1176,269 @@ class NetCdfWriter(RasterDataWriter):
             True if the NetCDF file(s) should be overwritten, False if not (default).
         unlimited_dims : list of str or str, optional
             List of dimension names specifying the dimensions to be stored as unlimited.
+        n_threads : int, optional
+            Number of threads used to write the files in the background (defaults to 1). Since the netCDF-C library is
+            not thread-safe, the files are still created, written, and closed one at a time, but a file is written as
+            soon as its data is prepared, so that the preparation of the remaining files overlaps with the disk I/O.
+            The data of a pending write is kept in memory, so at most `n_threads` writes are pending at a time.
+        bit_round : int, optional
+            Number of least significant mantissa bits of floating point data variables, which are rounded to zero
+            before writing (round to nearest, ties to even). This lowers the entropy of the data and thus allows for
+            much better compression at the cost of precision, e.g. 13 bits keep a relative precision of ~1e-3 for
+            32-bit floats. Defaults to None, i.e. the data is written as is.
+        fixed_stack_lengths : dict, optional
+            Maps unlimited stack dimensions with their final length, if it is already known. The dimensions of newly
+            created files are then allocated with this length, so that the HDF5 library does not need to extend them
+            with every write. Defaults to None, i.e. unlimited dimensions are kept unlimited.
         kwargs : dict, optional
-            Key-word arguments for creating a `NetCdf4File` instance.
+            Key-word arguments for creating a `NetCdf4File` instance, e.g. `compressions='zstd'` to compress the data
+            variables with Zstandard instead of ZLIB. If `chunksizes` are not given, each layer of the written window
+            is split into chunks of full rows with roughly 1MB. Writing full tiles (see `use_mosaic`) then only writes
+            whole chunks.
 
         """
-        data_geom = self.raster_geom_from_data(data, sref=self.mosaic.sref)
-        unlimited_dims = to_list(unlimited_dims)
+        data_geom = self._get_data_geom(data)
+        unlimited_dims = frozenset(to_list(unlimited_dims))  # membership is checked for every file and stack dimension
+        fixed_stack_lengths = fixed_stack_lengths or dict()
         data_filt = data if data_variables is None else data[data_variables]
         data_variables = list(data_filt.data_vars)
-        all_dims = list(data_filt.dims)
+        # the dimensions are taken from a data variable, since those of the dataset are collected from all variables
+        all_dims = list(data_filt.variables[data_variables[0]].dims)
         space_dims = all_dims[-2:]
         stack_dim_names = all_dims[:-2]
-        nodatavals, scale_factors, offsets, dtypes = self.__get_encoding_info_from_data(data, data_variables)
+        encoding_info = self.__get_encoding_info_from_data(data, data_variables)
+        if bit_round:
+            data_filt = data_filt.copy(data={data_variable: _bit_round(data_filt[data_variable].data, bit_round)
+                                             for data_variable in data_variables})
+        nodatavals, scale_factors = encoding_info['nodatavals'], encoding_info['scale_factors']
+        offsets, dtypes = encoding_info['offsets'], encoding_info['dtypes']
+        has_file_ids = 'file_id' in self._file_register.columns and self._file_register['file_id'].notna().any()
+        if encoder is not None and not has_file_ids:
+            # all files are created from the encoding information above, so the data is encoded at once instead of
+            # per file and the files receive the encoded data
+            encoder_kwargs = encoder_kwargs or dict()
+            data_filt = data_filt.copy(data={data_variable: encoder(data_filt[data_variable].data,
+                                                                    nodataval=nodatavals[data_variable],
+                                                                    scale_factor=scale_factors[data_variable],
+                                                                    offset=offsets[data_variable],
+                                                                    data_variable=data_variable,
+                                                                    dtype=dtypes[data_variable],
+                                                                    **encoder_kwargs)
+                                             for data_variable in data_variables})
+            encoder = None
+
+        def write_file(nc_file, data_write, row, col):
+            # each file stores all layers of its file group, so they are always written from the start of the stack
+            # dimensions, no matter if the file has been kept open or reopened
+            with _NETCDF_LOCK:
+                nc_file.write(data_write, row=row, col=col, encoder=encoder, encoder_kwargs=encoder_kwargs,
+                              append=False)
+
+        write_jobs = dict()  # maps file IDs to pending writes, only used for concurrent writing
+        # with several threads, each file is written as soon as its data is prepared, so that the preparation of the
+        # next tile overlaps with writing the previous ones
+        with ExitStack() as stack:
+            write_pool = stack.enter_context(ThreadPool(n_threads)) if n_threads > 1 else None
+            # several files can belong to the same tile, so intersections, coordinates, and the spatial subset of the
+            # data are computed only once per tile
+            dst_tiles = dict()
+            # tiles whose bounding box does not overlap with the data are skipped without an exact intersection test
+            tile_overlaps = self.__get_tile_overlaps(data_geom) if use_mosaic else dict()
+            tile_ids = self._file_register[self._tile_dim].to_numpy() if self._tile_dim in self._file_register.columns \
+                else None
+            for filepath, file_idxs in self.__get_filepath_groups().items():
+                tile_id = '0' if tile_ids is None else tile_ids[file_idxs[0]]
+                if not tile_overlaps.get(tile_id, True):
+                    continue
+                file_group = self._file_register.iloc[file_idxs]
+
+                if use_mosaic:
+                    src_tile = self._mosaic[tile_id]
+                    if tile_id not in dst_tiles:
+                        dst_tiles[tile_id] = self.__get_tile_data(src_tile, data_geom, data_filt, space_dims)
+                    if dst_tiles[tile_id] is None:
+                        continue
+                    dst_tile, tile_data = dst_tiles[tile_id]
+                else:
+                    dst_tile = data_geom
+                    src_tile = data_geom
+                    tile_data = data_filt
+
+                file_coords = list(file_group[self._file_dim])
+                # `data_filt` only contains `data_variables`, so the selection along the stack dimension is sufficient
+                file_indexer = _get_indexer(tile_data.indexes[self._file_dim], file_coords, self._file_dim)
+                data_write = tile_data.isel({self._file_dim: file_indexer})
+                stack_dims = {stack_dim_name: fixed_stack_lengths.get(stack_dim_name)
+                              if stack_dim_name in unlimited_dims else data_write.sizes[stack_dim_name]
+                              for stack_dim_name in stack_dim_names}
+
+                file_id = file_group.iloc[0].get('file_id', None)
+                if file_id is None:
+                    file_kwargs = kwargs
+                    if 'chunksizes' not in kwargs:
+                        # chunks matching the written window avoid partially written chunks, which would need to be
+                        # read, modified, and written again by the HDF5 library
+                        chunksizes = {data_variable: _get_write_chunksizes(len(stack_dim_names), dst_tile.n_rows,
+                                                                           dst_tile.n_cols,
+                                                                           np.dtype(dtypes[data_variable]).itemsize)
+                                      for data_variable in data_variables}
+                        file_kwargs = dict(kwargs, chunksizes=chunksizes)
+                    nc_kwargs = dict(geotrans=src_tile.geotrans, sref_wkt=src_tile.sref.wkt, stack_dims=stack_dims,
+                                     space_dims={space_dims[0]: src_tile.n_rows, space_dims[1]: src_tile.n_cols},
+                                     data_variables=data_variables, **encoding_info,
+                                     attrs={'time': {'units': 'days since 1950-01-01 00:00:00'}},  # TODO: make this more flexible (this needs to be defined from outside)
+                                     metadata=data_write.attrs, **file_kwargs)
+                    with _NETCDF_LOCK:
+                        gt_driver = NetCdf4File(filepath, mode='w', **nc_kwargs)
+                    file_id = self._next_file_id
+                    self._next_file_id += 1
+                    self._files[file_id] = gt_driver
+                    self._file_kwargs[file_id] = nc_kwargs
+                    self._file_register.loc[file_group.index, 'file_id'] = file_id
+                elif file_id not in self._files:
+                    # the file has been closed to limit the number of open files, so it is reopened with the same
+                    # settings it has been created with, e.g. the units of the temporal stack dimension
+                    with _NETCDF_LOCK:
+                        self._files[file_id] = NetCdf4File(filepath, mode='a', **self._file_kwargs[file_id])
+                else:
+                    self._files[file_id] = self._files.pop(file_id)  # mark the file as the most recently used one
+
+                raster_access = RasterAccess(dst_tile, src_tile, src_root_raster_geom=data_geom)
+                write_args = (self._files[file_id], data_write,
+                              raster_access.dst_window[0], raster_access.dst_window[1])
+                if write_pool is not None:
+                    write_jobs[file_id] = write_pool.apply_async(write_file, write_args)
+                    # like the queue depth of a disk, the number of pending writes is bounded, so that the preparation
+                    # does not run ahead of the disk I/O and keep the data of all files in memory
+                    while len(write_jobs) > n_threads:
+                        write_jobs.pop(next(iter(write_jobs))).get()
+                else:
+                    write_file(*write_args)
+                self.__close_least_recent_files(write_jobs)
+
+            # waiting for the results of the pending writes also raises any error occurred while writing
+            for write_job in write_jobs.values():
+                write_job.get()
+
+    def __close_least_recent_files(self, write_jobs=None):
+        """
+        Closes the least recently written files if more files are open than allowed. Their file IDs are kept in the
+        file register, so that they are reopened when being written again.
 
-        for filepath, file_group in self._file_register.groupby('filepath'):
-            tile_id = file_group.iloc[0].get(self._tile_dim, '0')
+        Parameters
+        ----------
+        write_jobs : dict, optional
+            Maps file IDs to pending concurrent writes. A file is only closed after its pending write has finished.
 
-            if use_mosaic:
-                src_tile = self._mosaic[tile_id]
-                if not src_tile.intersects(data_geom):
-                    continue
-                dst_tile = data_geom.slice_by_geom(src_tile, inplace=False)
-                data_write = data_filt.sel(**{space_dims[0]: np.around(dst_tile.y_coords, decimals=DECIMALS),
-                                              space_dims[1]: np.around(dst_tile.x_coords, decimals=DECIMALS)})
-            else:
-                dst_tile = data_geom
-                src_tile = data_geom
-                data_write = data_filt
-
-            file_coords = list(file_group[self._file_dim])
-            data_write = data_write.sel(**{self._file_dim: file_coords})
-            data_write = data_write[data_variables]
-            stack_dims = {stack_dim_name: None if stack_dim_name in unlimited_dims else len(data_write[stack_dim_name])
-                          for stack_dim_name in stack_dim_names}
-
-            file_id = file_group.iloc[0].get('file_id', None)
-            if file_id is None:
-                gt_driver = NetCdf4File(filepath, mode='w', geotrans=src_tile.geotrans, sref_wkt=src_tile.sref.wkt,
-                                        stack_dims=stack_dims,
-                                        space_dims={space_dims[0]: src_tile.n_rows, space_dims[1]: src_tile.n_cols},
-                                        data_variables=data_variables, dtypes=dtypes,
-                                        scale_factors=scale_factors, offsets=offsets, nodatavals=nodatavals,
-                                        attrs={'time': {'units': 'days since 1950-01-01 00:00:00'}},  # TODO: make this more flexible (this needs to be defined from outside)
-                                        metadata=data_write.attrs, **kwargs)
-                file_id = len(list(self._files.keys())) + 1
-                self._files[file_id] = gt_driver
-                self._file_register.loc[file_group.index, 'file_id'] = file_id
-
-            nc_file = self._files[file_id]
-            raster_access = RasterAccess(dst_tile, src_tile, src_root_raster_geom=data_geom)
-            nc_file.write(data_write, row=raster_access.dst_window[0], col=raster_access.dst_window[1],
-                          encoder=encoder, encoder_kwargs=encoder_kwargs)
+        """
+        if self._max_open_files is None:
+            return
+        write_jobs = write_jobs or dict()
+        while len(self._files) > self._max_open_files:
+            file_id = next(iter(self._files))
+            if file_id in write_jobs:
+                write_jobs.pop(file_id).get()
+            with _NETCDF_LOCK:
+                self._files.pop(file_id).close()
+
+    def __get_tile_overlaps(self, data_geom) -> dict:
+        """
+        Checks which tiles of the mosaic overlap with the bounding box of the data. The tile extents are collected
+        only once per mosaic and compared with the data extent in one vectorised operation.
+
+        Parameters
+        ----------
+        data_geom : geospade.raster.RasterGeometry
+            Raster geometry representing the extent of the data.
+
+        Returns
+        -------
+        dict :
+            Tile names mapped to a flag being true if the bounding box of the tile touches or overlaps with the one of
+            the data.
+
+        """
+        if self._tile_extents_cache is None or self._tile_extents_cache[0] is not self._mosaic:
+            tiles = self._mosaic.tiles
+            tile_extents = np.array([tile.outer_boundary_extent for tile in tiles]).reshape((-1, 4))
+            self._tile_extents_cache = (self._mosaic, [tile.name for tile in tiles], tile_extents)
+        _, tile_names, tile_extents = self._tile_extents_cache
+        min_x, min_y, max_x, max_y = data_geom.outer_boundary_extent
+        overlaps = (tile_extents[:, 0] <= max_x) & (tile_extents[:, 2] >= min_x) & \
+                   (tile_extents[:, 1] <= max_y) & (tile_extents[:, 3] >= min_y)
+        return dict(zip(tile_names, overlaps.tolist()))
+
+    def __get_filepath_groups(self) -> dict:
+        """
+        Retrieves the positional indices of the file register entries belonging to each file path. The file register
+        is grouped only once and regrouped if it has been replaced, e.g. by a selection. Updates of the file IDs are
+        done in place and do not change the grouping.
+
+        Returns
+        -------
+        dict :
+            File paths mapped to the positional indices of their entries in the file register.
+
+        """
+        if self._filepath_groups_cache is None or self._filepath_groups_cache[0] is not self._file_register or \
+                self._filepath_groups_cache[1] != len(self._file_register):
+            filepath_groups = self._file_register.groupby('filepath').indices
+            self._filepath_groups_cache = (self._file_register, len(self._file_register), filepath_groups)
+        return self._filepath_groups_cache[2]
+
+    @staticmethod
+    def __get_tile_data(src_tile, data_geom, data, space_dims) -> Tuple[Tile, xr.Dataset] or None:
+        """
+        Computes the intersection between a tile and the extent of the data and selects the corresponding data.
+
+        Parameters
+        ----------
+        src_tile : geospade.raster.Tile
+            Tile of the mosaic.
+        data_geom : geospade.raster.RasterGeometry
+            Raster geometry representing the extent of the data.
+        data : xr.Dataset
+            Data to select from.
+        space_dims : list of str
+            Names of the spatial dimensions in Y and X direction.
+
+        Returns
+        -------
+        dst_tile : geospade.raster.Tile
+            Part of the data extent intersecting with the tile.
+        data_tile : xr.Dataset
+            Data within `dst_tile`.
+
+        Notes
+        -----
+        None is returned if the tile does not intersect with the data extent.
+
+        """
+        px_window = None
+        if data.indexes[space_dims[0]].is_monotonic_decreasing and data.indexes[space_dims[1]].is_monotonic_increasing:
+            # the data is stored north-up like its raster geometry, so rows and columns of both are the same
+            px_window = _get_aligned_px_window(data_geom, src_tile)
+        if px_window is not None:
+            min_row, min_col, max_row, max_col = px_window
+            if max_row <= min_row or max_col <= min_col:
+                return None
+            # the tile shares the pixel grid of the data, so the intersection is a plain pixel window
+            dst_tile = data_geom.slice_by_rc(min_row, min_col, height=max_row - min_row, width=max_col - min_col,
+                                             inplace=False)
+            data_tile = data.isel({space_dims[0]: slice(min_row, max_row), space_dims[1]: slice(min_col, max_col)})
+            return dst_tile, data_tile
+
+        if not src_tile.intersects(data_geom):
+            return None
+        dst_tile = data_geom.slice_by_geom(src_tile, inplace=False)
+        # the tile is a contiguous part of the data extent, so it is selected with slices providing a view on the data
+        data_tile = data.isel({space_dims[0]: _get_indexer(data.indexes[space_dims[0]],
+                                                           np.around(dst_tile.y_coords, decimals=DECIMALS),
+                                                           space_dims[0]),
+                               space_dims[1]: _get_indexer(data.indexes[space_dims[1]],
+                                                           np.around(dst_tile.x_coords, decimals=DECIMALS),
+                                                           space_dims[1])})
+        return dst_tile, data_tile
 
     def export(self, use_mosaic=False, data_variables=None, encoder=None, encoder_kwargs=None, overwrite=False,
                unlimited_dims=None, **kwargs):
@@ -830,12 +1461,150 @@ class NetCdfWriter(RasterDataWriter):
         unlimited_dims : list of str or str, optional
             List of dimension names specifying the dimensions to be stored as unlimited.
         kwargs : dict, optional
-            Key-word arguments for creating a `NetCdf4File` instance.
+            Key-word arguments for `write`, e.g. `n_threads`, or for creating a `NetCdf4File` instance.
 
         """
         self.write(self.data_view, use_mosaic, data_variables, encoder, encoder_kwargs, overwrite, unlimited_dims,
                    **kwargs)
 
 
+def _get_write_chunksizes(n_stack_dims, n_rows, n_cols, itemsize, chunk_size=1024**2) -> tuple:
+    """
+    Computes chunk sizes for writing a window of data. Each chunk holds a single layer and consists of full rows, while
+    the rows are split equally so that a chunk does not exceed the given size.
+
+    Parameters
+    ----------
+    n_stack_dims : int
+        Number of stack dimensions.
+    n_rows : int
+        Number of rows of the written window.
+    n_cols : int
+        Number of columns of the written window.
+    itemsize : int
+        Size of one pixel value in bytes.
+    chunk_size : int, optional
+        Targeted maximum size of a chunk in bytes (defaults to 1MB).
+
+    Returns
+    -------
+    tuple :
+        Chunk sizes for each dimension.
+
+    """
+    n_chunks = max(int(np.ceil(n_rows * n_cols * itemsize / chunk_size)), 1)
+    n_chunk_rows = int(np.ceil(n_rows / min(n_chunks, n_rows)))
+    return (1,) * n_stack_dims + (n_chunk_rows, n_cols)
+
+
+def _get_aligned_px_window(raster_geom, other_raster_geom) -> Tuple[int, int, int, int] or None:
+    """
+    Computes the pixel window of the intersection of two raster geometries sharing the same pixel grid, i.e. they
+    are axis-parallel, have the same pixel sizes, and their origins are shifted by whole pixels.
+
+    Parameters
+    ----------
+    raster_geom : geospade.raster.RasterGeometry
+        Raster geometry defining the pixel indices.
+    other_raster_geom : geospade.raster.RasterGeometry
+        Raster geometry to intersect with.
+
+    Returns
+    -------
+    tuple or None :
+        Pixel window (min_row, min_col, max_row, max_col) within `raster_geom` with exclusive upper bounds, which is
+        empty if both geometries do not intersect. None if the geometries do not share the same pixel grid.
+
+    """
+    geotrans, other_geotrans = raster_geom.geotrans, other_raster_geom.geotrans
+    if geotrans[2] != 0 or geotrans[4] != 0 or other_geotrans[2] != 0 or other_geotrans[4] != 0 or \
+            not np.isclose(geotrans[1], other_geotrans[1]) or not np.isclose(geotrans[5], other_geotrans[5]) or \
+            raster_geom.sref != other_raster_geom.sref:
+        return None
+    row_offset = (other_geotrans[3] - geotrans[3]) / geotrans[5]
+    col_offset = (other_geotrans[0] - geotrans[0]) / geotrans[1]
+    if not np.isclose(row_offset, round(row_offset)) or not np.isclose(col_offset, round(col_offset)):
+        return None
+    row_offset, col_offset = int(round(row_offset)), int(round(col_offset))
+    min_row, min_col = max(row_offset, 0), max(col_offset, 0)
+    max_row = min(row_offset + other_raster_geom.n_rows, raster_geom.n_rows)
+    max_col = min(col_offset + other_raster_geom.n_cols, raster_geom.n_cols)
+
+    return min_row, min_col, max_row, max_col
+
+
+def _bit_round(ar, n_bits) -> np.ndarray or da.Array:
+    """
+    Rounds the given number of least significant mantissa bits of floating point data to zero (round to nearest,
+    ties to even). Non-finite values and non-floating point data are left untouched.
+
+    Parameters
+    ----------
+    ar : np.ndarray or dask.array.Array
+        Data to round.
+    n_bits : int
+        Number of mantissa bits to round.
+
+    Returns
+    -------
+    np.ndarray or dask.array.Array :
+        Rounded data.
+
+    """
+    dtype = np.dtype(ar.dtype)
+    if dtype.kind != 'f':
+        return ar
+    if isinstance(ar, da.Array):
+        return ar.map_blocks(_bit_round, n_bits, dtype=dtype)
+    n_bits = min(n_bits, np.finfo(dtype).nmant)
+    uint_dtype = np.dtype(f'uint{dtype.itemsize * 8}')
+    bits = np.ascontiguousarray(ar).view(uint_dtype)
+    one, shift = uint_dtype.type(1), uint_dtype.type(n_bits)
+    half_minus_one = (one << (shift - one)) - one
+    mask = ~((one << shift) - one)
+    rounded = ((bits + half_minus_one + ((bits >> shift) & one)) & mask).view(dtype)
+
+    return np.where(np.isfinite(ar), rounded, ar)
+
+
+def _get_indexer(index, labels, dim_name) -> slice or np.ndarray:
+    """
+    Converts coordinate labels to positional indices along a dimension. Consecutive positions are returned as a
+    slice, which allows to select a view instead of a copy of the data.
+
+    Parameters
+    ----------
+    index : pd.Index
+        Index of the dimension.
+    labels : list or np.ndarray
+        Coordinate labels to look up.
+    dim_name : str
+        Name of the dimension.
+
+    Returns
+    -------
+    slice or np.ndarray :
+        Slice or positional indices corresponding to the given labels.
+
+    """
+    idxs = None
+    if index.is_monotonic_increasing and index.is_unique:
+        # a binary search on sorted coordinates, e.g. time stamps, is cheaper than hashing each label
+        labels = np.asarray(labels)
+        idxs = index.searchsorted(labels)
+        is_found = idxs < len(index)
+        is_found[is_found] = index.to_numpy()[idxs[is_found]] == labels[is_found]
+        idxs = np.where(is_found, idxs, -1)
+    if idxs is None or np.any(idxs < 0):
+        # labels of other dtypes are compared with the more permissive lookup of pandas
+        idxs = index.get_indexer(labels)
+    if np.any(idxs < 0):
+        err_msg = f"Not all coordinates are available along dimension '{dim_name}'."
+        raise KeyError(err_msg)
+    if len(idxs) > 0 and np.all(np.diff(idxs) == 1):
+        return slice(int(idxs[0]), int(idxs[-1]) + 1)
+    return idxs
+
+
 if __name__ == '__main__':
     pass
@@ -5,26 +5,39 @@ import struct
 from zipfile import ZipFile
 import numpy as np
 from osgeo import gdal
-from typing import List
+from typing import List, Tuple, Iterator
 from collections import defaultdict
-import xml.etree.ElementTree as ET
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from xml.sax.saxutils import escape
 
 from veranda.utils import to_list
+from veranda.utils import accepts_out_arg
 from veranda.raster.gdalport import NUMPY_TO_GDAL_DTYPE, GDAL_TO_NUMPY_DTYPE
 
+_VRT_HEADER_TMPL = '<VRTDataset rasterXSize="{n_cols}" rasterYSize="{n_rows}">' \
+                   '<GeoTransform>{geotrans}</GeoTransform><SRS>{sref_wkt}</SRS>'
+_VRT_BAND_TMPL = '<VRTRasterBand dataType="{dtype}" band="{entry_idx}"><SimpleSource>' \
+                 '<SourceFilename relativetoVRT="0">{filepath}</SourceFilename><SourceBand>{band}</SourceBand>' \
+                 '<SourceProperties RasterXSize="{n_cols}" RasterYSize="{n_rows}" DataType="{dtype}" ' \
+                 'BlockXSize="{block_x_size}" BlockYSize="{block_y_size}" /></SimpleSource>' \
+                 '<NodataValue>{nodataval}</NodataValue><Scale>{scale_factor}</Scale><Offset>{offset}</Offset>' \
+                 '</VRTRasterBand>'
+_VRT_FOOTER = '</VRTDataset>'
+
 
 class GeoTiffFile:
     """ GDAL wrapper for reading or writing a GeoTIFF file. """
     def __init__(self, filepath, mode='r', geotrans=(0, 1, 0, 0, 0, 1), sref_wkt=None, raster_shape=None,
                  compression='LZW', metadata=None, is_bigtiff=False, is_tiled=True, blocksize=(512, 512),
                  n_bands=1, dtypes='uint8', scale_factors=1, offsets=0, nodatavals=255, color_tbls=None,
-                 color_intprs=None, overwrite=False, auto_decode=False):
+                 color_intprs=None, overwrite=False, auto_decode=False, n_threads=None, nbits=None):
         """
         Constructor of `GeoTiffFile`.
 
         Parameters
         ----------
-        filepath : str
+        filepath : str or os.PathLike
             Full file path to a GeoTIFF file.
         mode : str, optional
             File opening mode :
@@ -79,23 +92,33 @@ class GeoTiffFile:
         auto_decode : bool, optional
             True if data should be decoded according to the information available in its header.
             False if not (default).
+        n_threads : int or str, optional
+            Number of threads GDAL uses to (de-)compress the blocks of a compressed GeoTIFF file, e.g. 4 or
+            'ALL_CPUS'. Defaults to None, i.e. GDAL's default (single-threaded) behaviour is kept.
+        nbits : int, optional
+            Number of bits per sample (1 to 7 for 'uint8' data) used to store sub-byte data in a bit-packed way.
+            GDAL packs the data when writing and unpacks it to one value per byte when reading, so no unpacking is
+            necessary on the Python side. Defaults to None, i.e. the full width of the data type is used.
 
         """
         self.src = None
         self._driver = gdal.GetDriverByName('GTiff')
-        self.filepath = filepath
+        self.filepath = os.fspath(filepath)
         self.mode = mode
         self.geotrans = geotrans
         self.sref_wkt = sref_wkt
         self.raster_shape = raster_shape
         self.compression = compression
         self.metadata = dict() if metadata is None else metadata
-        self.is_bigtiff = is_bigtiff
+        self._is_bigtiff = is_bigtiff
         self.is_tiled = is_tiled
         self.blocksize = blocksize
         self.overwrite = overwrite
         self.auto_decode = auto_decode
+        self.n_threads = n_threads
+        self.nbits = nbits
         self.bands = list(range(1, n_bands + 1))
+        self._band_handles = dict()
 
         dtypes = self.__to_dict(dtypes)
         scale_factors = self.__to_dict(scale_factors)
@@ -113,6 +136,18 @@ class GeoTiffFile:
         """ Number of bands. """
         return len(self.bands)
 
+    @property
+    def is_bigtiff(self) -> bool:
+        """ True if the file is a BigTIFF file. For existing files, the header is only parsed on first access. """
+        if self._is_bigtiff is None:
+            self._is_bigtiff = self.is_file_bigtiff(self.filepath)
+        return self._is_bigtiff
+
+    @is_bigtiff.setter
+    def is_bigtiff(self, is_bigtiff):
+        """ Sets the BigTIFF flag. """
+        self._is_bigtiff = is_bigtiff
+
     @staticmethod
     def is_file_bigtiff(filepath) -> bool:
         """
@@ -120,7 +155,7 @@ class GeoTiffFile:
 
         Parameters
         ----------
-        filepath : str
+        filepath : str or os.PathLike
             Full file path to a GeoTIFF file.
 
         Returns
@@ -129,6 +164,7 @@ class GeoTiffFile:
             True if the given file is a BigTIFF, else False.
 
         """
+        filepath = os.fspath(filepath)
         if '.zip' in filepath:
             if filepath.startswith('/vsizip/'):
                 filepath = filepath[len('/vsizip/'):]  # removes gdal virtual file system prefix to open w ZipFile
@@ -171,7 +207,7 @@ class GeoTiffFile:
     @property
     def dtypes(self) -> List[str]:
         """ Data types in NumPy-style format. """
-        return [GDAL_TO_NUMPY_DTYPE[dtype] for dtype in self._dtypes.values()]
+        return list(self._np_dtypes.values())
 
     def _open(self):
         """
@@ -196,14 +232,18 @@ class GeoTiffFile:
             elif not os.path.exists(self.filepath):
                 err_msg = f"File '{self.filepath}' does not exist."
                 raise FileNotFoundError(err_msg)
-            self.src = gdal.Open(self.filepath, gdal.GA_ReadOnly)
+            open_options = [] if self.n_threads is None else [f'NUM_THREADS={self.n_threads}']
+            self.src = gdal.OpenEx(self.filepath, gdal.OF_RASTER | gdal.OF_READONLY, open_options=open_options)
             self.raster_shape = self.src.RasterYSize, self.src.RasterXSize
+            self.__set_band_handles(range(1, self.src.RasterCount + 1))
             self.geotrans = self.src.GetGeoTransform()
             self.sref_wkt = self.src.GetProjection()
             self.metadata = self.src.GetMetadata()
-            self.blocksize = self.src.GetRasterBand(1).GetBlockSize()  # block seems to be band-independent, because no set function is available per band
+            self.blocksize = self._band_handles[1].GetBlockSize()  # block seems to be band-independent, because no set function is available per band
+            nbits = self._band_handles[1].GetMetadataItem('NBITS', 'IMAGE_STRUCTURE')
+            self.nbits = None if nbits is None else int(nbits)
             self.compression = self.src.GetMetadata('IMAGE_STRUCTURE').get('COMPRESSION')
-            self.is_bigtiff = self.is_file_bigtiff(self.filepath)
+            self._is_bigtiff = None  # the file header is only read if this information is requested
             self.is_tiled = self.blocksize[1] == 1
             self.__set_coding_info_from_file()
         elif self.mode == 'w':
@@ -214,6 +254,7 @@ class GeoTiffFile:
                     err_msg = f"File '{self.filepath}' exists."
                     raise FileExistsError(err_msg)
             self.__create_driver()
+            self.__set_band_handles(self.bands)
             self.src.SetGeoTransform(self.geotrans)
             if self.sref_wkt is not None:
                 self.src.SetProjection(self.sref_wkt)
@@ -230,7 +271,8 @@ class GeoTiffFile:
             err_msg = f"Open failed: {self.filepath}"
             raise IOError(err_msg)
 
-    def read(self, row=0, col=0, n_rows=None, n_cols=None, bands=None, decoder=None, decoder_kwargs=None) -> dict:
+    def read(self, row=0, col=0, n_rows=None, n_cols=None, bands=None, decoder=None, decoder_kwargs=None,
+             out=None, align_to_blocks=False) -> dict:
         """
         Read data from a GeoTIFF file.
 
@@ -250,9 +292,19 @@ class GeoTiffFile:
             Band numbers of the GeoTIFF file to read data from. Defaults to None, i.e. all available bands will be
             used.
         decoder : callable, optional
-            Decoding function expecting a NumPy array as input.
+            Decoding function expecting a NumPy array as input. If it accepts an `out` keyword argument, the arrays
+            given by `out` are passed as output buffers to allow in-place decoding.
         decoder_kwargs : dict, optional
             Keyword arguments for the decoder.
+        out : dict, optional
+            Dictionary mapping band numbers to pre-allocated 2D NumPy arrays (or views of them) with the shape of the
+            reading window. Data of these bands is directly read into the given arrays by GDAL, instead of allocating
+            new ones.
+        align_to_blocks : bool, optional
+            If True, the reading window is extended to the block boundaries of the file before it is passed to GDAL
+            and the requested window is sliced from the result afterwards (only applies if `out` is not given). This
+            avoids partially requested blocks at the window edges, e.g. when successively reading neighbouring windows
+            of a cloud-optimised GeoTIFF. Defaults to False.
 
         Returns
         -------
@@ -262,15 +314,73 @@ class GeoTiffFile:
         """
 
         decoder_kwargs = decoder_kwargs or dict()
+        out = out or dict()
         n_rows = self.raster_shape[0] if n_rows is None else n_rows
         n_cols = self.raster_shape[1] if n_cols is None else n_cols
         bands = bands or self.bands
         bands = to_list(bands)
 
-        data = {band: self._read_band(band, col, row, n_cols, n_rows, decoder, decoder_kwargs) for band in bands}
+        if (len(bands) > 1 or align_to_blocks) and not out:
+            # fetch all bands with one dataset-level request, so that GDAL decompresses pixel-interleaved blocks only
+            # once and the GIL is released only once
+            read_window = self.__get_block_aligned_window(row, col, n_rows, n_cols) if align_to_blocks else \
+                (row, col, n_rows, n_cols)
+            buf_type = None
+            if self.auto_decode:
+                # GDAL converts the raw values to floating point while reading, so the data can be decoded in-place
+                dtype = np.result_type(*[self._np_dtypes[int(band)] for band in bands], np.float32)
+                buf_type = NUMPY_TO_GDAL_DTYPE[dtype.name]
+            bands_data = self.src.ReadAsArray(read_window[1], read_window[0], read_window[3], read_window[2],
+                                              band_list=[int(band) for band in bands], buf_type=buf_type)
+            bands_data = bands_data.reshape((len(bands), read_window[2], read_window[3]))
+            row_start, col_start = row - read_window[0], col - read_window[1]
+            bands_data = bands_data[:, row_start:row_start + n_rows, col_start:col_start + n_cols]
+            data = {band: self._decode_band(band, bands_data[i], decoder, decoder_kwargs, inplace=self.auto_decode)
+                    for i, band in enumerate(bands)}
+        else:
+            data = {band: self._read_band(band, col, row, n_cols, n_rows, decoder, decoder_kwargs, out=out.get(band))
+                    for band in bands}
 
         return data
 
+    def iter_block_windows(self, order='hilbert') -> Iterator[Tuple[int, int, int, int]]:
+        """
+        Iterates over the blocks of the file, e.g. to process a large file piece by piece. Neighbouring blocks are
+        visited close in time when using a space-filling curve, which increases the hit rate of GDAL's block cache
+        if the processing needs data from adjacent blocks. Pairs well with `read(..., align_to_blocks=True)`.
+
+        Parameters
+        ----------
+        order : str, optional
+            Order in which the blocks are visited:
+                - 'hilbert' : along a Hilbert curve (default)
+                - 'morton' : along a Morton/Z-order curve
+                - 'row' : row by row
+
+        Returns
+        -------
+        4-tuple :
+            Row, column, number of rows and number of columns of a block window, clipped to the raster extent.
+
+        """
+        n_rows, n_cols = self.raster_shape
+        block_x_size, block_y_size = self.blocksize
+        n_block_rows, n_block_cols = -(-n_rows // block_y_size), -(-n_cols // block_x_size)
+        block_rows, block_cols = np.divmod(np.arange(n_block_rows * n_block_cols), n_block_cols)
+        if order == 'hilbert':
+            block_idxs = np.argsort(_hilbert_index(block_cols, block_rows), kind='stable')
+        elif order == 'morton':
+            block_idxs = np.argsort(_morton_index(block_cols, block_rows), kind='stable')
+        elif order == 'row':
+            block_idxs = np.arange(len(block_rows))
+        else:
+            err_msg = f"Block order '{order}' is not supported!"
+            raise ValueError(err_msg)
+
+        for block_idx in block_idxs:
+            row, col = int(block_rows[block_idx]) * block_y_size, int(block_cols[block_idx]) * block_x_size
+            yield row, col, min(block_y_size, n_rows - row), min(block_x_size, n_cols - col)
+
     def write(self, data, row=0, col=0, encoder=None, encoder_kwargs=None):
         """
         Writes a NumPy array to a GeoTIFF file.
@@ -308,10 +418,82 @@ class GeoTiffFile:
             self.raster_shape = data_shape
             self._open()
 
-        for band in data_bands:
-            self._write_band(band, col, row, data_write[band], encoder, encoder_kwargs)
+        band_dtypes = {data_write[band].dtype.name for band in data_bands}
+        band_dtype = band_dtypes.pop() if len(band_dtypes) == 1 else None
+        if encoder is None and len(data_bands) > 1 and band_dtype in NUMPY_TO_GDAL_DTYPE \
+                and band_dtype not in ['bool', 'int8']:
+            # one dataset-level write lets GDAL skip the block cache instead of filling it band by band
+            buf = np.stack([data_write[band] for band in data_bands])  # a new C-contiguous array
+            err_code = self.src.WriteRaster(col, row, data_shape[1], data_shape[0], buf,
+                                            buf_xsize=data_shape[1], buf_ysize=data_shape[0],
+                                            buf_type=NUMPY_TO_GDAL_DTYPE[band_dtype], band_list=data_bands)
+            if err_code != gdal.CE_None:
+                err_msg = f"Writing a window of {data_shape[0]}x{data_shape[1]} pixels at row {row} and column " \
+                          f"{col} to '{self.filepath}' failed: {gdal.GetLastErrorMsg()}"
+                raise IOError(err_msg)
+        else:
+            for band in data_bands:
+                self._write_band(band, col, row, data_write[band], encoder, encoder_kwargs)
+
+    def update_band_metadata(self, nodatavals=None, scale_factors=None, offsets=None):
+        """
+        Updates the no data values, scale factors, and/or offsets of an open GeoTIFF file in write mode. These
+        attributes are set once when the file is created and are not touched by `write`, so this function needs to be
+        called if they should change between two writes.
+
+        Parameters
+        ----------
+        nodatavals : dict or number, optional
+            No data value(s) per band or for all bands.
+        scale_factors : dict or number, optional
+            Scale factor(s) per band or for all bands.
+        offsets : dict or number, optional
+            Offset(s) per band or for all bands.
+
+        """
+        if self.mode != 'w':
+            err_msg = "Wrong mode for updating the band metadata of a GeoTIFF file (use 'w')."
+            raise IOError(err_msg)
+
+        if nodatavals is not None:
+            self._nodatavals.update(self.__to_dict(nodatavals))
+        if scale_factors is not None:
+            self._scale_factors.update(self.__to_dict(scale_factors))
+        if offsets is not None:
+            self._offsets.update(self.__to_dict(offsets))
+
+        if self.src is not None:
+            self.__set_band_metadata()
 
-    def _read_band(self, band, col, row, n_cols, n_rows, decoder, decoder_kwargs) -> np.ndarray:
+    def __get_block_aligned_window(self, row, col, n_rows, n_cols) -> Tuple[int, int, int, int]:
+        """
+        Extends a pixel window to the block boundaries of the file.
+
+        Parameters
+        ----------
+        row : int
+            Row number/index.
+        col : int
+            Column number/index.
+        n_rows : int
+            Number of rows of the window.
+        n_cols : int
+            Number of columns of the window.
+
+        Returns
+        -------
+        4-tuple :
+            Row, column, number of rows and number of columns of the block-aligned window, clipped to the raster
+            extent.
+
+        """
+        block_x_size, block_y_size = self.blocksize
+        row_min, col_min = (row // block_y_size) * block_y_size, (col // block_x_size) * block_x_size
+        row_max = min(-(-(row + n_rows) // block_y_size) * block_y_size, self.raster_shape[0])
+        col_max = min(-(-(col + n_cols) // block_x_size) * block_x_size, self.raster_shape[1])
+        return row_min, col_min, row_max - row_min, col_max - col_min
+
+    def _read_band(self, band, col, row, n_cols, n_rows, decoder, decoder_kwargs, out=None) -> np.ndarray:
         """
         Reads and decodes data per band.
 
@@ -331,6 +513,44 @@ class GeoTiffFile:
             Decoding function expecting a NumPy array as input.
         decoder_kwargs : dict
             Keyword arguments for the decoder.
+        out : np.ndarray, optional
+            Pre-allocated array to read the data into. If the data is decoded into a new array, the result is copied
+            to `out` as well.
+
+        Returns
+        -------
+        band_data : np.ndarray
+            Decoded band data.
+
+        """
+        band = int(band)
+        if self.auto_decode and out is None:
+            # GDAL converts the raw values to floating point while reading, so the data can be decoded in-place
+            buf_type = NUMPY_TO_GDAL_DTYPE[np.result_type(self._np_dtypes[band], np.float32).name]
+            band_data = self._band_handles[band].ReadAsArray(col, row, n_cols, n_rows, buf_type=buf_type)
+            return self._decode_band(band, band_data, decoder, decoder_kwargs, inplace=True)
+        band_data = self._band_handles[band].ReadAsArray(col, row, n_cols, n_rows, buf_obj=out)
+        return self._decode_band(band, band_data, decoder, decoder_kwargs, out=out)
+
+    def _decode_band(self, band, band_data, decoder, decoder_kwargs, out=None, inplace=False) -> np.ndarray:
+        """
+        Decodes data of a specific band read from disk.
+
+        Parameters
+        ----------
+        band : int
+            Band number.
+        band_data : np.ndarray
+            Raw band data.
+        decoder : callable
+            Decoding function expecting a NumPy array as input.
+        decoder_kwargs : dict
+            Keyword arguments for the decoder.
+        out : np.ndarray, optional
+            Pre-allocated array the data has been read into. If the data is decoded into a new array, the result is
+            copied to `out` as well.
+        inplace : bool, optional
+            True if `band_data` may be modified when it is automatically decoded. Defaults to False.
 
         Returns
         -------
@@ -339,20 +559,25 @@ class GeoTiffFile:
 
         """
         band = int(band)
-        band_data = self.src.GetRasterBand(band).ReadAsArray(col, row, n_cols, n_rows)
         scale_factor = self._scale_factors[band]
         nodataval = self._nodatavals[band]
         offset = self._offsets[band]
         if self.auto_decode:
-            band_data = band_data.astype(float)
-            band_data[band_data == nodataval] = np.nan
-            band_data = band_data * scale_factor + offset
+            band_data = decode_band_data(band_data, nodataval=nodataval, scale_factor=scale_factor, offset=offset,
+                                         inplace=inplace)
         else:
             if decoder is not None:
-                dtype = GDAL_TO_NUMPY_DTYPE(self._dtypes[band])
+                dtype = self._np_dtypes[band]
+                if out is not None and out.dtype == band_data.dtype and accepts_out_arg(decoder):
+                    # the decoder is able to write into the pre-allocated array the data has been read into, which
+                    # already has the target data type (the raw data type could truncate e.g. scaled values)
+                    decoder_kwargs = dict(decoder_kwargs, out=band_data)
                 band_data = decoder(band_data, nodataval=nodataval, band=band, scale_factor=scale_factor,
                                     offset=offset, dtype=dtype, **decoder_kwargs)
 
+        if out is not None and band_data is not out:
+            out[...] = band_data
+
         return band_data
 
     def _write_band(self, band, col, row, data, encoder, encoder_kwargs):
@@ -379,8 +604,8 @@ class GeoTiffFile:
         scale_factor = self._scale_factors[band]
         offset = self._offsets[band]
         if encoder is not None:
-            dtype = GDAL_TO_NUMPY_DTYPE(self._dtypes[band])
-            self.src.GetRasterBand(band).WriteArray(encoder(data,
+            dtype = self._np_dtypes[band]
+            self._band_handles[band].WriteArray(encoder(data,
                                                             band=band,
                                                             nodataval=nodataval,
                                                             scale_factor=scale_factor,
@@ -389,7 +614,7 @@ class GeoTiffFile:
                                                             **encoder_kwargs),
                                                     xoff=col, yoff=row)
         else:
-            self.src.GetRasterBand(band).WriteArray(data, xoff=col, yoff=row)
+            self._band_handles[band].WriteArray(data, xoff=col, yoff=row)
 
     def __set_coding_info_from_input(self, nodatavals, scale_factors, offsets, dtypes, color_tbls, color_intprs):
         """
@@ -418,6 +643,7 @@ class GeoTiffFile:
         self._color_tbls = dict()
         self._color_intprs = dict()
         self._dtypes = dict()
+        self._band_index = {band: b_idx for b_idx, band in enumerate(self.bands)}
         for band in self.bands:
             self._dtypes[band] = NUMPY_TO_GDAL_DTYPE[dtypes.get(band, 'uint8')]
             self._scale_factors[band] = scale_factors.get(band, 1)
@@ -425,6 +651,7 @@ class GeoTiffFile:
             self._nodatavals[band] = nodatavals.get(band, 255)
             self._color_tbls[band] = color_tbls.get(band, None)
             self._color_intprs[band] = color_intprs.get(band, None)
+        self._np_dtypes = {band: GDAL_TO_NUMPY_DTYPE[dtype] for band, dtype in self._dtypes.items()}
 
     def __set_coding_info_from_file(self):
         """
@@ -441,14 +668,16 @@ class GeoTiffFile:
         self._dtypes = dict()
         for band in range(1, self.src.RasterCount + 1):
             self.bands.append(band)
-            scale_factor = self.src.GetRasterBand(band).GetScale()
-            offset = self.src.GetRasterBand(band).GetOffset()
+            scale_factor = self._band_handles[band].GetScale()
+            offset = self._band_handles[band].GetOffset()
             self._scale_factors[band] = scale_factor or 1
             self._offsets[band] = offset or 0
-            self._nodatavals[band] = self.src.GetRasterBand(band).GetNoDataValue()
-            self._color_tbls[band] = self.src.GetRasterBand(band).GetColorTable()
-            self._color_intprs[band] = self.src.GetRasterBand(band).GetColorInterpretation()
-            self._dtypes[band] = self.src.GetRasterBand(band).DataType
+            self._nodatavals[band] = self._band_handles[band].GetNoDataValue()
+            self._color_tbls[band] = self._band_handles[band].GetColorTable()
+            self._color_intprs[band] = self._band_handles[band].GetColorInterpretation()
+            self._dtypes[band] = self._band_handles[band].DataType
+        self._band_index = {band: b_idx for b_idx, band in enumerate(self.bands)}
+        self._np_dtypes = {band: GDAL_TO_NUMPY_DTYPE[dtype] for band, dtype in self._dtypes.items()}
 
     def __create_driver(self):
         """ Creates a new GDAL dataset/driver. """
@@ -458,18 +687,39 @@ class GeoTiffFile:
         gdal_opt['BLOCKXSIZE'] = str(self.blocksize[0])
         gdal_opt['BLOCKYSIZE'] = str(self.blocksize[1])
         gdal_opt['BIGTIFF'] = 'YES' if self.is_bigtiff else 'NO'
+        if self.n_threads is not None:
+            gdal_opt['NUM_THREADS'] = str(self.n_threads)
+        if self.nbits is not None:
+            gdal_opt['NBITS'] = str(self.nbits)
         gdal_opt = ['='.join((k, v)) for k, v in gdal_opt.items()]
         self.src = self._driver.Create(self.filepath, self.raster_shape[1], self.raster_shape[0],
-                                       self.n_bands, NUMPY_TO_GDAL_DTYPE[self.dtypes[0]],
+                                       self.n_bands, self._dtypes[self.bands[0]],
                                        options=gdal_opt)
 
+    def __set_band_handles(self, bands):
+        """
+        Retrieves the GDAL band objects once, so that they do not need to be resolved again for each read or write.
+
+        Parameters
+        ----------
+        bands : iterable of int
+            Band numbers.
+
+        """
+        self._band_handles = {band: self.src.GetRasterBand(band) for band in bands}
+
     def __set_bands(self):
         """ Sets band attributes, i.e. default/fill value, no data value, scale factor, and offset. """
         for band in self.bands:
-            self.src.GetRasterBand(band).Fill(int(self._nodatavals[band]))
-            self.src.GetRasterBand(band).SetNoDataValue(float(self._nodatavals[band]))
-            self.src.GetRasterBand(band).SetScale(self._scale_factors[band])
-            self.src.GetRasterBand(band).SetOffset(self._offsets[band])
+            self._band_handles[band].Fill(int(self._nodatavals[band]))
+        self.__set_band_metadata()
+
+    def __set_band_metadata(self):
+        """ Sets the dataset-lifetime band metadata, i.e. no data value, scale factor, and offset. """
+        for band in self.bands:
+            self._band_handles[band].SetNoDataValue(float(self._nodatavals[band]))
+            self._band_handles[band].SetScale(self._scale_factors[band])
+            self._band_handles[band].SetOffset(self._offsets[band])
 
     def __to_dict(self, arg) -> dict:
         """
@@ -500,6 +750,7 @@ class GeoTiffFile:
         """
         Close the dataset.
         """
+        self._band_handles = dict()  # band objects keep a reference to the dataset
         self.src = None
 
     def __enter__(self):
@@ -509,7 +760,117 @@ class GeoTiffFile:
         self.close()
 
 
-def create_vrt_file(filepaths, vrt_filepath, shape, sref_wkt, geotrans, bands=1):
+def decode_band_data(band_data, nodataval=None, scale_factor=1, offset=0, dtype=None, inplace=False) -> np.ndarray:
+    """
+    Decodes raw band data, i.e. converts it to floating point values, applies the scale factor and offset, and sets
+    no data values to NaN. The output array is allocated once while applying the scale factor and all remaining
+    operations are performed in-place to avoid allocating intermediate arrays.
+
+    Parameters
+    ----------
+    band_data : np.ndarray
+        Raw band data.
+    nodataval : number, optional
+        No data value of the band. Defaults to None, i.e. no pixels are set to NaN.
+    scale_factor : number, optional
+        Scale factor of the band. Defaults to 1.
+    offset : number, optional
+        Offset of the band. Defaults to 0.
+    dtype : str or np.dtype, optional
+        Floating point data type of the decoded data. Defaults to None, i.e. the smallest floating point type being
+        able to represent all raw values is used (float32 for 8- and 16-bit integers and float32 data, else float64).
+    inplace : bool, optional
+        If True and `band_data` already has the target data type, e.g. because GDAL has converted it while reading,
+        `band_data` is decoded in-place and no new array is allocated. Defaults to False.
+
+    Returns
+    -------
+    decoded_data : np.ndarray
+        Decoded band data.
+
+    """
+    dtype = np.result_type(band_data.dtype, np.float32) if dtype is None else np.dtype(dtype)
+    nodata_mask = band_data == nodataval if nodataval is not None else None
+    apply_scale = scale_factor is not None and scale_factor != 1
+    if inplace and band_data.dtype == dtype:
+        decoded_data = band_data
+        if apply_scale:
+            np.multiply(decoded_data, scale_factor, out=decoded_data, casting='unsafe')
+    elif apply_scale:
+        # the conversion and the scaling are done in one pass
+        decoded_data = np.multiply(band_data, scale_factor, dtype=dtype)
+    else:
+        decoded_data = band_data.astype(dtype)
+    if offset is not None and offset != 0:
+        np.add(decoded_data, offset, out=decoded_data, casting='unsafe')
+    if nodata_mask is not None:
+        np.copyto(decoded_data, np.nan, where=nodata_mask)
+
+    return decoded_data
+
+
+def _morton_index(x, y) -> np.ndarray:
+    """
+    Computes the position of 2D grid indices along a Morton/Z-order curve by interleaving their bits.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Column indices.
+    y : np.ndarray
+        Row indices.
+
+    Returns
+    -------
+    np.ndarray :
+        Morton indices.
+
+    """
+    x, y = np.asarray(x, dtype=np.uint64), np.asarray(y, dtype=np.uint64)
+    index = np.zeros(x.shape, dtype=np.uint64)
+    for bit in range(32):
+        bit = np.uint64(bit)
+        index |= ((x >> bit) & np.uint64(1)) << (np.uint64(2) * bit)
+        index |= ((y >> bit) & np.uint64(1)) << (np.uint64(2) * bit + np.uint64(1))
+    return index
+
+
+def _hilbert_index(x, y) -> np.ndarray:
+    """
+    Computes the position of 2D grid indices along a Hilbert curve covering the smallest power-of-two square
+    containing all indices.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Column indices.
+    y : np.ndarray
+        Row indices.
+
+    Returns
+    -------
+    np.ndarray :
+        Hilbert indices.
+
+    """
+    x, y = np.array(x, dtype=np.int64), np.array(y, dtype=np.int64)
+    index = np.zeros(x.shape, dtype=np.int64)
+    n = 1 << int(max(x.max(initial=0), y.max(initial=0))).bit_length()
+    s = n // 2
+    while s > 0:
+        rx = (x & s) > 0
+        ry = (y & s) > 0
+        index += s * s * ((3 * rx) ^ ry)
+        # rotate the quadrant, so that the curve is continuous
+        flip = ~ry & rx
+        x[flip], y[flip] = n - 1 - x[flip], n - 1 - y[flip]
+        swap = ~ry
+        x[swap], y[swap] = y[swap], x[swap]
+        s //= 2
+    return index
+
+
+def create_vrt_file(filepaths, vrt_filepath, shape, sref_wkt, geotrans, bands=1, probe_all=False):
     """
     Creates a VRT file stack from a list of file paths.
 
@@ -518,7 +879,8 @@ def create_vrt_file(filepaths, vrt_filepath, shape, sref_wkt, geotrans, bands=1)
     filepaths : list of str
         Full system path to the files to stack.
     vrt_filepath : str
-        Full system path to the VRT file to create.
+        Full system path to the VRT file to create. Paths starting with '/vsimem/' are kept in GDAL's in-memory
+        file system and need to be removed with `gdal.Unlink` afterwards.
     shape : 2-tuple
         Shape (rows, columns) of the raster stack.
     sref_wkt : str
@@ -533,37 +895,65 @@ def create_vrt_file(filepaths, vrt_filepath, shape, sref_wkt, geotrans, bands=1)
             5: N-S pixel sampling (negative value if North-up)
     bands : tuple or list or int, optional
         Band number(s). Defaults to 1.
+    probe_all : bool, optional
+        If True, the coding information (no data value, scale factor, offset) is read from every file, which is
+        done concurrently with a thread pool since opening many files is latency-bound. If False (default), all
+        files are assumed to share the coding information of the first file.
 
     """
+    vrt_filepath = os.fspath(vrt_filepath)
     n_filepaths = len(filepaths)
     bands = to_list(bands)
     n_bands = len(bands)
     n_rows, n_cols = shape
 
-    ref_filepath = filepaths[0]
-    band_attr_dict = defaultdict(list)
-    with GeoTiffFile(ref_filepath, 'r') as gt_file:
-        for band in bands:
-            band_attr_dict = _read_band_attributes(gt_file, band, band_attr_dict)
-
-    attrib = {"rasterXSize": str(n_cols), "rasterYSize": str(n_rows)}
-    vrt_root = ET.Element("VRTDataset", attrib=attrib)
-
-    geot_elem = ET.SubElement(vrt_root, "GeoTransform")
-    geot_elem.text = ",".join(map(str, geotrans))
-
-    geot_elem = ET.SubElement(vrt_root, "SRS")
-    geot_elem.text = sref_wkt
+    if probe_all:
+        with ThreadPoolExecutor(max_workers=min(32, n_filepaths)) as executor:
+            band_attr_dicts = list(executor.map(partial(_probe_band_attributes, bands=bands), filepaths))
+    else:
+        band_attr_dicts = [_probe_band_attributes(filepaths[0], bands)] * n_filepaths
 
+    vrt_entries = [_VRT_HEADER_TMPL.format(n_cols=n_cols, n_rows=n_rows, geotrans=",".join(map(str, geotrans)),
+                                           sref_wkt=escape(sref_wkt or ""))]
     entry_idx = 1
     for f_idx in range(n_filepaths):
-        filepath = filepaths[f_idx]
+        filepath = escape(filepaths[f_idx])
         for band_idx in range(n_bands):
-            _fill_vrt_file_per_band(vrt_root, filepath, bands, band_idx, entry_idx, n_cols, n_rows, band_attr_dict)
+            vrt_entries.append(_format_vrt_band_entry(filepath, bands, band_idx, entry_idx, n_cols, n_rows,
+                                                      band_attr_dicts[f_idx]))
             entry_idx += 1
+    vrt_entries.append(_VRT_FOOTER)
 
-    tree = ET.ElementTree(vrt_root)
-    tree.write(vrt_filepath, encoding="UTF-8")
+    vrt_content = "".join(vrt_entries).encode("UTF-8")
+    if vrt_filepath.startswith('/vsimem/'):
+        gdal.FileFromMemBuffer(vrt_filepath, vrt_content)
+    else:
+        with open(vrt_filepath, 'wb') as vrt_file:
+            vrt_file.write(vrt_content)
+
+
+def _probe_band_attributes(filepath, bands) -> dict:
+    """
+    Reads the coding information of the given bands from a GeoTIFF file.
+
+    Parameters
+    ----------
+    filepath : str
+        Full system path to a GeoTIFF file.
+    bands : list of int
+        Band numbers.
+
+    Returns
+    -------
+    band_attr_dict : dict
+        Dictionary storing coding information for the GeoTIFF bands.
+
+    """
+    band_attr_dict = defaultdict(list)
+    with GeoTiffFile(filepath, 'r') as gt_file:
+        for band in bands:
+            band_attr_dict = _read_band_attributes(gt_file, band, band_attr_dict)
+    return band_attr_dict
 
 
 def _read_band_attributes(gt_file, band, attr_dict) -> dict:
@@ -586,25 +976,23 @@ def _read_band_attributes(gt_file, band, attr_dict) -> dict:
         Updated attributes dictionary.
 
     """
-    b_idx = list(gt_file.bands).index(band)
+    b_idx = gt_file._band_index[band]
     attr_dict['nodataval'].append(gt_file.nodatavals[b_idx])
     attr_dict['scale_factor'].append(gt_file.scale_factors[b_idx])
     attr_dict['offset'].append(gt_file.offsets[b_idx])
-    attr_dict['dtype'].append(gdal.GetDataTypeName(NUMPY_TO_GDAL_DTYPE[gt_file.dtypes[b_idx]]))
+    attr_dict['dtype'].append(gdal.GetDataTypeName(gt_file._dtypes[band]))
     attr_dict['blocksize'].append(gt_file.blocksize)
     return attr_dict
 
 
-def _fill_vrt_file_per_band(et_root, filepath, bands, band_idx, entry_idx, n_cols, n_rows, band_attr_dict):
+def _format_vrt_band_entry(filepath, bands, band_idx, entry_idx, n_cols, n_rows, band_attr_dict) -> str:
     """
-    Writes all band-relevant information to a new entry in the element tree representing the VRT file, in-place.
+    Formats all band-relevant information as a new VRT band entry.
 
     Parameters
     ----------
-    et_root : ET.Element
-        Root element of element tree/VRT file.
     filepath : str
-        Full system file path to GeoTIFF file.
+        Full system file path to GeoTIFF file (XML-escaped).
     bands : list of int
         Band numbers.
     band_idx : int
@@ -618,28 +1006,19 @@ def _fill_vrt_file_per_band(et_root, filepath, bands, band_idx, entry_idx, n_col
     band_attr_dict : dict
         Dictionary storing coding information for a GeoTIFF band.
 
-    """
-    band = bands[band_idx]
-    attrib = {"dataType": band_attr_dict['dtype'][band_idx], "band": str(entry_idx)}
-    band_elem = ET.SubElement(et_root, "VRTRasterBand", attrib=attrib)
-    simsrc_elem = ET.SubElement(band_elem, "SimpleSource")
-    attrib = {"relativetoVRT": "0"}
-    file_elem = ET.SubElement(simsrc_elem, "SourceFilename", attrib=attrib)
-    file_elem.text = filepath
-    ET.SubElement(simsrc_elem, "SourceBand").text = str(band)
-
-    attrib = {"RasterXSize": str(n_cols), "RasterYSize": str(n_rows),
-              "DataType": band_attr_dict['dtype'][band_idx],
-              "BlockXSize": str(band_attr_dict['blocksize'][band_idx][0]),
-              "BlockYSize": str(band_attr_dict['blocksize'][band_idx][1])}
-
-    file_elem = ET.SubElement(simsrc_elem, "SourceProperties", attrib=attrib)
+    Returns
+    -------
+    str :
+        XML string of the VRT band entry.
 
+    """
     scale_factor = band_attr_dict['scale_factor'][band_idx]
     scale_factor = 1 if scale_factor is None else scale_factor
-    ET.SubElement(band_elem, "NodataValue").text = str(band_attr_dict['nodataval'][band_idx])
-    ET.SubElement(band_elem, "Scale").text = str(scale_factor)
-    ET.SubElement(band_elem, "Offset").text = str(band_attr_dict['offset'][band_idx])
+    block_x_size, block_y_size = band_attr_dict['blocksize'][band_idx]
+    return _VRT_BAND_TMPL.format(dtype=band_attr_dict['dtype'][band_idx], entry_idx=entry_idx, filepath=filepath,
+                                 band=bands[band_idx], n_cols=n_cols, n_rows=n_rows, block_x_size=block_x_size,
+                                 block_y_size=block_y_size, nodataval=band_attr_dict['nodataval'][band_idx],
+                                 scale_factor=scale_factor, offset=band_attr_dict['offset'][band_idx])
 
 
 if __name__ == '__main__':
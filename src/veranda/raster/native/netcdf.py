@@ -4,11 +4,13 @@ import os.path
 from collections import OrderedDict
 import netCDF4
 import numpy as np
+import dask.array as da
 from affine import Affine
 import rioxarray as rio
 import xarray as xr
 from osgeo import osr
 from veranda.utils import to_list
+from veranda.utils import attrs_equal
 from typing import Tuple
 
 
@@ -25,14 +27,14 @@ class NetCdf4File:
 
     def __init__(self, filepath, mode="r", data_variables=None, stack_dims=None, space_dims=None, scale_factors=1,
                  offsets=0, nodatavals=127, dtypes='int8', zlibs=True, complevels=2, chunksizes=None,
-                 var_chunk_caches=None, attrs=None, geotrans=(0, 1, 0, 0, 0, 1), sref_wkt=None,
+                 var_chunk_caches=None, compressions=None, attrs=None, geotrans=(0, 1, 0, 0, 0, 1), sref_wkt=None,
                  metadata=None, nc_format="NETCDF4_CLASSIC", overwrite=True, auto_decode=False):
         """
         Constructor of `NetCdf4File`.
 
         Parameters
         ----------
-        filepath : str
+        filepath : str or os.PathLike
             Full system path to a NetCDF file.
         mode : str, optional
             File opening mode. The following modes are available:
@@ -77,6 +79,13 @@ class NetCdf4File:
             Defaults to None, i.e. the default NetCDF4 settings are used. It can either be one value/3-tuple (will be
             used for all data variables), or a dictionary mapping the data variable with the respective chunk cache
             settings.
+        compressions : dict or str, optional
+            Compression filters supported by the netCDF4 library (>= 1.6), e.g. 'zstd', which is usually faster and
+            compresses scientific raster data better than ZLIB when combined with the (default) shuffle filter. If
+            set, it takes precedence over `zlibs` and is applied with the respective compression level. Defaults to
+            None, i.e. only `zlibs` is used. It can either be one value (will be used for all data variables), or a
+            dictionary mapping the data variable with the respective compression filter. Note that reading such files
+            requires a netCDF/HDF5 library supporting the filter.
         attrs : dict, optional
             Data variable specific attributes. This can be an important parameter, when for instance setting the units
             of a data variable. Defaults to None. It can either be one dictionary (will be used for all data variables,
@@ -111,7 +120,8 @@ class NetCdf4File:
 
         self.src = None
         self.src_vars = {}
-        self.filepath = filepath
+        self._written_ncattrs = dict()
+        self.filepath = os.fspath(filepath)
         self.mode = mode
         self.data_variables = to_list(data_variables)
         self.sref_wkt = sref_wkt
@@ -136,6 +146,7 @@ class NetCdf4File:
         zlibs = self.__to_dict(zlibs)
         complevels = self.__to_dict(complevels)
         var_chunk_caches = self.__to_dict(var_chunk_caches)
+        self._compressions = compressions  # resolved when creating a variable, since data variables may be unknown yet
 
         self.__set_coding_info_from_input(nodatavals, scale_factors, offsets, dtypes, zlibs, complevels, chunksizes,
                                           var_chunk_caches)
@@ -178,15 +189,16 @@ class NetCdf4File:
             self.data_variables = list(ds.data_vars.keys())
 
         space_dims = list(self.space_dims.keys())
-        self.space_dims[space_dims[0]] = self.space_dims[space_dims[0]] or len(ds[space_dims[0]])
-        self.space_dims[space_dims[1]] = self.space_dims[space_dims[1]] or len(ds[space_dims[1]])
-        stack_dims = {dim: len(ds[dim]) for dim in ds.dims if dim not in space_dims}
+        self.space_dims[space_dims[0]] = self.space_dims[space_dims[0]] or ds.sizes[space_dims[0]]
+        self.space_dims[space_dims[1]] = self.space_dims[space_dims[1]] or ds.sizes[space_dims[1]]
+        stack_dims = {dim: size for dim, size in ds.sizes.items() if dim not in space_dims}
         stack_dims.update(self.stack_dims)
         self.stack_dims = stack_dims
         self.__set_coding_from_xarray(ds)
 
     def _open(self):
         """ Internal method for opening a NetCDF file. """
+        self._written_ncattrs = dict()
         if self.mode == "r":
             self.__open_read()
         if self.mode == "a":
@@ -326,11 +338,15 @@ class NetCdf4File:
         var_chunk_cache = self._var_chunk_caches[data_var_name]
         nodataval = self.nodatavals[data_var_name]
         dtype = self.dtypes[data_var_name]
+        compression = self._compressions.get(data_var_name) if isinstance(self._compressions, dict) \
+            else self._compressions
+        # the compression keyword is only passed if needed to stay compatible with older netCDF4 versions
+        compression_kwargs = dict() if compression is None else {'compression': compression}
 
         self.src_vars[data_var_name] = self.src.createVariable(
             data_var_name, dtype, dims,
             chunksizes=chunksizes, zlib=zlib,
-            complevel=complevel, fill_value=nodataval)
+            complevel=complevel, fill_value=nodataval, **compression_kwargs)
         self.src_vars[data_var_name].set_auto_scale(self.auto_decode)
 
         if var_chunk_cache is not None:
@@ -370,7 +386,7 @@ class NetCdf4File:
             self.__create_data_variable(data_variable)
 
     def read(self, row=0, col=0, n_rows=None, n_cols=None, data_variables=None, decoder=None,
-             decoder_kwargs=None) -> xr.Dataset:
+             decoder_kwargs=None, chunks=None) -> xr.Dataset:
         """
         Read data from a NetCDF file.
 
@@ -392,6 +408,10 @@ class NetCdf4File:
             Decoding function expecting a NumPy array as input.
         decoder_kwargs : dict, optional
             Keyword arguments for the decoder.
+        chunks : dict or str, optional
+            Chunk sizes of the lazily loaded (dask) data, given as a dictionary mapping dimension names to chunk sizes
+            or as 'auto'. Defaults to None, i.e. the chunking of the first data variable in the file is used. Data is
+            only read from disk for the chunks intersecting with the requested pixel window.
 
         Returns
         -------
@@ -403,18 +423,18 @@ class NetCdf4File:
         n_rows = self.raster_shape[0] if n_rows is None else n_rows
         n_cols = self.raster_shape[1] if n_cols is None else n_cols
         data_variables = data_variables or self.data_variables
-        chunks = self._get_chunks(data_variables[0])
+        chunks = chunks or self._get_chunks(data_variables[0])
         data_xr = xr.open_dataset(xr.backends.NetCDF4DataStore(self.src), mask_and_scale=self.auto_decode,
                                   chunks=chunks)
 
-        data = None
-        for data_variable in data_variables:
-            data = self._read_data_variable(data_xr, data_variable, row, col, n_rows, n_cols, decoder, decoder_kwargs,
-                                            data)
+        # collect all data variables first and create the dataset at once instead of merging them one by one
+        data = xr.Dataset({data_variable: self._read_data_variable(data_xr, data_variable, row, col, n_rows, n_cols,
+                                                                   decoder, decoder_kwargs)
+                           for data_variable in data_variables})
 
         return data
 
-    def write(self, ds, row=0, col=0, encoder=None, encoder_kwargs=None):
+    def write(self, ds, row=0, col=0, encoder=None, encoder_kwargs=None, append=None):
         """
         Write an xarray dataset into a NetCDF file.
 
@@ -430,9 +450,13 @@ class NetCdf4File:
             Encoding function expecting an xarray.DataArray as input.
         encoder_kwargs : dict, optional
             Keyword arguments for the encoder.
+        append : bool, optional
+            True if the data should be appended along the stack dimensions, False if it should be written from their
+            start. Defaults to None, i.e. data is only appended if the file has been opened in append mode.
 
         """
         encoder_kwargs = encoder_kwargs or dict()
+        append = self.mode == 'a' if append is None else append
         data_variables = list(ds.data_vars.keys())
         self._reset_from_ds(ds)
 
@@ -440,7 +464,7 @@ class NetCdf4File:
         if self.src is None:
             self._open()
 
-        stack_idxs = self._write_and_slice_stack_dim(ds)
+        stack_idxs = self._write_and_slice_stack_dim(ds, append)
         y_slice = self._write_and_slice_y_dim(ds, row)
         x_slice = self._write_and_slice_x_dim(ds, col)
         ds_idxs = stack_idxs + [y_slice] + [x_slice]
@@ -448,12 +472,66 @@ class NetCdf4File:
         for data_variable in data_variables:
             self._write_data_variable(ds, ds_idxs, data_variable, encoder, encoder_kwargs)
 
-        self.src.setncatts(ds.attrs)
-        self.src.setncatts(self.metadata)
+        self.__set_ncattrs(self.src, None, {**ds.attrs, **self.metadata})
 
-    def _read_data_variable(self, src, data_variable, row, col, n_rows, n_cols, decoder, decoder_kwargs, data=None):
+    def write_raw(self, data_variable, data, row=0, col=0, stack_idxs=None):
         """
-        Reads and slices variable specific data and optionally merges it with existing data.
+        Writes a NumPy array directly into a data variable of the NetCDF file, without any coordinate handling, encoding,
+        or attribute writing. This is intended for writing data into already defined dimensions and coordinates,
+        e.g. after the coordinates have been written with `write` or if they are known in advance.
+
+        Parameters
+        ----------
+        data_variable : str
+            Name of the data variable to write to.
+        data : np.ndarray
+            Data to write, already encoded to the on-disk representation of the data variable.
+        row : int, optional
+            Offset row number/index (defaults to 0).
+        col : int, optional
+            Offset column number/index (defaults to 0).
+        stack_idxs : list, optional
+            Indices or slices along the stack dimensions (defaults to the first elements of each stack dimension
+            matching the shape of `data`).
+
+        """
+        if self.src is None:
+            self._open()
+
+        if data_variable not in self.src_vars:
+            err_msg = f"Data variable '{data_variable}' is not available in the NetCDF file."
+            raise KeyError(err_msg)
+
+        n_rows, n_cols = data.shape[-2:]
+        stack_idxs = stack_idxs or [slice(0, n) for n in data.shape[:-2]]
+        ds_idxs = tuple(stack_idxs) + (slice(row, row + n_rows), slice(col, col + n_cols))
+        self.src_vars[data_variable][ds_idxs] = data
+
+    def __set_ncattrs(self, nc_obj, var_name, attrs):
+        """
+        Writes attributes to a NetCDF dataset or variable, unless the same attributes have already been written to it
+        since the file has been opened, which avoids rewriting unchanged attributes when writing data incrementally.
+
+        Parameters
+        ----------
+        nc_obj : netCDF4.Dataset or netCDF4.Variable
+            NetCDF dataset or variable to write the attributes to.
+        var_name : str or None
+            Name of the variable. None refers to the global attributes of the dataset.
+        attrs : dict
+            Attributes to write.
+
+        """
+        written_attrs = self._written_ncattrs.get(var_name)
+        if written_attrs is not None and attrs_equal(written_attrs, attrs):
+            return
+        nc_obj.setncatts(attrs)
+        self._written_ncattrs[var_name] = attrs
+
+    def _read_data_variable(self, src, data_variable, row, col, n_rows, n_cols, decoder,
+                            decoder_kwargs) -> xr.DataArray:
+        """
+        Reads and slices variable specific data.
 
         Parameters
         ----------
@@ -473,28 +551,24 @@ class NetCdf4File:
             Decoding function expecting a NumPy array as input.
         decoder_kwargs : dict
             Keyword arguments for the decoder.
-        data : xr.Dataset, optional
-            Existing dataset to merge with.
 
         Returns
         -------
-        data : xr.Dataset
-            Existing dataset (optional) plus data from the given data variable.
+        data_sliced : xr.DataArray
+            Data of the given data variable within the reading window.
 
         """
-        data_sliced = src[data_variable][..., row: row + n_rows, col: col + n_cols]
+        space_dims = list(self.space_dims.keys())
+        data_sliced = src[data_variable].isel({space_dims[0]: slice(row, row + n_rows),
+                                               space_dims[1]: slice(col, col + n_cols)})
         if decoder:
             data_sliced = decoder(data_sliced,
                                   nodataval=self.nodatavals[data_variable],
                                   data_variable=data_variable, scale_factor=self.scale_factors[data_variable],
                                   offset=self.offsets[data_variable], dtype=self.dtypes[data_variable],
                                   **decoder_kwargs)
-        if data is None:
-            data = data_sliced.to_dataset()
-        else:
-            data = data.merge(data_sliced.to_dataset())
 
-        return data
+        return data_sliced
 
     def _get_chunks(self, ref_data_var_name) -> dict:
         """
@@ -507,11 +581,14 @@ class NetCdf4File:
 
         Returns
         -------
-        chunks : dict
-            Maps dimension names with chunk size.
+        chunks : dict or str
+            Maps dimension names with chunk size. If the data variable is not chunked, 'auto' is returned to let dask
+            choose the chunk sizes.
 
         """
         ref_chunksize = self._chunksizes[ref_data_var_name]
+        if not isinstance(ref_chunksize, (tuple, list)):  # contiguous storage or unknown chunking
+            return 'auto'
         chunks = {stack_dim: ref_chunksize[i] for i, stack_dim in enumerate(self.stack_dims.keys())}
         space_dims = list(self.space_dims.keys())
         chunks[space_dims[0]] = ref_chunksize[-2]
@@ -562,7 +639,7 @@ class NetCdf4File:
         units = units or 'days since 1900-01-01 00:00:00'
         return netCDF4.date2num(ds[stack_dim].to_index().to_pydatetime(), units, calendar=calendar)
 
-    def _write_and_slice_stack_dim(self, ds) -> list:
+    def _write_and_slice_stack_dim(self, ds, append) -> list:
         """
         Writes coordinates of a stack dimension to its corresponding variable and returns a list of slices representing
         an indexing operation of the source data.
@@ -571,6 +648,9 @@ class NetCdf4File:
         ----------
         ds : xr.Dataset
             Xarray dataset.
+        append : bool
+            True if the coordinates should be appended to the existing ones, False if they should be written from the
+            start of the stack dimension.
 
         Returns
         -------
@@ -581,8 +661,8 @@ class NetCdf4File:
         ds_idxs = []
         for stack_dim in self.stack_dims.keys():
             # determine index where to append
-            if self.mode == 'a':
-                append_start = self.src_vars[stack_dim].shape[0]
+            if append:
+                append_start = self.__get_n_written_stack_vals(stack_dim)
             else:
                 append_start = 0
 
@@ -593,10 +673,35 @@ class NetCdf4File:
                 stack_vals = ds[stack_dim]
             n_stack_vals = len(stack_vals)
             self.src_vars[stack_dim][append_start:append_start + n_stack_vals] = stack_vals
-            ds_idxs.append(slice(append_start, None))
+            # the stack dimension can be longer than the data if it has a fixed length, so only the written part is
+            # selected
+            ds_idxs.append(slice(append_start, append_start + n_stack_vals))
 
         return ds_idxs
 
+    def __get_n_written_stack_vals(self, stack_dim) -> int:
+        """
+        Retrieves the number of coordinates already written along a stack dimension.
+
+        Parameters
+        ----------
+        stack_dim : str
+            Name of the stack dimension.
+
+        Returns
+        -------
+        int :
+            Number of written coordinates.
+
+        """
+        stack_var = self.src_vars[stack_dim]
+        if self.src.dimensions[stack_dim].isunlimited():
+            return stack_var.shape[0]
+        # fixed-length dimensions are allocated in advance, so the coordinates not written yet are set to the fill
+        # value
+        fill_value = getattr(stack_var, '_FillValue', netCDF4.default_fillvals[stack_var.dtype.str[1:]])
+        return int(np.count_nonzero(np.ma.getdata(stack_var[:]) != fill_value))
+
     def _write_and_slice_x_dim(self, ds, col) -> slice:
         """
         Writes coordinates of a X dimension to its corresponding variable and returns a slice representing an indexing
@@ -617,7 +722,7 @@ class NetCdf4File:
         """
         space_dims = list(self.space_dims.keys())
         dim_name = space_dims[1]
-        n_cols = len(ds[dim_name])
+        n_cols = ds.sizes[dim_name]
         if dim_name in ds.coords:
             self.src_vars[dim_name][col:col + n_cols] = ds[dim_name].data
         return slice(col, col + n_cols)
@@ -642,7 +747,7 @@ class NetCdf4File:
         """
         space_dims = list(self.space_dims.keys())
         dim_name = space_dims[0]
-        n_rows = len(ds[dim_name])
+        n_rows = ds.sizes[dim_name]
         if dim_name in ds.coords:
             self.src_vars[dim_name][row:row + n_rows] = ds[dim_name].data
         return slice(row, row + n_rows)
@@ -679,11 +784,15 @@ class NetCdf4File:
                                  **encoder_kwargs)
         else:
             data_write = ds[data_variable].data
-        self.src_vars[data_variable][ds_idxs] = data_write
-        dar_md = ds[data_variable].attrs
+        if isinstance(data_write, da.Array):
+            # write lazy data chunk by chunk instead of loading the whole array into memory at once
+            da.store(data_write, self.src_vars[data_variable], regions=tuple(ds_idxs), lock=True)
+        else:
+            self.src_vars[data_variable][ds_idxs] = data_write
+        dar_md = dict(ds[data_variable].attrs)  # copy to not alter the attributes of the input dataset
         dar_md.pop('_FillValue', None)  # remove this attribute because it already exists
         dar_md.update(self.attrs.get(data_variable, dict()))
-        self.src_vars[data_variable].setncatts(dar_md)
+        self.__set_ncattrs(self.src_vars[data_variable], data_variable, dar_md)
 
     def __set_coding_info_from_input(self, nodatavals, scale_factors, offsets, dtypes, zlibs,
                                      complevels, chunksizes, var_chunk_caches):
@@ -870,7 +979,7 @@ class NetCdfXrFile:
 
         Parameters
         ----------
-        filepath : str
+        filepath : str or os.PathLike
             Full system path to a NetCDF file.
         mode : str, optional
             File opening mode. The following modes are available:
@@ -941,7 +1050,7 @@ class NetCdfXrFile:
         """
 
         self.src = None
-        self.filepath = filepath
+        self.filepath = os.fspath(filepath)
         self.mode = mode
         self.data_variables = to_list(data_variables)
         self.sref_wkt = sref_wkt
@@ -1001,9 +1110,9 @@ class NetCdfXrFile:
 
     def _reset(self):
         """ Resets internal class variables with properties from an existing NetCDF dataset. """
-        stack_dims = list(set(self.src.dims.keys()) - set(self.space_dims))
+        stack_dims = list(set(self.src.sizes.keys()) - set(self.space_dims))
         if self.mode == 'r':
-            self.stack_dims = {stack_dim: len(self.src[stack_dim]) for stack_dim in stack_dims}
+            self.stack_dims = {stack_dim: self.src.sizes[stack_dim] for stack_dim in stack_dims}
 
         dims = stack_dims + self.space_dims
         if len(self.data_variables) == 0:
@@ -1056,7 +1165,7 @@ class NetCdfXrFile:
                                   (0.5 + np.arange(n_cols)) * self.geotrans[2]
 
     def read(self, row=0, col=0, n_rows=None, n_cols=None, data_variables=None, decoder=None,
-             decoder_kwargs=None) -> xr.Dataset:
+             decoder_kwargs=None, chunks=None) -> xr.Dataset:
         """
         Read mosaic from netCDF4 file.
 
@@ -1078,6 +1187,9 @@ class NetCdfXrFile:
             Decoding function expecting an xarray.DataArray as input.
         decoder_kwargs : dict, optional
             Keyword arguments for the decoder.
+        chunks : dict or str, optional
+            Chunk sizes of the lazily loaded (dask) data, given as a dictionary mapping dimension names to chunk sizes
+            or as 'auto'. Defaults to None, i.e. the chunking of the data variables in the file is used.
 
         Returns
         -------
@@ -1090,15 +1202,17 @@ class NetCdfXrFile:
         n_cols = self.raster_shape[1] if n_cols is None else n_cols
         data_variables = data_variables or self.data_variables
 
-        data = None
-        for data_variable in data_variables:
-            data = self._read_data_variable(data_variable, row, col, n_rows, n_cols, decoder, decoder_kwargs, data)
+        # collect all data variables first and create the dataset at once instead of merging them one by one
+        data = xr.Dataset({data_variable: self._read_data_variable(data_variable, row, col, n_rows, n_cols, decoder,
+                                                                   decoder_kwargs, chunks=chunks)
+                           for data_variable in data_variables})
 
         return data
 
-    def _read_data_variable(self, data_variable, row, col, n_rows, n_cols, decoder, decoder_kwargs, data=None):
+    def _read_data_variable(self, data_variable, row, col, n_rows, n_cols, decoder, decoder_kwargs,
+                            chunks=None) -> xr.DataArray:
         """
-        Reads and slices variable specific data and optionally merges it with existing data.
+        Reads and slices variable specific data.
 
         Parameters
         ----------
@@ -1116,18 +1230,22 @@ class NetCdfXrFile:
             Decoding function expecting an xarray.DataArray as input.
         decoder_kwargs : dict
             Keyword arguments for the decoder.
-        data : xr.Dataset, optional
-            Existing dataset to merge with.
+        chunks : dict or str, optional
+            Chunk sizes of the lazily loaded (dask) data. Defaults to None, i.e. the chunking of the data variable in
+            the file is used.
 
         Returns
         -------
-        data : xr.Dataset
-            Existing dataset (optional) plus data from the given data variable.
+        data_sliced : xr.DataArray
+            Data of the given data variable within the reading window.
 
         """
-        data_sliced = self.src[data_variable][..., row: row + n_rows, col: col + n_cols]
+        data_sliced = self.src[data_variable].isel({self.space_dims[0]: slice(row, row + n_rows),
+                                                    self.space_dims[1]: slice(col, col + n_cols)})
         ref_chunksize = self._chunksizes[data_variable]
-        if ref_chunksize is not None:
+        if chunks is not None:
+            data_sliced = data_sliced.chunk(chunks)
+        elif ref_chunksize is not None:
             chunks = {stack_dim: ref_chunksize[i] for i, stack_dim in enumerate(self.stack_dims.keys())}
             chunks[self.space_dims[0]] = ref_chunksize[-2]
             chunks[self.space_dims[1]] = ref_chunksize[-1]
@@ -1138,12 +1256,8 @@ class NetCdfXrFile:
                                   data_variable=data_variable, scale_factor=self.scale_factors[data_variable],
                                   offset=self.offsets[data_variable], dtype=self.dtypes[data_variable],
                                   **decoder_kwargs)
-        if data is None:
-            data = data_sliced.to_dataset()
-        else:
-            data = data.merge(data_sliced.to_dataset())
 
-        return data
+        return data_sliced
 
     def write(self, ds, data_variables=None, encoder=None, encoder_kwargs=None, compute=True):
         """
@@ -1319,5 +1433,80 @@ class NetCdfXrFile:
         self.close()
 
 
+def decode_data(data, nodataval=None, scale_factor=1, offset=0, dtype=None, mask=None, out_dtype=None,
+                **kwargs) -> np.ndarray or xr.DataArray:
+    """
+    Decodes raw NetCDF data, i.e. applies the scale factor and offset and sets no data values to NaN. For NumPy
+    arrays, the output array is allocated once while applying the scale factor and all remaining operations are done
+    in-place, so that no intermediate arrays are created. The function can be passed as a `decoder` to the NetCDF
+    readers.
+
+    Parameters
+    ----------
+    data : np.ndarray or xr.DataArray
+        Raw data.
+    nodataval : number, optional
+        No data value of the data. Defaults to None, i.e. no pixels are set to NaN.
+    scale_factor : number, optional
+        Scale factor of the data. Defaults to 1.
+    offset : number, optional
+        Offset of the data. Defaults to 0.
+    dtype : str or np.dtype, optional
+        Data type of the raw data. It is not used for decoding, since the decoded data type is always floating point
+        (float32 for 8- and 16-bit integers and float32 data, else float64).
+    mask : np.ndarray, optional
+        Boolean mask being true for additional pixels to set to NaN, e.g. pixels outside a tile's mask. It is
+        broadcast along the leading dimensions of `data` and applied in the same pass as the no data values.
+        Defaults to None.
+    out_dtype : str or np.dtype, optional
+        Floating point data type of the decoded data, e.g. 'float16' to halve the memory footprint of decoded 16-bit
+        integers. The arithmetic is still done in the default precision and only the result is stored with the
+        narrower type. Defaults to None, i.e. the default floating point data type is used.
+
+    Returns
+    -------
+    decoded_data : np.ndarray or xr.DataArray
+        Decoded data.
+
+    """
+    if out_dtype is not None and not np.issubdtype(out_dtype, np.floating):
+        err_msg = f"Output data type '{out_dtype}' is not a floating point data type."
+        raise ValueError(err_msg)
+
+    if isinstance(data, xr.DataArray):
+        if isinstance(data.data, np.ndarray):
+            return data.copy(data=decode_data(data.data, nodataval=nodataval, scale_factor=scale_factor,
+                                              offset=offset, mask=mask, out_dtype=out_dtype))
+        # lazy data is decoded with an expression evaluated chunk by chunk
+        decoded_data = data
+        if scale_factor is not None and scale_factor != 1:
+            decoded_data = decoded_data * scale_factor
+        if offset is not None and offset != 0:
+            decoded_data = decoded_data + offset
+        decoded_data = decoded_data.where(data != nodataval) if nodataval is not None else decoded_data
+        decoded_data = decoded_data.where(~mask) if mask is not None else decoded_data
+        return decoded_data.astype(out_dtype) if out_dtype is not None else decoded_data
+
+    float_dtype = np.result_type(data.dtype, np.float32)
+    out_dtype = float_dtype if out_dtype is None else np.dtype(out_dtype)
+    nodata_mask = data == nodataval if nodataval is not None else None
+    if mask is not None:
+        # both masks are combined, so that NaN is assigned in one pass over the output
+        nodata_mask = np.broadcast_to(mask, data.shape) if nodata_mask is None else \
+            np.logical_or(nodata_mask, mask, out=nodata_mask)
+    if scale_factor is not None and scale_factor != 1:
+        # the conversion and the scaling are done in one pass, the result is cast to the output type while writing
+        decoded_data = np.empty(data.shape, dtype=out_dtype)
+        np.multiply(data, scale_factor, out=decoded_data, dtype=float_dtype, casting='unsafe')
+    else:
+        decoded_data = data.astype(out_dtype)
+    if offset is not None and offset != 0:
+        np.add(decoded_data, offset, out=decoded_data, dtype=float_dtype, casting='unsafe')
+    if nodata_mask is not None:
+        np.copyto(decoded_data, np.nan, where=nodata_mask)
+
+    return decoded_data
+
+
 if __name__ == '__main__':
     pass
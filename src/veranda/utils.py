@@ -1,11 +1,20 @@
+import inspect
+import weakref
+import numpy as np
+import pandas as pd
+
+# maps functions to the results of `accepts_arg`, entries are dropped as soon as their function is garbage collected
+_ACCEPTED_ARGS_CACHE = weakref.WeakKeyDictionary()
+
 
 def to_list(arg) -> list:
     """
-    Converts non-iterable object to a list. If `arg` is already a list or tuple the same object is returned.
+    Converts non-iterable object to a list. If `arg` is already a list or tuple the same object is returned. NumPy
+    arrays and pandas indexes/series are converted to a list of their values.
 
     Parameters
     ----------
-    arg : non-iterable or list or tuple
+    arg : non-iterable or list or tuple or np.ndarray or pd.Index or pd.Series
         Non-iterable, which should be converted to a list.
 
     Returns
@@ -16,9 +25,84 @@ def to_list(arg) -> list:
     """
     if arg is None:
         arg_list = []
-    elif not isinstance(arg, (list, tuple)):
-        arg_list = [arg]
-    else:
+    elif isinstance(arg, (list, tuple)):
         arg_list = arg
+    elif isinstance(arg, (np.ndarray, pd.Index, pd.Series)) and np.ndim(arg) > 0:
+        arg_list = arg.tolist()
+    else:
+        arg_list = [arg]
 
     return arg_list
+
+
+def accepts_arg(func, arg_name) -> bool:
+    """
+    Checks if a function (e.g. an en- or decoder) accepts a keyword argument with the given name. The result is
+    cached per function and argument name as long as the function exists. Functions which cannot be hashed or weakly
+    referenced are inspected on every call.
+
+    Parameters
+    ----------
+    func : callable
+        Function to inspect.
+    arg_name : str
+        Name of the keyword argument.
+
+    Returns
+    -------
+    bool :
+        True if `func` has a parameter named `arg_name`, else False.
+
+    """
+    try:
+        accepted_args = _ACCEPTED_ARGS_CACHE.setdefault(func, dict())
+    except TypeError:
+        accepted_args = dict()
+    if arg_name not in accepted_args:
+        try:
+            accepted_args[arg_name] = arg_name in inspect.signature(func).parameters
+        except (TypeError, ValueError):
+            accepted_args[arg_name] = False
+
+    return accepted_args[arg_name]
+
+
+def accepts_out_arg(func) -> bool:
+    """
+    Checks if a function (e.g. an en- or decoder) accepts an `out` keyword argument, i.e. if it can write its
+    results into a pre-allocated array. The result is cached per function.
+
+    Parameters
+    ----------
+    func : callable
+        Function to inspect.
+
+    Returns
+    -------
+    bool :
+        True if `func` has a parameter named 'out', else False.
+
+    """
+    return accepts_arg(func, 'out')
+
+
+def attrs_equal(attrs, other_attrs) -> bool:
+    """
+    Checks if two dictionaries of metadata attributes are equal, also when attribute values are NumPy arrays.
+
+    Parameters
+    ----------
+    attrs : dict
+        Metadata attributes.
+    other_attrs : dict
+        Metadata attributes to compare with.
+
+    Returns
+    -------
+    bool :
+        True if both dictionaries contain the same attributes.
+
+    """
+    if attrs.keys() != other_attrs.keys():
+        return False
+    return all(np.array_equal(attrs[key], other_attrs[key]) for key in attrs.keys())
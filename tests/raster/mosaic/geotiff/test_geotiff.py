@@ -16,6 +16,11 @@ def test_write_read_image_stack(simple_ds, mosaic, tmp_path):
         assert_reader_data(simple_ds, gt_reader, 10, 12, 5, 5, [band_name],
                            bands=[1], band_names=[band_name])
 
+    with GeoTiffReader.from_filepaths(filepaths) as gt_reader:
+        gt_reader.read(bands=[1], band_names=[band_name], dtype='float32')
+        assert gt_reader.data_view[band_name].dtype == np.float32
+        np.testing.assert_equal(gt_reader.data_view[band_name].data, simple_ds[band_name].data.astype(np.float32))
+
 
 def test_read_decoded_image_stack(complex_ds, mosaic, tmp_path):
     band_names = [data_var for data_var in complex_ds.data_vars]
@@ -45,6 +50,34 @@ def test_read_decoded_image_stack(complex_ds, mosaic, tmp_path):
                            bands=[1], band_names=band_names[:1], auto_decode=True)
 
 
+def test_read_lazily(simple_ds, mosaic, tmp_path):
+    band_name = [data_var for data_var in simple_ds.data_vars][0]
+
+    with GeoTiffWriter(mosaic, data=simple_ds, stack_dimension='time', dirpath=tmp_path,
+                       fn_pattern='{time}.tif', fn_formatter={'time': lambda x: x.strftime('%Y%m%d')}) as gt_writer:
+        gt_writer.export()
+        filepaths = list(gt_writer.file_register['filepath'])
+
+    with GeoTiffReader.from_filepaths(filepaths) as gt_reader:
+        gt_reader.read(bands=[1], band_names=[band_name], compute=False)
+        assert gt_reader.data_view[band_name].chunks is not None
+        assert_reader_data(simple_ds, gt_reader, 10, 12, 5, 5, [band_name],
+                           bands=[1], band_names=[band_name], compute=False)
+
+
+def test_iter_px_windows(simple_ds, mosaic):
+    band_name = [data_var for data_var in simple_ds.data_vars][0]
+
+    gt_writer = GeoTiffWriter(mosaic, data=simple_ds, stack_dimension='time')
+    n_windows = 0
+    for (row, col, height, width), gt_writer_win in gt_writer.iter_px_windows((20, 25), overlap=2):
+        np.testing.assert_equal(gt_writer_win.data_view[band_name].data,
+                                simple_ds[band_name].data[:, row:row + height, col:col + width])
+        n_windows += 1
+
+    assert n_windows == 9
+
+
 def test_write_after_selections(simple_ds, mosaic, tmp_path):
     band_name = [data_var for data_var in simple_ds.data_vars][0]
     layer_ids = [0, 5, 9]
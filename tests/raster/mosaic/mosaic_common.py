@@ -43,6 +43,15 @@ def mosaic(tile):
     return MosaicGeometry.from_tile_list([tile])
 
 
+@pytest.fixture
+def tiled_mosaic(xsize, ysize):
+    tile_ysize, tile_xsize = ysize // 2, xsize // 2
+    tiles = [Tile(tile_ysize, tile_xsize, SpatialRef(4326), geotrans=(j * tile_xsize, 1, 0, -i * tile_ysize, 0, -1),
+                  name=str(2 * i + j))
+             for i in range(2) for j in range(2)]
+    return MosaicGeometry.from_tile_list(tiles)
+
+
 @pytest.fixture
 def simple_ds(tile):
     num_files = 50
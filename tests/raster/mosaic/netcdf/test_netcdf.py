@@ -1,7 +1,10 @@
 import gc
 import os
+import copy
+import netCDF4
+import dask.array as da
 from mosaic_common import *
-from veranda.raster.mosaic.netcdf import NetCdfReader, NetCdfWriter
+from veranda.raster.mosaic.netcdf import NetCdfReader, NetCdfWriter, _bit_round
 
 
 @pytest.fixture
@@ -54,6 +57,24 @@ def test_read_decoded_image_stack(complex_ds, mosaic, tmp_path, clean_garbage):
                            data_variables=data_var_names[:1], auto_decode=True)
 
 
+def test_read_as_ndarray(simple_ds, mosaic, tmp_path, clean_garbage):
+    data_var_name = [data_var for data_var in simple_ds.data_vars][0]
+    dst_filepath = os.path.join(tmp_path, "test.nc")
+
+    with NetCdfWriter.from_data(simple_ds, dst_filepath, mosaic=mosaic, stack_dimension='time') as nc_writer:
+        nc_writer.export()
+
+    with NetCdfReader.from_filepaths([dst_filepath]) as nc_reader:
+        data, coords = nc_reader.read(data_variables=[data_var_name], return_as='ndarray')
+        assert nc_reader.data_view is None
+        nc_reader.read(data_variables=[data_var_name])
+        ref_ds = nc_reader.data_view
+        np.testing.assert_array_equal(data[data_var_name], ref_ds[data_var_name].data)
+        y_dim, x_dim = ref_ds[data_var_name].dims[-2:]
+        np.testing.assert_array_equal(coords[y_dim], ref_ds[y_dim].data)
+        np.testing.assert_array_equal(coords[x_dim], ref_ds[x_dim].data)
+
+
 def test_write_selections(simple_ds, mosaic, tmp_path, clean_garbage):
     data_var_name = [data_var for data_var in simple_ds.data_vars][0]
     dst_filepath = os.path.join(tmp_path, "test.nc")
@@ -74,3 +95,109 @@ def test_write_selections(simple_ds, mosaic, tmp_path, clean_garbage):
                            data_variables=[data_var_name])
         assert_reader_data(simple_ds, nc_reader, 45, 55, 5, 5, [data_var_name],
                            data_variables=[data_var_name])
+
+
+def create_tiled_writer(data, mosaic, dirpath, **kwargs):
+    tile_ids = [tile.name for tile in mosaic.tiles]
+    file_register = pd.DataFrame({'tile_id': tile_ids,
+                                  'filepath': [os.path.join(dirpath, f"{tile_id}.nc") for tile_id in tile_ids]})
+    return NetCdfWriter.from_xarray(data, file_register, mosaic=mosaic, stack_dimension='time', **kwargs)
+
+
+def test_deepcopy_of_selection(simple_ds, mosaic, tmp_path, clean_garbage):
+    data_var_name = [data_var for data_var in simple_ds.data_vars][0]
+    dst_filepath = os.path.join(tmp_path, "test.nc")
+    ref_data = simple_ds[data_var_name].data.copy()
+
+    with NetCdfWriter.from_data(simple_ds, dst_filepath, mosaic=mosaic, stack_dimension='time') as nc_writer:
+        nc_writer_sel = nc_writer.select_px_window(0, 0, 10, 10, inplace=False)
+        nc_writer_copy = copy.deepcopy(nc_writer_sel)
+        nc_writer_copy.data_view[data_var_name].values[...] = 0
+        np.testing.assert_array_equal(nc_writer.data_view[data_var_name].data, ref_data)
+        np.testing.assert_array_equal(nc_writer_sel.data_view[data_var_name].data, ref_data[:, :10, :10])
+
+
+def test_write_with_max_open_files(simple_ds, tiled_mosaic, tmp_path, clean_garbage):
+    data_var_name = [data_var for data_var in simple_ds.data_vars][0]
+
+    with create_tiled_writer(simple_ds, tiled_mosaic, tmp_path, max_open_files=1) as nc_writer:
+        # the second window requires the files of the right tiles to be reopened
+        write_pixel_window(nc_writer, 0, 0, 50, 45)
+        write_pixel_window(nc_writer, 0, 45, 50, 15)
+        filepaths = list(set(nc_writer.file_register['filepath']))
+
+    with NetCdfReader.from_filepaths(filepaths) as nc_reader:
+        nc_reader.read(data_variables=[data_var_name])
+        ds = nc_reader.data_view
+        assert ds.sizes['time'] == simple_ds.sizes['time']
+        np.testing.assert_array_equal(ds['time'].data, simple_ds['time'].data)
+        np.testing.assert_array_equal(ds[data_var_name].data, simple_ds[data_var_name].data)
+
+
+def test_write_with_threads(simple_ds, tiled_mosaic, tmp_path, clean_garbage):
+    data_var_name = [data_var for data_var in simple_ds.data_vars][0]
+    data = {}
+    for n_threads in [1, 2]:
+        dirpath = tmp_path / f"threads_{n_threads}"
+        dirpath.mkdir()
+        with create_tiled_writer(simple_ds, tiled_mosaic, dirpath) as nc_writer:
+            nc_writer.export(use_mosaic=True, n_threads=n_threads)
+            filepaths = list(set(nc_writer.file_register['filepath']))
+
+        assert len(filepaths) == len(tiled_mosaic.tiles)
+        with NetCdfReader.from_filepaths(filepaths) as nc_reader:
+            nc_reader.read(data_variables=[data_var_name])
+            data[n_threads] = nc_reader.data_view
+
+    np.testing.assert_array_equal(data[2]['time'].data, data[1]['time'].data)
+    np.testing.assert_array_equal(data[2][data_var_name].data, data[1][data_var_name].data)
+    np.testing.assert_array_equal(data[2][data_var_name].data, simple_ds[data_var_name].data)
+
+
+def test_write_fixed_stack_lengths(simple_ds, mosaic, tmp_path, clean_garbage):
+    data_var_name = [data_var for data_var in simple_ds.data_vars][0]
+    dst_filepath = os.path.join(tmp_path, "test.nc")
+    n_layers = simple_ds.sizes['time']
+
+    with NetCdfWriter.from_data(simple_ds, dst_filepath, mosaic=mosaic, stack_dimension='time') as nc_writer:
+        nc_writer.export(unlimited_dims='time', fixed_stack_lengths={'time': n_layers})
+
+    with netCDF4.Dataset(dst_filepath) as nc_ds:
+        assert not nc_ds.dimensions['time'].isunlimited()
+        assert nc_ds.dimensions['time'].size == n_layers
+
+    with NetCdfReader.from_filepaths([dst_filepath]) as nc_reader:
+        assert_reader_data(simple_ds, nc_reader, 0, 0, 10, 10, [data_var_name],
+                           data_variables=[data_var_name])
+
+
+def test_read_with_threads(simple_ds, tiled_mosaic, tmp_path, clean_garbage):
+    data_var_name = [data_var for data_var in simple_ds.data_vars][0]
+
+    with create_tiled_writer(simple_ds, tiled_mosaic, tmp_path) as nc_writer:
+        nc_writer.export(use_mosaic=True)
+        filepaths = list(set(nc_writer.file_register['filepath']))
+
+    with NetCdfReader.from_filepaths(filepaths) as nc_reader:
+        nc_reader.read(data_variables=[data_var_name])
+        ref_ds = nc_reader.data_view
+        nc_reader.read(data_variables=[data_var_name], n_threads=2)
+        ds = nc_reader.data_view
+
+    np.testing.assert_array_equal(ds['time'].data, ref_ds['time'].data)
+    np.testing.assert_array_equal(ds[data_var_name].data, ref_ds[data_var_name].data)
+
+
+def test_bit_round():
+    # 1.0 with its lowest mantissa bits set to 01 (rounded down), 10 (tie, rounded down to even), 11 (rounded up),
+    # and 110 (tie, rounded up to even)
+    bits = np.array([0x3F800001, 0x3F800002, 0x3F800003, 0x3F800006], dtype=np.uint32)
+    ref_bits = np.array([0x3F800000, 0x3F800000, 0x3F800004, 0x3F800008], dtype=np.uint32)
+    np.testing.assert_array_equal(_bit_round(bits.view(np.float32), 2).view(np.uint32), ref_bits)
+
+    non_finite = np.array([np.nan, np.inf, -np.inf], dtype=np.float32)
+    np.testing.assert_array_equal(_bit_round(non_finite, 2), non_finite)
+
+    lazy_rounded = _bit_round(da.from_array(bits.view(np.float32), chunks=2), 2)
+    assert isinstance(lazy_rounded, da.Array)
+    np.testing.assert_array_equal(lazy_rounded.compute().view(np.uint32), ref_bits)
@@ -2,10 +2,12 @@ import os
 import pytest
 import numpy as np
 from osgeo import gdal
+from pathlib import Path
 from tempfile import mkdtemp
 from zipfile import ZipFile
 
 from veranda.raster.native.geotiff import GeoTiffFile
+from veranda.raster.native.geotiff import decode_band_data
 
 
 @pytest.fixture
@@ -25,6 +27,86 @@ def test_read_write_one_band(filepath):
     np.testing.assert_array_equal(ds[1], data[0, :, :])
 
 
+def test_read_write_pathlike(filepath):
+    data = np.ones((1, 100, 100), dtype=np.float32)
+
+    with GeoTiffFile(Path(filepath), mode='w') as src:
+        src.write(data)
+
+    with GeoTiffFile(Path(filepath)) as src:
+        ds = src.read()
+
+    np.testing.assert_array_equal(ds[1], data[0, :, :])
+
+
+def test_read_write_multi_threaded(filepath):
+    data = np.random.randn(1, 1024, 1024).astype(np.float32)
+
+    with GeoTiffFile(filepath, mode='w', dtypes='float32', blocksize=(256, 256), n_threads=2) as src:
+        src.write(data)
+
+    with GeoTiffFile(filepath, n_threads='ALL_CPUS') as src:
+        ds = src.read()
+
+    np.testing.assert_array_equal(ds[1], data[0, :, :])
+
+
+def test_read_block_aligned(filepath):
+    data = np.random.randn(2, 100, 100).astype(np.float32)
+
+    with GeoTiffFile(filepath, mode='w', n_bands=2, dtypes='float32', blocksize=(32, 32)) as src:
+        src.write(data)
+
+    with GeoTiffFile(filepath) as src:
+        ds = src.read(row=10, col=40, n_rows=50, n_cols=30, align_to_blocks=True)
+        ds_band = src.read(row=10, col=40, n_rows=50, n_cols=30, bands=2, align_to_blocks=True)
+
+    np.testing.assert_array_equal(ds[1], data[0, 10:60, 40:70])
+    np.testing.assert_array_equal(ds[2], data[1, 10:60, 40:70])
+    np.testing.assert_array_equal(ds_band[2], data[1, 10:60, 40:70])
+
+
+def test_iter_block_windows(filepath):
+    data = np.random.randn(1, 100, 70).astype(np.float32)
+
+    with GeoTiffFile(filepath, mode='w', dtypes='float32', blocksize=(32, 32)) as src:
+        src.write(data)
+
+    with GeoTiffFile(filepath) as src:
+        for order in ['hilbert', 'morton', 'row']:
+            data_read = np.zeros_like(data[0])
+            windows = list(src.iter_block_windows(order=order))
+            for row, col, n_rows, n_cols in windows:
+                data_read[row:row + n_rows, col:col + n_cols] = src.read(row, col, n_rows, n_cols)[1]
+            assert len(windows) == 12
+            np.testing.assert_array_equal(data_read, data[0])
+
+
+def test_read_write_sub_byte(filepath):
+    data = np.random.randint(0, 16, size=(1, 100, 100), dtype=np.uint8)
+
+    with GeoTiffFile(filepath, mode='w', nbits=4, nodatavals=15) as src:
+        src.write(data)
+
+    with GeoTiffFile(filepath) as src:
+        assert src.nbits == 4
+        ds = src.read()
+
+    np.testing.assert_array_equal(ds[1], data[0, :, :])
+
+
+def test_update_band_metadata(filepath):
+    data = np.ones((2, 100, 100), dtype=np.float32)
+
+    with GeoTiffFile(filepath, mode='w', n_bands=2) as src:
+        src.write(data)
+        src.update_band_metadata(scale_factors={2: 2}, offsets=1)
+
+    with GeoTiffFile(filepath) as src:
+        assert src.scale_factors == [1, 2]
+        assert src.offsets == [1, 1]
+
+
 def test_read_write_multi_band(filepath):
     data = np.ones((5, 100, 100), dtype=np.float32)
 
@@ -58,6 +140,33 @@ def test_auto_decode_multi_band(filepath):
         np.testing.assert_array_equal(ds[5], data[4, :, :])
 
 
+def test_decode_band_data():
+    data = np.array([[1, 2], [-9999, 4]], dtype=np.int16)
+    data_ref = np.array([[5, 7], [np.nan, 11]])
+
+    data_dec = decode_band_data(data, nodataval=-9999, scale_factor=2, offset=3)
+
+    np.testing.assert_array_equal(data_dec, data_ref)
+    assert data.dtype == np.int16
+
+
+def test_read_with_scaling_decoder(filepath):
+    data = np.arange(2 * 10 * 10, dtype=np.int16).reshape((2, 10, 10))
+    with GeoTiffFile(filepath, mode='w', n_bands=2) as src:
+        src.write(data)
+
+    def scale(data, out=None, **kwargs):
+        return np.multiply(data, 0.5, out=out)
+
+    with GeoTiffFile(filepath) as src:
+        ds = src.read(decoder=scale)
+        np.testing.assert_array_equal(ds[1], data[0, :, :] * 0.5)
+        np.testing.assert_array_equal(ds[2], data[1, :, :] * 0.5)
+        out = {1: np.zeros((10, 10), dtype=np.float32)}
+        src.read(bands=1, decoder=scale, out=out)
+        np.testing.assert_array_equal(out[1], data[0, :, :] * 0.5)
+
+
 def test_ignore_decoding_multiband(filepath):
     data = np.ones((5, 100, 100), dtype=np.float32)
     scale_factors = {1: 1, 2: 2, 3: 1, 4: 1, 5: 3}
@@ -1,5 +1,6 @@
+import netCDF4
 from netcdf_common import *
-from veranda.raster.native.netcdf import NetCdf4File
+from veranda.raster.native.netcdf import NetCdf4File, decode_data
 
 
 def test_read_write(filepath, three_var_ds):
@@ -36,6 +37,24 @@ def test_ignore_auto_decoding(filepath, complex_three_var_ds):
         np.testing.assert_array_equal(ds['azi'][:], complex_three_var_ds['azi'][:])
 
 
+def test_decode_data_decoder(filepath, complex_three_var_ds):
+    with NetCdf4File(filepath, mode='w') as nc:
+        nc.write(complex_three_var_ds)
+
+    with NetCdf4File(filepath, mode='r', auto_decode=False) as nc:
+        ds = nc.read(decoder=decode_data)
+        np.testing.assert_array_equal(ds['sig'][:], complex_three_var_ds['sig'][:] * 2 + 3)
+        np.testing.assert_array_equal(ds['inc'][:], complex_three_var_ds['inc'][:] * 2)
+        np.testing.assert_array_equal(ds['azi'][:], complex_three_var_ds['azi'][:])
+
+
+def test_decode_lazy_data_without_scale_factor():
+    data = xr.DataArray(np.array([[1, 2], [-9999, 4]], dtype=np.int16), dims=['y', 'x']).chunk(1)
+    decoded_data = decode_data(data, nodataval=-9999, scale_factor=None, offset=None)
+    assert decoded_data.chunks is not None
+    np.testing.assert_array_equal(decoded_data.values, [[1, 2], [np.nan, 4]])
+
+
 def test_append_to_existing_netcdf(filepath, simple_ds):
     with NetCdf4File(filepath, mode='w', stack_dims={'time': None}) as nc:
         nc.write(simple_ds)
@@ -50,6 +69,62 @@ def test_append_to_existing_netcdf(filepath, simple_ds):
             ds['sig'][:], np.repeat(simple_ds['sig'][:], 2, axis=0))
 
 
+def test_write_raw(filepath, simple_ds):
+    with NetCdf4File(filepath, mode='w', data_variables=list(simple_ds.data_vars)) as nc:
+        nc.write(simple_ds)
+
+    data = np.zeros(simple_ds['sig'].shape[:1] + (2, 3), dtype=simple_ds['sig'].dtype)
+    with NetCdf4File(filepath, mode='a') as nc:
+        nc.write_raw('sig', data, row=1, col=2)
+
+    with NetCdf4File(filepath) as nc:
+        ds = nc.read()
+        ref_data = simple_ds['sig'].data.copy()
+        ref_data[:, 1:3, 2:5] = 0
+        np.testing.assert_array_equal(ds['sig'][:], ref_data)
+
+
+def test_write_fewer_layers_than_fixed_length(filepath, simple_ds):
+    n_layers = simple_ds.sizes['time']
+    with NetCdf4File(filepath, mode='w', data_variables=list(simple_ds.data_vars),
+                     stack_dims={'time': n_layers + 5}) as nc:
+        nc.write(simple_ds)
+
+    with netCDF4.Dataset(filepath) as nc_ds:
+        assert not nc_ds.dimensions['time'].isunlimited()
+        assert nc_ds.dimensions['time'].size == n_layers + 5
+        np.testing.assert_array_equal(nc_ds['sig'][:n_layers], simple_ds['sig'].data)
+
+
+def test_append_layers_to_fixed_length(filepath, simple_ds):
+    n_layers = simple_ds.sizes['time']
+    ds = simple_ds.assign(sig=simple_ds['sig'] * np.arange(n_layers, dtype=np.float32)[:, None, None])
+    with NetCdf4File(filepath, mode='w', data_variables=list(ds.data_vars), stack_dims={'time': n_layers}) as nc:
+        nc.write(ds.isel(time=slice(0, n_layers // 2)))
+
+    with NetCdf4File(filepath, mode='a') as nc:
+        nc.write(ds.isel(time=slice(n_layers // 2, None)))
+
+    with NetCdf4File(filepath) as nc:
+        ds_read = nc.read()
+        np.testing.assert_array_equal(ds_read['time'].data, ds['time'].data)
+        np.testing.assert_array_equal(ds_read['sig'][:], ds['sig'][:])
+
+
+def test_write_raw_to_fixed_length(filepath, simple_ds):
+    n_layers = simple_ds.sizes['time']
+    with NetCdf4File(filepath, mode='w', data_variables=list(simple_ds.data_vars),
+                     stack_dims={'time': n_layers + 5}) as nc:
+        nc.write(simple_ds)
+        data = np.zeros((n_layers, 2, 3), dtype=simple_ds['sig'].dtype)
+        nc.write_raw('sig', data, row=1, col=2)
+
+    with netCDF4.Dataset(filepath) as nc_ds:
+        ref_data = simple_ds['sig'].data.copy()
+        ref_data[:, 1:3, 2:5] = 0
+        np.testing.assert_array_equal(nc_ds['sig'][:n_layers], ref_data)
+
+
 def test_setting_chunksizes(filepath, simple_ds):
     chunksizes = (100, 10, 10)
     with NetCdf4File(filepath, mode='w', data_variables=list(simple_ds.data_vars), chunksizes=chunksizes) as nc:
@@ -20,7 +20,7 @@ def test_gdal_translate(in_filepath, out_filepath):
         gt_file.write(np.ones((1, 100, 100)))
 
     options = {'-of': 'GTiff', '-co': 'COMPRESS=LZW',
-               '-mo': ['parent_data_file="%s"' % os.path.basename(in_filepath)], '-outsize': ('50%', '50%'),
+               '-mo': ['parent_data_file=%s' % os.path.basename(in_filepath)], '-outsize': ('50%', '50%'),
                '-ot': 'Byte'}
     succeed, output = call_gdal_util("gdal_translate", src_files=in_filepath, dst_file=out_filepath,
                                      options=options)